@@ -309,6 +309,10 @@ class Text(PglBaseObject):
         self.__bgcc = ""
         self.__length = 0
         self.__font = None
+        # The rendered text: the cells of each line or, with a font, a Sprite. It is
+        # built on demand and reset when the text, the colors or the style change.
+        self.__rendered = None
+        self.__style = ""
         if type(text) is str:
             self.__text = text
             self.__length = self.__length = Console.instance().length(self.__text)
@@ -331,8 +335,7 @@ class Text(PglBaseObject):
                 "pygamelib.gfx.core.Color object."
             )
         self.__build_color_cache()
-        self.style = style
-        """The style attribute sets the style of the text. It needs to be a str."""
+        self.__style = style
         self.parent = None
         """This object's parent. It needs to be a
         :class:`~pygamelib.board_items.BoardItem`."""
@@ -436,8 +439,26 @@ class Text(PglBaseObject):
         elif isinstance(value, Text):
             self.__text = value.text
         self.__length = self.__length = Console.instance().length(self.__text)
+        self.__rendered = None
         self.notify(self, "pygamelib.base.Text.text:changed", self.__text)
 
+    @property
+    def style(self):
+        """The style attribute sets the style of the text. It needs to be a str.
+
+        .. versionchanged:: 1.4.0
+           It is now a property. When the style is changed, the observers are notified
+           of the change with the :boldblue:`pygamelib.base.Text.style:changed` event.
+           The new style is passed as the `value` parameter.
+        """
+        return self.__style
+
+    @style.setter
+    def style(self, value):
+        self.__style = value
+        self.__rendered = None
+        self.notify(self, "pygamelib.base.Text.style:changed", value)
+
     @property
     def bg_color(self):
         """The bg_color attribute sets the background color. It needs to be a
@@ -506,6 +527,7 @@ class Text(PglBaseObject):
         self.__build_color_cache()
 
     def __build_color_cache(self):
+        self.__rendered = None
         t = Console.instance()
         if self.bg_color is not None and pgl_isinstance(
             self.bg_color, "pygamelib.gfx.core.Color"
@@ -562,6 +584,21 @@ class Text(PglBaseObject):
                 for _ in range(self.__font.vertical_spacing):
                     print()
 
+    @property
+    def font(self):
+        """The font in which the text is displayed (or None for the terminal's font).
+
+        .. versionadded:: 1.4.0
+
+        .. Note:: This is a read only value.
+
+        Example::
+
+            if my_text.font is not None:
+                print(f"Text is displayed with font {my_text.font.name}")
+        """
+        return self.__font
+
     @property
     def length(self):
         """Return the true length of the text.
@@ -585,17 +622,56 @@ class Text(PglBaseObject):
         if self.__font is None:
             return self.__length
         else:
-            max_length = 0
-            # Squash the dot notation
-            glyph = self.__font.glyph
-            for line in self.text.splitlines():
-                length = 0
-                for char in line:
-                    font_glyph = glyph(char)
-                    length += font_glyph.size[0] + self.__font.horizontal_spacing
-                if length > max_length:
-                    max_length = length
-            return max_length
+            return self.__render().size[0]
+
+    def __render(self):
+        # Build (if needed) and return the rendered text. Without a font, it is a list
+        # of lines made of the cells strings. With a font, it is a Sprite that composes
+        # all the glyphs, with transparent spacing.
+        if self.__rendered is not None:
+            return self.__rendered
+        if self.__font is None:
+            prefix = "".join([self.__bgcc, self.__fgcc, self.style])
+            self.__rendered = [
+                [f"{prefix}{char}\x1b[0m" for char in line]
+                for line in self.text.splitlines()
+            ]
+            return self.__rendered
+        # For circle dependencies issue core is only imported here.
+        from pygamelib.gfx import core
+
+        font = self.__font
+        row_incr = font.height + font.vertical_spacing
+        fg_color = bg_color = None
+        if font.colorable:
+            fg_color = self.fg_color
+            bg_color = self.bg_color
+        placements = []
+        width = 0
+        height = 0
+        row_idx = 0
+        for line in self.text.splitlines():
+            idx = 0
+            for char in line:
+                font_glyph = font.glyph(char, fg_color, bg_color)
+                placements.append((font_glyph, row_idx, idx))
+                height = max(height, row_idx + font_glyph.size[1])
+                idx += font_glyph.size[0] + font.horizontal_spacing
+            width = max(width, idx)
+            row_idx += row_incr
+        null_sprixel = core.Sprixel()
+        sprixels = [[null_sprixel] * width for _ in range(0, height)]
+        for font_glyph, row_idx, idx in placements:
+            mask = font_glyph.opacity_mask
+            for r in range(0, font_glyph.size[1]):
+                line = font_glyph.sprixel(r)
+                for c in range(0, font_glyph.size[0]):
+                    if mask[r, c]:
+                        sprixels[row_idx + r][idx + c] = line[c]
+        self.__rendered = core.Sprite(
+            sprixels=sprixels, default_sprixel=null_sprixel, size=[0, 0]
+        )
+        return self.__rendered
 
     # Text is a special case in the buffer rendering system and I know special cases are
     # bad but it works well... Text is automatically converted into a Sprite during
@@ -607,6 +683,10 @@ class Text(PglBaseObject):
 
         .. versionadded:: 1.3.0
 
+        .. versionchanged:: 1.4.0
+           The rendered text (the cells or, with a font, the composed glyphs) is cached
+           until the text, the colors or the style change.
+
         This method is automatically called by :func:`pygamelib.engine.Screen.render`.
 
         :param buffer: A screen buffer to render the item into.
@@ -621,77 +701,22 @@ class Text(PglBaseObject):
         :type width: int
 
         """
-        row_idx = 0
-        # Here we have some duplicate code. The reason is optimization.
-        # If we were to test if the font is set or not in the loop, we would execute
-        # as many comparisons as there are characters in the text for that purpose.
-        # That test can be done once and for all at the expense of writing twice the
-        # rendering code.
-        # It is a small counterpart considering the increase in performances.
-        # As an example, if you have about a 100 characters on screen (for the different
-        # labels), this solution will do 1 test at the beginning + 2 tests (boundaries)
-        # per loop + the character rendering or: 201 "if" + the rendering operations of
-        # the glyph.
-        # Putting everything in the same loop, would add one more test to the loop so:
-        # 3 tests per loop + the character rendering or 300 "if" + the glyph rendering.
-        # This would add 100 tests *every frame*.
-        if self.__font is None:
-            for line in self.text.splitlines():
-                idx = 0
-                # FIXME: this can be optimized by switching the for to a
-                # FIXME: range(0, min(column + idx, buffer_width)) <- not idx but len()
-
-                for char in line:
-                    if column + idx >= buffer_width:
-                        break
-                    # FIXME: At minimum this test should be done after row_idx += 1
-                    # FIXME: but it can be optimized the same way than the other for.
-                    if row + row_idx >= buffer_height:
-                        break
-                    buffer[row + row_idx][column + idx] = "".join(
-                        [self.__bgcc, self.__fgcc, self.style, char, "\x1b[0m"]
-                    )
-                    idx += 1
-                row_idx += 1
-        else:
-            row_incr = self.__font.height + self.__font.vertical_spacing
-            font_horizontal_spacing = self.__font.horizontal_spacing
-            # Squash the dot notation
-            glyph = self.__font.glyph
-            colors = {
-                "fg_color": None,
-                "bg_color": None,
-            }
-            if self.__font.colorable:
-                if self.fg_color is not None:
-                    colors["fg_color"] = self.fg_color
-                if self.bg_color is not None:
-                    colors["bg_color"] = self.bg_color
-            # t = Console.instance()
-            # bgcc = t.on_color_rgb(self.bg_color.r, self.bg_color.g, self.bg_color.b)
-            # filler = f"{bgcc} \x1b[0m"
-            for line in self.text.splitlines():
-                idx = 0
-                for char in line:
-                    # NOTE: We don't need to check for the boundaries since we are
-                    # actually rendering a sprite and Sprite.render_to_buffer already
-                    # bind its rendering area to the available space.
-                    # if column + idx >= buffer_width:
-                    #     break
-                    # if row + row_idx >= buffer_height:
-                    #     break
-                    font_glyph = glyph(char, colors["fg_color"], colors["bg_color"])
-                    font_glyph.render_to_buffer(
-                        buffer, row + row_idx, column + idx, buffer_height, buffer_width
-                    )
-                    # This code is lacking the rows
-                    # for i in range(
-                    #     font_glyph.size[0], font_glyph.size[0] +
-                    #       font_horizontal_spacing
-                    # ):
-                    #     buffer[row + row_idx][column + idx + i] = filler
-                    idx += font_glyph.size[0] + font_horizontal_spacing
-                row_idx += row_incr
+        # The rendered text is cached (see __render()): the cells or the glyphs are
+        # only built again when the text, the colors or the style change.
+        rendered = self.__render()
+        if self.__font is not None:
+            # With a font, the text is a Sprite that composes all the glyphs.
+            rendered.render_to_buffer(buffer, row, column, buffer_height, buffer_width)
+            return
+        width = buffer_width - column
+        if width <= 0:
+            return
+        for row_idx in range(0, min(len(rendered), buffer_height - row)):
+            line = rendered[row_idx]
+            if len(line) > width:
+                line = line[0:width]
+            if len(line) > 0:
+                buffer[row + row_idx][column : column + len(line)] = line
 
     @staticmethod
     def warn(message):
@@ -164,14 +164,15 @@ class BoardItem(base.PglBaseObject):
         self.parent = None
         if parent is not None:
             self.parent = parent
-        self.sprixel = core.Sprixel("*")
         if sprixel is not None:
-            self.sprixel = sprixel
+            self._sprixel = sprixel
+        else:
+            self._sprixel = core.Sprixel("*")
+            if model is not None:
+                self._sprixel.model = model
+            if self._sprixel.bg_color is None:
+                self._sprixel.is_bg_transparent = True
         self._size = [1, 1]
-        if model is not None and sprixel is None:
-            self.sprixel.model = model
-        if self.sprixel.bg_color is None and sprixel is None:
-            self.sprixel.is_bg_transparent = True
         self.value = value
         self._inventory_space = inventory_space
         self.__heading = base.Vector2D(0, 0)
@@ -205,8 +206,8 @@ class BoardItem(base.PglBaseObject):
         # self.parent cannot really be serialized (or more accurately I don't really
         # want to do it properly)
         ret_data["object"] = str(self.__class__)
-        if self.sprixel is not None:
-            ret_data["sprixel"] = self.sprixel.serialize()
+        if self._sprixel is not None:
+            ret_data["sprixel"] = self._sprixel.serialize()
         if self.animation is not None:
             ret_data["animation"] = self.animation.serialize()
         ret_data["restorable"] = self.restorable()
@@ -337,14 +338,98 @@ class BoardItem(base.PglBaseObject):
         if isinstance(animation, core.Animation):
             animation.parent = self
             self.__animation = animation
+            self.notify(
+                self, "pygamelib.board_items.BoardItem.animation:changed", animation
+            )
+
+    @property
+    def name(self):
+        """A property to get/set the name of the item.
+
+        .. versionchanged:: 1.4.0
+           When the name is changed, the observers are notified with the
+           :boldblue:`pygamelib.board_items.BoardItem.name:changed` event. The new name
+           is passed as the `value` parameter.
+        """
+        return self.__name
+
+    @name.setter
+    def name(self, value):
+        self.__name = value
+        self.notify(self, "pygamelib.board_items.BoardItem.name:changed", value)
+
+    @property
+    def type(self):
+        """A property to get/set the type of the item.
+
+        .. versionchanged:: 1.4.0
+           When the type is changed, the observers are notified with the
+           :boldblue:`pygamelib.board_items.BoardItem.type:changed` event. The new type
+           is passed as the `value` parameter.
+        """
+        return self.__type
+
+    @type.setter
+    def type(self, value):
+        self.__type = value
+        self.notify(self, "pygamelib.board_items.BoardItem.type:changed", value)
+
+    @property
+    def sprixel(self):
+        """A property to get/set the sprixel that represents the item on the Board.
+
+        .. versionchanged:: 1.4.0
+           The item can use a :class:`~pygamelib.gfx.core.SharedSprixel` (like the
+           void cells of a board). A shared sprixel cannot be modified: use
+           :meth:`mutable_sprixel` to get a sprixel that can be modified.
+
+        When the sprixel is replaced, the observers are notified with the
+        :boldblue:`pygamelib.board_items.BoardItem.sprixel:changed` event. The new
+        sprixel is passed as the `value` parameter.
+
+        Example::
+
+            item.sprixel = Sprixel("#", fg_color=Color(255, 0, 0))
+        """
+        return self._sprixel
+
+    @sprixel.setter
+    def sprixel(self, value):
+        self._sprixel = value
+        self.notify(self, "pygamelib.board_items.BoardItem.sprixel:changed", value)
+
+    def mutable_sprixel(self):
+        """Return the sprixel of the item, ready to be modified.
+
+        If the item uses a :class:`~pygamelib.gfx.core.SharedSprixel`, the item gets
+        its own copy of the sprixel first (copy-on-write) and the observers are
+        notified with the :boldblue:`pygamelib.board_items.BoardItem.sprixel:changed`
+        event. This way, modifying the sprixel of one item never modifies the other
+        items.
+
+        .. versionadded:: 1.4.0
+
+        :return: The sprixel of the item.
+        :rtype: :class:`~pygamelib.gfx.core.Sprixel`
+
+        Example::
+
+            board.item(0, 0).mutable_sprixel().bg_color = Color(255, 0, 0)
+        """
+        if type(self._sprixel) is core.SharedSprixel:
+            self._sprixel = self._sprixel.copy()
+            self.notify(
+                self, "pygamelib.board_items.BoardItem.sprixel:changed", self._sprixel
+            )
+        return self._sprixel
 
     @property
     def model(self):
-        return self.sprixel.model
+        return self._sprixel.model
 
     @model.setter
     def model(self, value):
-        self.sprixel.model = value
+        self.mutable_sprixel().model = value
 
     @property
     def inventory_space(self):
@@ -366,8 +451,8 @@ class BoardItem(base.PglBaseObject):
             )
 
     def __str__(self):
-        if self.sprixel is not None:
-            return self.sprixel.__repr__()
+        if self._sprixel is not None:
+            return self._sprixel.__repr__()
         return ""
 
     def __repr__(self):
@@ -630,8 +715,8 @@ class BoardItem(base.PglBaseObject):
         :param width: The total width of the display buffer.
         :type width: int
         """
-        buffer[row][column] = self.sprixel.__repr__()
-        incr = self.sprixel.length
+        buffer[row][column] = self._sprixel.__repr__()
+        incr = self._sprixel.length
         if incr > 1:
             end = min(column + incr, width)
             for idx in range(column + 1, end):
@@ -885,8 +970,6 @@ class BoardComplexItem(BoardItem):
         self, sprite=None, size=None, null_sprixel=None, base_item_type=None, **kwargs
     ):
         self.__kwargs = kwargs
-        self.name = "Board Multi Item"
-        self.type = "multi_item"
         valid_kwargs_opts = [
             "sprixel",
             "model",
@@ -117,6 +117,18 @@ class Algorithm(enum.IntEnum):
     ASTAR = 90000101
 
 
+class ColorDepth(enum.IntEnum):
+    """
+    ColorDepth regroup the constants that describe the number of colors the output can
+    use. It is used by :class:`~pygamelib.engine.Screen`. The value of each constant is
+    its number of colors.
+    """
+
+    COLORS_16 = 16
+    COLORS_256 = 256
+    TRUE_COLOR = 16777216
+
+
 class TextStyle(str, enum.Enum):
     """
     TextStyling is used to format characters or text. It is mostly used by
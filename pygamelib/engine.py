@@ -22,22 +22,562 @@ The Board class is the base class for all levels.
 
 """
 from pygamelib import board_items, base, actuators
-from pygamelib.constants import EngineConstant, EngineMode, State, Permission, Direction
+from pygamelib.constants import (
+    EngineConstant,
+    EngineMode,
+    State,
+    Permission,
+    Direction,
+    ColorDepth,
+)
 from pygamelib.assets import graphics
 from pygamelib.gfx import core, particles
 from pygamelib.functions import pgl_isinstance
 from blessed import Terminal
 import random
 import json
+import os
 import sys
+import threading
+import shutil
 import time
-import copy
 import ast
+import bisect
+import re
+import functools
 import numpy as np
 
 # We need to ignore that one as it is used by user to compare keys (i.e Utils.key.UP)
 from readchar import readkey, key  # noqa: F401
 
+# Matches the SGR (Select Graphic Rendition) sequences at the beginning of a string.
+_SGR_PREFIX = re.compile(r"(?:\x1b\[[0-9;]*m)+")
+
+
+# The levels of each channel of the 6x6x6 color cube of the 256 colors palette.
+_XTERM_CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+
+
+def _xterm_palette():
+    # The 16 system colors (xterm defaults), the 6x6x6 color cube and the 24 shades of
+    # gray of the 256 colors palette.
+    palette = [
+        (0, 0, 0),
+        (205, 0, 0),
+        (0, 205, 0),
+        (205, 205, 0),
+        (0, 0, 238),
+        (205, 0, 205),
+        (0, 205, 205),
+        (229, 229, 229),
+        (127, 127, 127),
+        (255, 0, 0),
+        (0, 255, 0),
+        (255, 255, 0),
+        (92, 92, 255),
+        (255, 0, 255),
+        (0, 255, 255),
+        (255, 255, 255),
+    ]
+    levels = _XTERM_CUBE_LEVELS
+    palette.extend((r, g, b) for r in levels for g in levels for b in levels)
+    palette.extend((8 + 10 * i, 8 + 10 * i, 8 + 10 * i) for i in range(24))
+    return palette
+
+
+def _nearest_color(rgb, palette, start=0):
+    # Index of the color of palette (from start) that is the closest to rgb.
+    best = start
+    best_distance = None
+    for idx in range(start, len(palette)):
+        color = palette[idx]
+        distance = (
+            (rgb[0] - color[0]) ** 2
+            + (rgb[1] - color[1]) ** 2
+            + (rgb[2] - color[2]) ** 2
+        )
+        if best_distance is None or distance < best_distance:
+            best = idx
+            best_distance = distance
+    return best
+
+
+_XTERM_PALETTE = _xterm_palette()
+# Nearest system color (0-15) of each of the 256 colors.
+_NEAREST_16_OF_256 = [_nearest_color(c, _XTERM_PALETTE[:16]) for c in _XTERM_PALETTE]
+# Index (0-5) of the nearest level of the 6x6x6 color cube to each channel value.
+_NEAREST_CUBE_LEVEL = [
+    min(range(0, 6), key=lambda i: abs(value - _XTERM_CUBE_LEVELS[i]))
+    for value in range(0, 256)
+]
+# Index (0-23) of the nearest shade of gray to each sum of the 3 channels.
+_NEAREST_GRAY = [
+    min(range(0, 24), key=lambda i: abs(total - 3 * (8 + 10 * i)))
+    for total in range(0, 766)
+]
+
+
+def _nearest_color_256(rgb):
+    # Index of the color of the 256 colors palette (color cube and grays, the system
+    # colors are left out) that is the closest to rgb: the same as
+    # _nearest_color(rgb, _XTERM_PALETTE, 16) through lookup tables. The nearest
+    # color of the cube is made of the nearest level of each channel and the nearest
+    # gray is the one closest to the mean of the channels.
+    red, green, blue = rgb
+    cube = (
+        16
+        + 36 * _NEAREST_CUBE_LEVEL[red]
+        + 6 * _NEAREST_CUBE_LEVEL[green]
+        + _NEAREST_CUBE_LEVEL[blue]
+    )
+    gray = 232 + _NEAREST_GRAY[red + green + blue]
+    distances = []
+    for idx in (cube, gray):
+        color = _XTERM_PALETTE[idx]
+        distances.append(
+            (red - color[0]) ** 2 + (green - color[1]) ** 2 + (blue - color[2]) ** 2
+        )
+    return gray if distances[1] < distances[0] else cube
+
+
+@functools.lru_cache(maxsize=4096)
+def _nearest_color_16(rgb):
+    # Index of the system color (0-15) that is the closest to rgb.
+    return _nearest_color(rgb, _XTERM_PALETTE[:16])
+
+
+class _ChunkedGrid:
+    # A sparse 2D grid split in square NumPy chunks. A chunk is only allocated when a
+    # value that is not the fill value is written into it. It supports the subset of
+    # the NumPy indexing used by the Board: grid[row, column] and
+    # grid[rows, columns] with slices (read only, it returns a dense copy).
+    __slots__ = ("shape", "fill", "dtype", "chunk_size", "chunks")
+
+    def __init__(self, shape, fill, dtype, chunk_size):
+        self.shape = shape
+        self.fill = fill
+        self.dtype = dtype
+        self.chunk_size = chunk_size
+        self.chunks = {}
+
+    def __position(self, index):
+        row, column = index
+        if row < 0:
+            row += self.shape[0]
+        if column < 0:
+            column += self.shape[1]
+        if row < 0 or row >= self.shape[0] or column < 0 or column >= self.shape[1]:
+            raise IndexError(f"index {index} is out of bounds for shape {self.shape}")
+        return row, column
+
+    def __getitem__(self, index):
+        if isinstance(index[0], slice) or isinstance(index[1], slice):
+            rows, columns = index
+            if not isinstance(rows, slice):
+                rows = self.__position((rows, 0))[0]
+                return self.__area(slice(rows, rows + 1), columns)[0]
+            if not isinstance(columns, slice):
+                columns = self.__position((0, columns))[1]
+                return self.__area(rows, slice(columns, columns + 1))[:, 0]
+            return self.__area(rows, columns)
+        row, column = self.__position(index)
+        size = self.chunk_size
+        chunk = self.chunks.get((row // size, column // size))
+        if chunk is None:
+            return self.fill
+        return chunk[row % size, column % size]
+
+    def __setitem__(self, index, value):
+        row, column = self.__position(index)
+        size = self.chunk_size
+        chunk = self.chunks.get((row // size, column // size))
+        if chunk is None:
+            if value is self.fill:
+                return
+            chunk = np.full((size, size), self.fill, dtype=self.dtype)
+            self.chunks[(row // size, column // size)] = chunk
+        chunk[row % size, column % size] = value
+
+    def __area(self, rows, columns):
+        row_start, row_end, _ = rows.indices(self.shape[0])
+        column_start, column_end, _ = columns.indices(self.shape[1])
+        area = np.full(
+            (max(row_end - row_start, 0), max(column_end - column_start, 0)),
+            self.fill,
+            dtype=self.dtype,
+        )
+        if area.size == 0:
+            return area
+        size = self.chunk_size
+        for chunk_row in range(row_start // size, (row_end - 1) // size + 1):
+            for chunk_column in range(
+                column_start // size, (column_end - 1) // size + 1
+            ):
+                chunk = self.chunks.get((chunk_row, chunk_column))
+                if chunk is None:
+                    continue
+                top = max(row_start, chunk_row * size)
+                bottom = min(row_end, (chunk_row + 1) * size)
+                left = max(column_start, chunk_column * size)
+                right = min(column_end, (chunk_column + 1) * size)
+                area[
+                    top - row_start : bottom - row_start,
+                    left - column_start : right - column_start,
+                ] = chunk[
+                    top - chunk_row * size : bottom - chunk_row * size,
+                    left - chunk_column * size : right - chunk_column * size,
+                ]
+        return area
+
+    def values(self):
+        # The allocated chunks, in allocation order.
+        return self.chunks.values()
+
+
+class _ValueIndex:
+    # Board items indexed by the value of one of their attributes, for the "contains"
+    # queries. A value contains a string if one of its suffixes starts with that
+    # string: the suffixes of the distinct values are kept sorted and a query is a
+    # binary search followed by a walk over the matching suffixes only. The values
+    # added since the suffixes were sorted (and the values that are not strings) are
+    # tested one by one, the suffixes are sorted again when there are too many of
+    # them. The suffixes of the values that were removed are skipped until then.
+    __slots__ = ("buckets", "suffixes", "owners", "pending", "stale")
+
+    def __init__(self):
+        self.buckets = {}
+        self.suffixes = []
+        self.owners = []
+        self.pending = set()
+        self.stale = 0
+
+    def add(self, value, item):
+        bucket = self.buckets.get(value)
+        if bucket is None:
+            bucket = self.buckets[value] = set()
+            self.pending.add(value)
+        bucket.add(item)
+
+    def discard(self, value, item):
+        bucket = self.buckets[value]
+        bucket.discard(item)
+        if len(bucket) == 0:
+            del self.buckets[value]
+            if value in self.pending:
+                self.pending.discard(value)
+            else:
+                self.stale += 1
+
+    def matches(self, value):
+        # The set of the items whose value contains value.
+        buckets = self.buckets
+        if type(value) is not str:
+            values = [
+                indexed_value for indexed_value in buckets if value in indexed_value
+            ]
+        else:
+            limit = max(64, len(buckets) // 8)
+            if len(self.pending) > limit or self.stale > limit:
+                self.__sort()
+            values = {
+                indexed_value
+                for indexed_value in self.pending
+                if value in indexed_value
+            }
+            suffixes = self.suffixes
+            owners = self.owners
+            idx = bisect.bisect_left(suffixes, value)
+            while idx < len(suffixes) and suffixes[idx].startswith(value):
+                if owners[idx] in buckets:
+                    values.add(owners[idx])
+                idx += 1
+        return set().union(*[buckets[indexed_value] for indexed_value in values])
+
+    def __sort(self):
+        suffixes = sorted(
+            (indexed_value[i:], indexed_value)
+            for indexed_value in self.buckets
+            if type(indexed_value) is str
+            for i in range(0, max(len(indexed_value), 1))
+        )
+        self.suffixes = [suffix for suffix, _ in suffixes]
+        self.owners = [indexed_value for _, indexed_value in suffixes]
+        self.pending = {
+            indexed_value
+            for indexed_value in self.buckets
+            if type(indexed_value) is not str
+        }
+        self.stale = 0
+
+
+class _ItemIndex:
+    # A set of board items that is also indexed by class, type and name. The queries
+    # only visit the items of the classes and the types or names that can match
+    # instead of the whole set. The observer (the board) is attached to the indexed
+    # items to be notified when their type, name or animation change. The footprints
+    # of the indexed items are kept in the broadphase (if any).
+    __slots__ = (
+        "observer",
+        "broadphase",
+        "items",
+        "classes",
+        "attributes",
+        "keys",
+        "animated",
+    )
+
+    def __init__(self, observer, broadphase=None):
+        self.observer = observer
+        self.broadphase = broadphase
+        self.items = set()
+        self.classes = {}
+        self.attributes = {"type": _ValueIndex(), "name": _ValueIndex()}
+        self.keys = {}
+        self.animated = set()
+
+    def __contains__(self, item):
+        return item in self.items
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def add(self, item):
+        if item in self.items:
+            self.discard(item)
+        self.items.add(item)
+        self.classes.setdefault(type(item), set()).add(item)
+        keys = (item.type, item.name)
+        self.keys[item] = keys
+        self.attributes["type"].add(keys[0], item)
+        self.attributes["name"].add(keys[1], item)
+        if item.animation is not None:
+            self.animated.add(item)
+        if self.broadphase is not None:
+            self.broadphase.update(item)
+        item.attach(self.observer)
+
+    def discard(self, item):
+        if item not in self.items:
+            return
+        self.items.discard(item)
+        keys = self.keys.pop(item)
+        self.__remove(self.classes, type(item), item)
+        self.attributes["type"].discard(keys[0], item)
+        self.attributes["name"].discard(keys[1], item)
+        self.animated.discard(item)
+        if self.broadphase is not None:
+            self.broadphase.discard(item)
+
+    def update(self, item):
+        # Index an item again after its type, name or animation changed.
+        if item in self.items:
+            self.add(item)
+
+    @staticmethod
+    def __remove(index, indexed_value, item):
+        bucket = index[indexed_value]
+        bucket.discard(item)
+        if len(bucket) == 0:
+            del index[indexed_value]
+
+    def query(self, item_class=None, filters=None):
+        # Iterate over the items that are instances of item_class and that have
+        # attributes containing the values of filters.
+        if filters is None:
+            filters = {}
+        if item_class is None and not filters:
+            return iter(self.items)
+        candidates = None
+        if item_class is not None:
+            candidates = set().union(
+                *[
+                    bucket
+                    for cls, bucket in self.classes.items()
+                    if issubclass(cls, item_class)
+                ]
+            )
+        for attribute, value in filters.items():
+            index = self.attributes.get(attribute)
+            if index is None:
+                continue
+            matches = index.matches(value)
+            if candidates is None or len(matches) < len(candidates):
+                candidates = matches
+        if candidates is None:
+            candidates = self.items
+        return self.__filter(candidates, item_class, filters)
+
+    @staticmethod
+    def __filter(candidates, item_class, filters):
+        for item in candidates:
+            if item_class is not None and not isinstance(item, item_class):
+                continue
+            for attribute, value in filters.items():
+                if value not in getattr(item, attribute):
+                    break
+            else:
+                yield item
+
+
+class _BroadPhase:
+    # A uniform grid of the footprints (bounding rectangles) of the movable and
+    # immovable items of a board, updated by the _ItemIndex objects when the items are
+    # placed, moved or removed. Only the items that share a bucket of the grid are
+    # tested against each other.
+    __slots__ = ("bucket_size", "boxes", "buckets")
+
+    def __init__(self, bucket_size=8):
+        self.bucket_size = bucket_size
+        self.boxes = {}
+        self.buckets = {}
+
+    def __contains__(self, item):
+        return item in self.boxes
+
+    @staticmethod
+    def box(item, offset_row=0, offset_column=0):
+        # The (top, left, bottom, right) footprint of an item.
+        row = item.pos[0] + offset_row
+        column = item.pos[1] + offset_column
+        return (row, column, row + item.size[1] - 1, column + item.size[0] - 1)
+
+    @staticmethod
+    def intersect(box1, box2):
+        return (
+            box1[0] <= box2[2]
+            and box2[0] <= box1[2]
+            and box1[1] <= box2[3]
+            and box2[1] <= box1[3]
+        )
+
+    def __bucket_keys(self, box):
+        size = self.bucket_size
+        for bucket_row in range(box[0] // size, box[2] // size + 1):
+            for bucket_column in range(box[1] // size, box[3] // size + 1):
+                yield bucket_row, bucket_column
+
+    def update(self, item):
+        if item.pos[0] is None or item.pos[1] is None:
+            return
+        box = self.box(item)
+        previous = self.boxes.get(item)
+        if previous == box:
+            return
+        size = self.bucket_size
+        if previous is not None and all(
+            previous[index] // size == box[index] // size for index in range(4)
+        ):
+            # The item stays in the same buckets.
+            self.boxes[item] = box
+            return
+        self.discard(item)
+        self.boxes[item] = box
+        for bucket_key in self.__bucket_keys(box):
+            self.buckets.setdefault(bucket_key, set()).add(item)
+
+    def discard(self, item):
+        box = self.boxes.pop(item, None)
+        if box is None:
+            return
+        for bucket_key in self.__bucket_keys(box):
+            bucket = self.buckets[bucket_key]
+            bucket.discard(item)
+            if len(bucket) == 0:
+                del self.buckets[bucket_key]
+
+    def query(self, box):
+        # The items whose footprints intersect a box.
+        results = set()
+        for bucket_key in self.__bucket_keys(box):
+            for item in self.buckets.get(bucket_key, ()):
+                if item not in results and self.intersect(box, self.boxes[item]):
+                    results.add(item)
+        return results
+
+    def pairs(self, movables, exact=True):
+        # The pairs of items that share a bucket (or that actually overlap if exact
+        # is True) and of which at least one is in movables.
+        pairs = set()
+        boxes = self.boxes
+        for bucket in self.buckets.values():
+            if len(bucket) < 2:
+                continue
+            moving = [item for item in bucket if item in movables]
+            for item in moving:
+                for other in bucket:
+                    if other is item or (other in movables and id(other) < id(item)):
+                        continue
+                    if exact and not self.intersect(boxes[item], boxes[other]):
+                        continue
+                    if boxes[other] < boxes[item]:
+                        pairs.add((other, item))
+                    else:
+                        pairs.add((item, other))
+        return pairs
+
+
+class _SpatialIndex:
+    # The occupied cells of a board: a hash of the cells that hold non void items and
+    # a grid of buckets of these cells. An area query only visits the buckets that
+    # overlap the area and, in each of them, either probes the cells of the area or
+    # filters the occupied cells of the bucket (whichever is smaller). The cost of a
+    # query does not depend on the number of empty cells.
+    __slots__ = ("cells", "buckets", "bucket_size")
+
+    def __init__(self, bucket_size=16):
+        self.cells = {}
+        self.buckets = {}
+        self.bucket_size = bucket_size
+
+    def __len__(self):
+        return len(self.cells)
+
+    def update(self, row, column, items):
+        # Set the non void items of a cell (an empty list vacates the cell).
+        position = (row, column)
+        bucket_key = (row // self.bucket_size, column // self.bucket_size)
+        if items:
+            self.cells[position] = items
+            self.buckets.setdefault(bucket_key, set()).add(position)
+        elif self.cells.pop(position, None) is not None:
+            bucket = self.buckets[bucket_key]
+            bucket.discard(position)
+            if len(bucket) == 0:
+                del self.buckets[bucket_key]
+
+    def query(self, top, left, bottom, right):
+        # Iterate over the (row, column, item) of the items between top/left and
+        # bottom/right (included).
+        size = self.bucket_size
+        cells = self.cells
+        for bucket_row in range(top // size, bottom // size + 1):
+            for bucket_column in range(left // size, right // size + 1):
+                bucket = self.buckets.get((bucket_row, bucket_column))
+                if not bucket:
+                    continue
+                row_start = max(top, bucket_row * size)
+                row_end = min(bottom, bucket_row * size + size - 1)
+                column_start = max(left, bucket_column * size)
+                column_end = min(right, bucket_column * size + size - 1)
+                if (row_end - row_start + 1) * (column_end - column_start + 1) < len(
+                    bucket
+                ):
+                    for row in range(row_start, row_end + 1):
+                        for column in range(column_start, column_end + 1):
+                            for item in cells.get((row, column), ()):
+                                yield row, column, item
+                else:
+                    for row, column in bucket:
+                        if (
+                            row_start <= row <= row_end
+                            and column_start <= column <= column_end
+                        ):
+                            for item in cells[(row, column)]:
+                                yield row, column, item
+
 
 class Board(base.PglBaseObject):
     """A class that represent a game board.
@@ -99,8 +639,13 @@ class Board(base.PglBaseObject):
         partial_display_viewport=None,
         partial_display_focus=None,
         enable_partial_display=False,
+        chunked: bool = False,
+        chunk_size: int = 32,
     ):
         """
+        .. versionchanged:: 1.4.0
+           Added the chunked and chunk_size parameters.
+
         :param name: the name of the Board
         :type name: str
         :param size: array [width,height] with width and height being int.
@@ -141,6 +686,21 @@ class Board(base.PglBaseObject):
            point/item. It can be an item or a vector.
         :type partial_display_focus: :class:`~pygamelib.board_items.BoardItem` or
            :class:`~pygamelib.base.Vector2D`
+        :param chunked: A boolean to tell the Board to store its cells in square chunks
+           that are only allocated when something is placed in them. The memory used
+           by a chunked board depends on what is on it and not on its size, which makes
+           it possible to have open worlds of millions of cells. It is a bit slower to
+           access a cell than with the default dense storage. Default: False.
+        :type chunked: bool
+        :param chunk_size: The number of rows and columns of the chunks of a chunked
+           board. It is ignored if chunked is False. Default: 32.
+        :type chunk_size: int
+
+        Example::
+
+            # A 10000x10000 world: only the chunks where items are placed use memory.
+            world = Board(size=[10000, 10000], chunked=True)
+            world.place_item(Wall(), 5000, 5000)
 
         """
         super().__init__()
@@ -162,6 +722,8 @@ class Board(base.PglBaseObject):
         self.partial_display_viewport = partial_display_viewport
         self.partial_display_focus = partial_display_focus
         self.enable_partial_display = enable_partial_display
+        self.chunked = chunked
+        self.chunk_size = chunk_size
         self._matrix = None
         # self._matrix = np.array([])
 
@@ -181,10 +743,29 @@ class Board(base.PglBaseObject):
             raise error
 
         # Init the list of movable and immovable objects
-        self._movables = set()
-        self._immovables = set()
+        self.__broadphase = _BroadPhase()
+        self._movables = _ItemIndex(self, self.__broadphase)
+        self._immovables = _ItemIndex(self, self.__broadphase)
         # Init the list of particle emitters.
         self._particle_emitters = set()
+        # The resolved sprixel of each cell (None when it needs to be resolved again).
+        # The board watches the items and their sprixels to invalidate the cells that
+        # change.
+        self.__visible_sprixels = None
+        # True for the resolved cells that are not exactly 1 column wide.
+        self.__irregular_cells = None
+        self.__tracked_items = {}
+        self.__sprixel_items = {}
+        # Streaming (see load_streamed()): the directory of the board, the chunks that
+        # are stored there, the chunks that are loaded, the loaded chunks that were
+        # modified and the areas that were streamed since the last eviction.
+        self.__stream_path = None
+        self.__stored_chunks = set()
+        self.__loaded_chunks = set()
+        self.__dirty_chunks = set()
+        self.__stream_areas = []
+        self.streaming_margin = 1
+        self.__moving_many = False
         # If sanity check passed then, initialize the board
         self.init_board()
 
@@ -211,44 +792,78 @@ class Board(base.PglBaseObject):
 
         **This method is automatically called by the Board's constructor**.
 
+        .. versionchanged:: 1.4.0
+           The void items are created lazily: an empty cell costs nothing until it is
+           actually used (by :meth:`item`, :meth:`place_item`, etc.). Initializing a
+           board is therefore independent of the number of empty cells.
+
         Example::
 
             myboard.init_board()
         """
+        # All the void cells share the same immutable sprixel (it is copied on write
+        # by the items). The void items themselves are only created when a cell is
+        # actually used (see __cell()): an empty cell is just None in the matrix.
+        self.__void = self.__void_sprixel()
+        shape = (self.size[1], self.size[0])
+        if self.chunked:
+            self._matrix = _ChunkedGrid(shape, None, object, self.chunk_size)
+            self.__visible_sprixels = _ChunkedGrid(shape, None, object, self.chunk_size)
+            self.__irregular_cells = _ChunkedGrid(shape, False, bool, self.chunk_size)
+        else:
+            self._matrix = np.full(shape, None, dtype=object)
+            self.__visible_sprixels = np.full(shape, None, dtype=object)
+            self.__irregular_cells = np.zeros(shape, dtype=bool)
+        for item in self.__tracked_items:
+            item.detach(self)
+        for sprixel, items in self.__sprixel_items.values():
+            sprixel.detach(self)
+        self.__tracked_items = {}
+        self.__sprixel_items = {}
+        self.__loaded_chunks = set()
+        self.__dirty_chunks = set()
+        self.__spatial_index = _SpatialIndex()
+
+    def __cell(self, row, column):
+        # Return the layers of a cell, materializing its void item on first use.
+        if self.__stream_path is not None:
+            self.__stream_cell(row, column)
+        cell = self._matrix[row, column]
+        if cell is None:
+            if row < 0:
+                row += self.size[1]
+            if column < 0:
+                column += self.size[0]
+            void = board_items.BoardItemVoid(
+                pos=[row, column, 0], sprixel=self.__void, parent=self
+            )
+            cell = [void]
+            self._matrix[row, column] = cell
+            self.__track(void)
+        return cell
+
+    def __cells(self):
+        # Iterate over the layers of the cells that have been materialized.
+        if isinstance(self._matrix, _ChunkedGrid):
+            chunks = self._matrix.values()
+        else:
+            chunks = [self._matrix]
+        for chunk in chunks:
+            for cell in chunk.flat:
+                if cell is not None:
+                    yield cell
+
+    def __void_sprixel(self):
+        # Return the shared sprixel of the void cells.
+        palette = core.SprixelPalette.instance()
         if self.ui_board_void_cell_sprixel is not None and isinstance(
             self.ui_board_void_cell_sprixel, core.Sprixel
         ):
-            # The deepcopy is a lot slower but it protects against a ton of unwanted
-            # side effects
-            self._matrix = np.array(
-                [
-                    [None for i in range(0, self.size[0], 1)]
-                    for j in range(0, self.size[1], 1)
-                ]
-            )
-            for r in range(self.size[1]):
-                for c in range(self.size[0]):
-                    self._matrix[r][c] = [
-                        board_items.BoardItemVoid(
-                            pos=[r, c, 0],
-                            sprixel=copy.deepcopy(self.ui_board_void_cell_sprixel),
-                            parent=self,
-                        )
-                    ]
-        else:
-            self._matrix = np.array(
-                [
-                    [None for i in range(0, self.size[0], 1)]
-                    for j in range(0, self.size[1], 1)
-                ]
-            )
-            for r in range(self.size[1]):
-                for c in range(self.size[0]):
-                    self._matrix[r][c] = [
-                        board_items.BoardItemVoid(
-                            pos=[r, c, 0], model=self.ui_board_void_cell, parent=self
-                        )
-                    ]
+            return palette.share(self.ui_board_void_cell_sprixel)
+        model = self.ui_board_void_cell
+        if model is None:
+            model = "*"
+        return palette.sprixel(model, is_bg_transparent=True)
 
     def generate_void_cell(self):
         """This method return a void cell.
@@ -256,6 +871,10 @@ class Board(base.PglBaseObject):
         If ui_board_void_cell_sprixel is defined it uses it, otherwise use
         ui_board_void_cell to generate the void item.
 
+        .. versionchanged:: 1.4.0
+           The void cells share the same immutable sprixel (a
+           :class:`~pygamelib.gfx.core.SharedSprixel`).
+
         :return: A void board item
         :rtype: :class:`~pygamelib.board_items.BoardItemVoid`
 
@@ -263,16 +882,7 @@ class Board(base.PglBaseObject):
 
             board.generate_void_cell()
         """
-        if self.ui_board_void_cell_sprixel is not None and isinstance(
-            self.ui_board_void_cell_sprixel, core.Sprixel
-        ):
-            return board_items.BoardItemVoid(
-                sprixel=copy.deepcopy(self.ui_board_void_cell_sprixel),
-                model=self.ui_board_void_cell_sprixel.model,
-                parent=self,
-            )
-        else:
-            return board_items.BoardItemVoid(model=self.ui_board_void_cell, parent=self)
+        return board_items.BoardItemVoid(sprixel=self.__void_sprixel(), parent=self)
 
     def init_cell(self, row, column, layer=0) -> None:
         """
@@ -293,8 +903,12 @@ class Board(base.PglBaseObject):
         # layers? -> My position for the moment is to leave that method at simple as
         # possible. It should be the responsibility of place_item to init the missing
         # layers.
-        self._matrix[row][column][layer] = self.generate_void_cell()
-        self._matrix[row][column][layer].store_position(row, column, layer)
+        cell = self.__cell(row, column)
+        cell[layer] = self.generate_void_cell()
+        cell[layer].store_position(row, column, layer)
+        self.__track(cell[layer])
+        self.__invalidate_cell(row, column)
+        self.__index_cell(row, column)
 
     def check_sanity(self) -> None:
         """Check the board sanity.
@@ -376,6 +990,11 @@ class Board(base.PglBaseObject):
                 "SANITY_CHECK_KO",
                 ("The 'ui_board_void_cell' parameter must be a string."),
             )
+        if self.chunked and (type(self.chunk_size) is not int or self.chunk_size < 1):
+            raise base.PglException(
+                "SANITY_CHECK_KO",
+                "The 'chunk_size' parameter must be a strictly positive integer.",
+            )
         # TODO: The void_cell check should be done once and for all (str and sprixel at
         #  the same time)
         if self.ui_board_void_cell_sprixel is not None and isinstance(
@@ -465,7 +1084,12 @@ class Board(base.PglBaseObject):
             if board.layers(game.player.row, game.player.column) > 1:
                 print('The player is stomping on something!')
         """
-        return len(self._matrix[row][column])
+        if self.__stream_path is not None:
+            self.__stream_cell(row, column)
+        cell = self._matrix[row, column]
+        if cell is None:
+            return 1
+        return len(cell)
 
     def display_around(self, item, row_radius, column_radius) -> None:
         """Display only a part of the board.
@@ -609,7 +1233,7 @@ class Board(base.PglBaseObject):
         print(
             "".join(
                 [
-                    str(self.ui_border_top) * len(self._matrix[0]),
+                    str(self.ui_border_top) * self.size[0],
                     str(self.ui_border_top) * 2,
                     clear_eol,
                     "\r",
@@ -625,7 +1249,7 @@ class Board(base.PglBaseObject):
         print(
             "".join(
                 [
-                    str(self.ui_border_bottom) * len(self._matrix[0]),
+                    str(self.ui_border_bottom) * self.size[0],
                     str(self.ui_border_bottom) * 2,
                     clear_eol,
                     "\r",
@@ -640,6 +1264,13 @@ class Board(base.PglBaseObject):
 
         This method is automatically called by :func:`pygamelib.engine.Screen.render`.
 
+        .. versionchanged:: 1.4.0
+           The sprixel of each cell (see :func:`render_cell`) is cached. Only the
+           cells that changed since the last rendering (items placed, moved or removed,
+           sprixels modified or replaced) are resolved again. When the partial display
+           follows its focus, only the newly exposed cells are resolved and the
+           visible area is copied in one go (if it has no wide sprixel).
+
         :param buffer: A frame buffer to render the item into.
         :type buffer: numpy.array
         :param row: The row to render in.
@@ -707,27 +1338,64 @@ class Board(base.PglBaseObject):
             elif column_end < (vp_width * 2):
                 column_end = vp_width * 2
 
+        # Only the intersection of the board (or the viewport) and the buffer is
+        # visited. The buffer can be smaller than advertised (when it is a view given
+        # by a layout for example).
+        shape = getattr(buffer, "shape", None)
+        if shape is not None:
+            buffer_height = min(buffer_height, shape[0])
+            buffer_width = min(buffer_width, shape[1])
+        row_end = min(row_end, row_start + buffer_height - row)
+        max_cidx = buffer_width - column
+        if self.__stream_path is not None:
+            self.stream_area(
+                row_start, column_start, row_end - row_start, column_end - column_start
+            )
         # Trying to remove as many dot notation as possible for performances
-        render_cell = self.render_cell
-        # TODO: bind the rendering area to buffer_height and buffer_width.
+        # The cells are resolved once and cached until they change.
+        visible_sprixels = self.__visible_sprixels
+        visible_sprixel = self.__visible_sprixel
+        # When the partial display follows its focus, only the cells that become
+        # visible for the first time (or that changed) need to be resolved. If all the
+        # cells of the area are 1 column wide, it is copied in one go.
+        width = min(column_end - column_start, max_cidx)
+        if (
+            isinstance(buffer, np.ndarray)
+            and row_end > row_start
+            and width > 0
+            and not self.__irregular_cells[
+                row_start:row_end, column_start : column_start + width
+            ].any()
+        ):
+            area = visible_sprixels[
+                row_start:row_end, column_start : column_start + width
+            ]
+            if np.count_nonzero(area) != area.size:
+                area = area.copy()
+                for r, c in np.argwhere(np.logical_not(area)).tolist():
+                    area[r, c] = visible_sprixel(row_start + r, column_start + c)
+            if not self.__irregular_cells[
+                row_start:row_end, column_start : column_start + width
+            ].any():
+                buffer[
+                    row : row + row_end - row_start, column : column + width
+                ] = area
+                # Nothing left for the cell by cell rendering below.
+                row_end = row_start
         for br in range(row_start, row_end):
+            buffer_row = buffer[row + br - row_start]
             cidx = 0
             bc = column_start
-            while bc < column_end:
-                cell = render_cell(br, bc)
-                # encoded_cell = cell.__repr__()
+            visible_row = visible_sprixels[br, column_start:column_end]
+            while bc < column_end and cidx < max_cidx:
+                cell = visible_row[bc - column_start]
+                if cell is None:
+                    cell = visible_sprixel(br, bc)
                 incr = cell.length
-                try:
-                    # buffer[row + br - row_start][column + cidx] = encoded_cell
-                    buffer[row + br - row_start][column + cidx] = cell
-                except IndexError:
-                    break
-
-                for tmpidx in range(1, incr):
-                    try:
-                        buffer[row + br][column + cidx + tmpidx] = ""
-                    except IndexError:
-                        break
+                buffer_row[column + cidx] = cell
+                # Wide sprixels: the next cells of the buffer are left empty.
+                for tmpidx in range(1, min(incr, max_cidx - cidx)):
+                    buffer_row[column + cidx + tmpidx] = ""
                 bc += 1
                 cidx += incr
         # I dread the performance impact...
@@ -751,6 +1419,7 @@ class Board(base.PglBaseObject):
                 buffer_width,
             )
             self._particle_emitters.add(emt)
+        self.evict_chunks()
 
     def render_cell(self, row, column):
         """
@@ -798,12 +1467,15 @@ class Board(base.PglBaseObject):
             # Here we are doing something similar to casting a ray and
             # render the first cell that collides. Or more accurately the first data
             # that allow the creation of a Sprixel.
-            if (
-                len(self._matrix[row][column]) > 0
-                and self._matrix[row][column][-1].sprixel is not None
-            ):
-                item = self._matrix[row][column][-1]
-                sprix = self._matrix[row][column][-1].sprixel
+            if self.__stream_path is not None:
+                self.__stream_cell(row, column)
+            cell = self._matrix[row, column]
+            if cell is None:
+                # The void item of this cell has not been materialized yet.
+                return self.__void
+            if len(cell) > 0 and cell[-1]._sprixel is not None:
+                item = cell[-1]
+                sprix = cell[-1]._sprixel
                 # TEST for fixing wandering emitters...
                 if (
                     hasattr(item, "particle_emitter")
@@ -812,7 +1484,7 @@ class Board(base.PglBaseObject):
                     item.particle_emitter.row = row
                     item.particle_emitter.column = column
                 # END TEST
-                layers_len = len(self._matrix[row][column])
+                layers_len = len(cell)
                 if layers_len > 1:
                     idx = layers_len - 1
                     # For many reasons the item could be a void item, since we are over
@@ -820,8 +1492,8 @@ class Board(base.PglBaseObject):
                     # rendering). Therefor we try to discard them as quickly as possible
                     while isinstance(item, board_items.BoardItemVoid):
                         idx -= 1
-                        item = self._matrix[row][column][idx]
-                    sprix = self._matrix[row][column][idx].sprixel
+                        item = cell[idx]
+                    sprix = cell[idx]._sprixel
                     # TEST for fixing wandering emitters...
                     if (
                         hasattr(item, "particle_emitter")
@@ -835,25 +1507,21 @@ class Board(base.PglBaseObject):
                     # build a new sprixel because we are not modifying it.
                     if sprix.bg_color is None or sprix.is_bg_transparent:
                         # sprix = copy.deepcopy(self._matrix[row][column][-1].sprixel)
-                        sprix = self._matrix[row][column][-1].sprixel.copy()
+                        sprix = cell[-1]._sprixel.copy()
                         # And now we are going down to make sure that we have pseudo
                         # transparency.
                         idx -= 1
                         while idx >= 0:
                             if (
                                 not isinstance(
-                                    self._matrix[row][column][idx],
+                                    cell[idx],
                                     board_items.BoardItemVoid,
                                 )
-                                and not self._matrix[row][column][
-                                    idx
-                                ].sprixel.is_bg_transparent
+                                and not cell[idx]._sprixel.is_bg_transparent
                             ):
                                 # As soon as we complete the sprixel we break out of
                                 # here to limit the impact on performances
-                                sprix.bg_color = self._matrix[row][column][
-                                    idx
-                                ].sprixel.bg_color
+                                sprix.bg_color = cell[idx]._sprixel.bg_color
                                 break
                             idx -= 1
                 return sprix
@@ -885,14 +1553,15 @@ class Board(base.PglBaseObject):
             out of bound.
         """
         if row < self.size[1] and column < self.size[0]:
-            if layer >= len(self._matrix[row][column]):
+            cell = self.__cell(row, column)
+            if layer >= len(cell):
                 layer = -1
-            if self._matrix[row][column][layer].parent is not None and isinstance(
-                self._matrix[row][column][layer].parent, board_items.BoardComplexItem
+            if cell[layer].parent is not None and isinstance(
+                cell[layer].parent, board_items.BoardComplexItem
             ):
-                return self._matrix[row][column][layer].parent
+                return cell[layer].parent
             else:
-                return self._matrix[row][column][layer]
+                return cell[layer]
         else:
             raise base.PglOutOfBoardBoundException(
                 (
@@ -943,28 +1612,23 @@ class Board(base.PglBaseObject):
                 for ir in range(0, item.size[1]):
                     for ic in range(0, item.size[0]):
                         inner_pos_layer = layer
-                        if layer >= len(self._matrix[row + ir][column + ic]):
+                        cell = self.__cell(row + ir, column + ic)
+                        if layer >= len(cell):
                             break
                         else:
-                            existing_item = self._matrix[row + ir][column + ic][
-                                inner_pos_layer
-                            ]
+                            existing_item = cell[inner_pos_layer]
                             while (
                                 existing_item.restorable()
                                 and existing_item.overlappable()
                             ):
                                 inner_pos_layer += 1
                                 try:
-                                    existing_item = self._matrix[row + ir][column + ic][
-                                        inner_pos_layer
-                                    ]
+                                    existing_item = cell[inner_pos_layer]
                                 except IndexError:
                                     self._create_missing_layers(
                                         row + ir, column + ic, inner_pos_layer
                                     )
-                                    existing_item = self._matrix[row + ir][column + ic][
-                                        inner_pos_layer
-                                    ]
+                                    existing_item = cell[inner_pos_layer]
                             if inner_pos_layer > max_layer:
                                 max_layer = inner_pos_layer
                 # Game.instance().session_log(f"place_item: max_layer={max_layer}")
@@ -991,13 +1655,14 @@ class Board(base.PglBaseObject):
                     self._immovables.add(item)
             elif isinstance(item, board_items.BoardItem):
                 # First we look at the layers to see if the specified layer exists.
+                cell = self.__cell(row, column)
                 existing_item = None
                 try:
-                    existing_item = self._matrix[row][column][layer]
+                    existing_item = cell[layer]
                 except IndexError:
                     # The layer might not exist yet
                     self._create_missing_layers(row, column, layer)
-                    existing_item = self._matrix[row][column][layer]
+                    existing_item = cell[layer]
                 # If not and if the item is overlappable and restorable we increase the
                 # layer number (to create a new layer).
                 # existing_item should *never* be None here. If so, there's a big
@@ -1008,33 +1673,40 @@ class Board(base.PglBaseObject):
                 while existing_item.restorable() and existing_item.overlappable():
                     layer += 1
                     try:
-                        existing_item = self._matrix[row][column][layer]
+                        existing_item = cell[layer]
                     except IndexError:
                         self._create_missing_layers(row, column, layer)
-                        existing_item = self._matrix[row][column][layer]
+                        existing_item = cell[layer]
                 # If we are replacing a void item and the item's background is
                 # transparent, let's grab it's background color.
                 # An alternative would be to have the BoardItemVoid to be restorable,
                 # and to never overwrite it. But I'm afraid of the impact on the
                 # performances (it means create a lot more new layers and that impacts
                 # the performances dramatically).
+                # The sprixel is only written if the color changes: a shared sprixel
+                # has to be copied to be modified.
                 if (
                     isinstance(existing_item, board_items.BoardItemVoid)
-                    and existing_item.sprixel is not None
-                    and item.sprixel.is_bg_transparent
+                    and existing_item._sprixel is not None
+                    and item._sprixel.is_bg_transparent
+                    and item._sprixel.bg_color != existing_item._sprixel.bg_color
                 ):
-                    item.sprixel.bg_color = existing_item.sprixel.bg_color
+                    item.mutable_sprixel().bg_color = existing_item._sprixel.bg_color
                 # Place the item on the board
+                self.__untrack(cell[layer])
                 try:
-                    self._matrix[row][column][layer] = item
+                    cell[layer] = item
                 except IndexError:  # pragma: no cover
                     # This should literally never happen: we created relevant layers
                     # before. But, better safe than sorry.
-                    self._matrix[row][column].append(item)
+                    cell.append(item)
                 # Take ownership of the item (if item doesn't have parent)
                 if item.parent is None:
                     item.parent = self
                 item.store_position(row, column, layer)
+                self.__track(item)
+                self.__invalidate_cell(row, column)
+                self.__index_cell(row, column)
                 self.notify(self, "pygamelib.engine.Board.place_item:item_placed", item)
                 if isinstance(item, board_items.Movable):
                     if isinstance(item.parent, board_items.BoardComplexItem):
@@ -1132,16 +1804,15 @@ class Board(base.PglBaseObject):
             and (projected_position.row + item.height - 1) < self.size[1]
             and (projected_position.column + item.width - 1) < self.size[0]
         ):
+            # Only the cells that enter the footprint of the item are checked (the
+            # other ones were checked when the item moved on them).
+            new_row = projected_position.row
+            new_column = projected_position.column
+            entering = self.__entering_cells(item, new_row, new_column)
             can_draw = True
-
-            item_row = item.row
-            item_column = item.column
-            self.remove_item(item)
-            for orow in range(0, item.size[1]):
-                for ocol in range(0, item.size[0]):
-                    new_row = projected_position.row + orow
-                    new_column = projected_position.column + ocol
-                    dest_item = self.item(new_row, new_column)
+            for entering_row, columns in entering:
+                for new_column_index in columns:
+                    dest_item = self.item(entering_row, new_column_index)
                     if isinstance(dest_item, board_items.Actionable):
                         if (
                             (
@@ -1168,7 +1839,7 @@ class Board(base.PglBaseObject):
                         ):
                             dest_item.activate()
                     # Now taking care of pickable objects
-                    pickable_item = self.item(new_row, new_column)
+                    pickable_item = self.item(entering_row, new_column_index)
                     if (
                         pickable_item.pickable()
                         and isinstance(item, board_items.Movable)
@@ -1182,10 +1853,104 @@ class Board(base.PglBaseObject):
                     if dest_item != item and not dest_item.overlappable():
                         can_draw = False
                         break
-            if can_draw:
-                self.place_item(item, projected_position.row, projected_position.column)
+            if not can_draw:
+                return
+            # The item keeps its layer if the cells under its new footprint allow it.
+            # If they do not (it needs to go over or it can go under the overlappable
+            # and restorable items), it is placed again as a whole.
+            required_layer = max(
+                self.__free_layer(item, new_row + part_row, new_column + part_column)
+                for part_row in range(item.height)
+                for part_column in range(item.width)
+            )
+            if required_layer == item.layer:
+                self.__shift_complex(item, new_row, new_column)
+            else:
+                self.remove_item(item)
+                self.place_item(item, new_row, new_column)
+
+    def __entering_cells(self, item, new_row, new_column):
+        # The (row, columns) of the cells of the new footprint of a complex item that
+        # are not in its current footprint.
+        cells = []
+        for row in range(new_row, new_row + item.height):
+            if item.row <= row < item.row + item.height:
+                columns = list(
+                    range(new_column, min(new_column + item.width, item.column))
+                ) + list(
+                    range(
+                        max(new_column, item.column + item.width),
+                        new_column + item.width,
+                    )
+                )
             else:
-                self.place_item(item, item_row, item_column)
+                columns = range(new_column, new_column + item.width)
+            cells.append((row, columns))
+        return cells
+
+    def __free_layer(self, item, row, column):
+        # The layer where place_item() would put the parts of a complex item in a cell:
+        # the first one that is not restorable and overlappable (or that holds a part
+        # of the item).
+        cell = self.__cell(row, column)
+        for layer, existing_item in enumerate(cell):
+            if existing_item.parent is item or not (
+                existing_item.restorable() and existing_item.overlappable()
+            ):
+                return layer
+        return len(cell)
+
+    def __shift_complex(self, item, new_row, new_column):
+        # Move the parts of a complex item without placing it again: the parts that
+        # stay in the footprint are swapped in place, the other ones are placed or
+        # cleared.
+        layer = item.layer
+        for row in range(item.row, item.row + item.height):
+            for column in range(item.column, item.column + item.width):
+                if (
+                    new_row <= row < new_row + item.height
+                    and new_column <= column < new_column + item.width
+                ):
+                    continue
+                self.__clear_part(item, row, column, layer)
+        for part_row in range(item.height):
+            for part_column in range(item.width):
+                row = new_row + part_row
+                column = new_column + part_column
+                part = item.item(part_row, part_column)
+                cell = self.__cell(row, column)
+                if isinstance(part, board_items.BoardItemVoid):
+                    self.__clear_part(item, row, column, layer)
+                elif layer < len(cell) and cell[layer].parent is item:
+                    if cell[layer] is part:
+                        continue
+                    self.__untrack(cell[layer])
+                    cell[layer] = part
+                    part.store_position(row, column, layer)
+                    part._auto_layer = item._auto_layer
+                    self.__track(part)
+                    self.__invalidate_cell(row, column)
+                    self.__index_cell(row, column)
+                else:
+                    self.place_item(part, row, column, layer, False)
+                    part._auto_layer = item._auto_layer
+        if item.particle_emitter is not None and isinstance(
+            item.particle_emitter, particles.ParticleEmitter
+        ):
+            self._particle_emitters.add(item.particle_emitter)
+        item.store_position(new_row, new_column, layer)
+        self.notify(self, "pygamelib.engine.Board.place_item:item_placed", item)
+        if isinstance(item, board_items.Movable):
+            self._movables.add(item)
+        elif isinstance(item, board_items.Immovable):
+            self._immovables.add(item)
+
+    def __clear_part(self, item, row, column, layer):
+        # Clear a cell if it holds a part of a complex item.
+        cell = self.__cell(row, column)
+        if layer < len(cell) and cell[layer].parent is item:
+            self.__untrack(cell[layer])
+            self.clear_cell(row, column, layer)
 
     def move(self, item, direction, step=1):
         """
@@ -1228,6 +1993,13 @@ class Board(base.PglBaseObject):
            nearest integer (as move works with entire board cells). It allows for
            movement accumulation before actually moving. The step parameter is not used
            in that case.
+
+        .. versionchanged:: 1.4.0
+           A :class:`~pygamelib.board_items.BoardComplexItem` only checks the cells
+           that enter its footprint: the actionable items are activated and the
+           pickable items are picked up when the complex item moves on them, not again
+           at each move while they are under it. If its layer does not change, its
+           parts are shifted without removing and placing the whole item again.
         """
         if (
             self.parent is not None
@@ -1279,18 +2051,215 @@ class Board(base.PglBaseObject):
                 "Board.move(item, direction, step): direction must be a Vector2D or"
                 " a constant direction."
             )
-        item._accumulator += direction
-        rounded_direction.row = round(item._accumulator.row - item._accumulator.row % 1)
-        item._accumulator.row -= rounded_direction.row
-        rounded_direction.column = round(
-            item._accumulator.column - item._accumulator.column % 1
+        rounded_direction.row, rounded_direction.column = self.__accumulate(
+            item, direction.row, direction.column
         )
-        item._accumulator.column -= rounded_direction.column
         if isinstance(item, board_items.BoardComplexItem):
             return self._move_complex(item, rounded_direction, step)
         else:
             return self._move_simple(item, rounded_direction, step)
 
+    def move_many(self, moves) -> list:
+        """
+        Move many items at once.
+
+        Each move works exactly like :meth:`move` (actionable, pickable and
+        overlappable items, movement speed in real time mode, movement accumulation,
+        etc.) but the batch is validated once and resolved as a whole:
+
+         - If several items move to the same cell, the first one in the batch moves
+           and the other ones stay where they are.
+         - An item that moves to a cell that is left by another item of the batch is
+           moved after it, so a line of items can follow its leader whatever the
+           order of the batch. The items that would need to move after each other in
+           a cycle (like 2 items swapping places) are moved in the order of the
+           batch.
+
+        The per item notifications of :meth:`place_item` and :meth:`remove_item` are
+        replaced by a single
+        :boldblue:`pygamelib.engine.Board.move_many:items_moved` event. The list of
+        the items that actually moved is passed as the :blue:`value` of the event.
+
+        .. versionadded:: 1.4.0
+
+        :param moves: The (item, direction) pairs. The direction is a
+           :class:`~pygamelib.base.Vector2D`, a (row, column) tuple or a direction
+           from :ref:`constants-module` (for a 1 cell move).
+        :type moves: list
+        :return: The items that moved, in the order of the batch.
+        :rtype: list
+        :raises PglObjectIsNotMovableException: If an item is not a Movable.
+        :raises PglInvalidTypeException: If a direction is not valid.
+
+        Example::
+
+            board.move_many(
+                [(npc, (0, 1)) for npc in board.get_movables(board_items.NPC)]
+            )
+        """
+        real_time = (
+            isinstance(self.parent, Game)
+            and self.parent.mode == EngineMode.MODE_REAL_TIME
+        )
+        # First, the displacement of each item and the cells it claims (the first
+        # claim of a cell wins) and holds.
+        claims = {}
+        holders = {}
+        accepted = []
+        for item, direction in moves:
+            if not isinstance(item, board_items.Movable):
+                raise base.PglObjectIsNotMovableException(
+                    f"Item '{item.name}' at position [{item.pos[0]}, {item.pos[1]}] "
+                    "is not a subclass of Movable, therefor it cannot be moved."
+                )
+            if real_time and item.can_move() and item.dtmove < item.movement_speed:
+                continue
+            if type(direction) is tuple and len(direction) == 2:
+                row, column = direction
+            elif isinstance(direction, base.Vector2D):
+                row, column = direction.row, direction.column
+            elif type(direction) is int or type(direction) is Direction:
+                # NO_DIR has no vector: the item does not move.
+                vector = base.Vector2D.from_direction(direction, 1)
+                row, column = (0, 0) if vector is None else (vector.row, vector.column)
+            else:
+                raise base.PglInvalidTypeException(
+                    "Board.move_many(moves): directions must be Vector2D, (row, "
+                    "column) tuples or constant directions."
+                )
+            item.dtmove = 0.0
+            row, column = self.__accumulate(item, row, column)
+            if row == 0 and column == 0:
+                continue
+            item_row, item_column = item.pos[0], item.pos[1]
+            if isinstance(item, board_items.BoardComplexItem):
+                cells = [
+                    (entering_row, entering_column)
+                    for entering_row, columns in self.__entering_cells(
+                        item, item_row + row, item_column + column
+                    )
+                    for entering_column in columns
+                ]
+                if any(cell in claims for cell in cells):
+                    continue
+                for part_row in range(item_row, item_row + item.height):
+                    for part_column in range(item_column, item_column + item.width):
+                        holders[(part_row, part_column)] = item
+            else:
+                cells = [(item_row + row, item_column + column)]
+                if cells[0] in claims:
+                    continue
+                holders[(item_row, item_column)] = item
+            for cell in cells:
+                claims[cell] = item
+            accepted.append((item, row, column, cells))
+        # Then, the moves are applied, each one after the moves of the items that
+        # hold the cells it claims.
+        entries = {entry[0]: entry for entry in accepted}
+        direction = base.Vector2D()
+        moved = set()
+        visited = set()
+        self.__moving_many = True
+        try:
+            for entry in accepted:
+                if entry[0] in visited:
+                    continue
+                visited.add(entry[0])
+                stack = [(entry, False)]
+                while stack:
+                    (item, row, column, cells), ready = stack.pop()
+                    if not ready:
+                        stack.append(((item, row, column, cells), True))
+                        for cell in reversed(cells):
+                            holder = holders.get(cell)
+                            if holder is not None and holder not in visited:
+                                visited.add(holder)
+                                stack.append((entries[holder], False))
+                        continue
+                    position = (item.pos[0], item.pos[1])
+                    direction.row = row
+                    direction.column = column
+                    if isinstance(item, board_items.BoardComplexItem):
+                        self._move_complex(item, direction)
+                    else:
+                        self._move_simple(item, direction)
+                    if (item.pos[0], item.pos[1]) != position:
+                        moved.add(item)
+        finally:
+            self.__moving_many = False
+        moved = [entry[0] for entry in accepted if entry[0] in moved]
+        self.notify(self, "pygamelib.engine.Board.move_many:items_moved", moved)
+        return moved
+
+    def __accumulate(self, item, row, column):
+        # Add a movement to the accumulator of an item and take the entire cells out
+        # of it.
+        accumulator = item._accumulator
+        accumulator.row += row
+        accumulator.column += column
+        rounded_row = round(accumulator.row - accumulator.row % 1)
+        accumulator.row -= rounded_row
+        rounded_column = round(accumulator.column - accumulator.column % 1)
+        accumulator.column -= rounded_column
+        return rounded_row, rounded_column
+
+    def _move_all(self, moves):
+        # Move simple items by (item, row, column) displacements without resolving
+        # the conflicts between them (overlappable items like projectiles can share
+        # cells) and send a single event for the whole batch.
+        direction = base.Vector2D()
+        moved = []
+        self.__moving_many = True
+        try:
+            for item, row, column in moves:
+                position = (item.pos[0], item.pos[1])
+                direction.row = row
+                direction.column = column
+                self._move_simple(item, direction)
+                if (item.pos[0], item.pos[1]) != position:
+                    moved.append(item)
+        finally:
+            self.__moving_many = False
+        self.notify(self, "pygamelib.engine.Board.move_many:items_moved", moved)
+        return moved
+
+    def _top_items(self, positions):
+        # The top item (the parent of a complex item part) of each (row, column)
+        # position, or None when the cell only holds void. The spatial index is
+        # probed instead of the cells.
+        cells = self.__spatial_index.cells
+        stream = self.__stream_path is not None
+        tops = []
+        for position in positions:
+            if stream:
+                self.__stream_cell(position[0], position[1])
+            items = cells.get(position)
+            if not items:
+                tops.append(None)
+                continue
+            item = self._matrix[position][-1]
+            if isinstance(item.parent, board_items.BoardComplexItem):
+                item = item.parent
+            tops.append(item)
+        return tops
+
+    def notify(self, modifier=None, attribute=None, value=None):
+        """
+        Notify all the observers that a change occurred.
+
+        .. versionchanged:: 1.4.0
+           The placements and removals done by :meth:`move_many` are not notified one
+           by one (a single event is sent for the whole batch).
+
+        See :meth:`pygamelib.base.PglBaseObject.notify` for the parameters.
+        """
+        if self.__moving_many and attribute in (
+            "pygamelib.engine.Board.place_item:item_placed",
+            "pygamelib.engine.Board.remove_item:item_removed",
+        ):
+            return
+        super().notify(modifier, attribute, value)
+
     def _move_simple(self, item, direction, step=1):
         # Since the user is not supposed to call directly that method we assume that it
         # is called by move(), therefor the item is a subclass of Movable.
@@ -1311,6 +2280,13 @@ class Board(base.PglBaseObject):
             and new_row < self.size[1]
             and new_column < self.size[0]
         ):
+            # A cell that was never used is void: the item can just be moved there.
+            if self.__stream_path is not None:
+                self.__stream_cell(new_row, new_column)
+            if self._matrix[new_row, new_column] is None and self.__relocate(
+                item, new_row, new_column
+            ):
+                return
             # Then, we check if the item is actionable and if so, if the item
             # is allowed to activate it.
             # (1.3.0+) item without a third parameter returns the item from the top
@@ -1355,21 +2331,74 @@ class Board(base.PglBaseObject):
                 # Before 1.3.0 only Immovable objects were restorable. After, all
                 # BoardItems can be restorable. So the check for Immovable have been
                 # removed.
-                self.clear_cell(item.pos[0], item.pos[1], item.pos[2])
-                self.place_item(item, new_row, new_column, dest_item.pos[2])
+                if not self.__relocate(item, new_row, new_column):
+                    self.clear_cell(item.pos[0], item.pos[1], item.pos[2])
+                    self.place_item(item, new_row, new_column, dest_item.pos[2])
+
+    def __relocate(self, item, new_row, new_column):
+        # Move an item that is on top of its cell to a void cell, or on top of a stack
+        # of overlappable and restorable items, by moving it between the layers lists:
+        # it is what clear_cell() and place_item() would do, without creating void
+        # items for the layers that are left.
+        row, column, layer = item.pos
+        source = self._matrix[row, column]
+        if source is None or len(source) != layer + 1 or source[layer] is not item:
+            return False
+        destination = self._matrix[new_row, new_column]
+        if destination is not None and (
+            len(destination) != 1
+            or type(destination[0]) is not board_items.BoardItemVoid
+            or destination[0]._sprixel is not self.__void
+        ):
+            for other in destination[min(layer, len(destination) - 1) :]:
+                if (
+                    isinstance(other, board_items.BoardItemVoid)
+                    or isinstance(other.parent, board_items.BoardComplexItem)
+                    or not other.restorable()
+                    or not other.overlappable()
+                ):
+                    return False
+            new_layer = len(destination)
+            destination.append(item)
+        else:
+            if destination is not None:
+                self.__untrack(destination[0])
+            if (
+                item._sprixel is not None
+                and item._sprixel.is_bg_transparent
+                and item._sprixel.bg_color != self.__void.bg_color
+            ):
+                item.mutable_sprixel().bg_color = self.__void.bg_color
+            new_layer = 0
+            self._matrix[new_row, new_column] = [item]
+        if layer == 0:
+            self._matrix[row, column] = None
+        else:
+            source.pop()
+            self._clean_layers(row, column)
+        item.store_position(new_row, new_column, new_layer)
+        for cell_row, cell_column in ((row, column), (new_row, new_column)):
+            self.__invalidate_cell(cell_row, cell_column)
+            self.__index_cell(cell_row, cell_column)
+        if item in self._movables or item in self._immovables:
+            self.__broadphase.update(item)
+        self.notify(self, "pygamelib.engine.Board.place_item:item_placed", item)
+        return True
 
     def _create_missing_layers(self, row, column, target_layer):
         # Create the layers that are missing between the current layer stack and
         # target_layer
-        for i in range(len(self._matrix[row][column]), target_layer + 1):
-            self._matrix[row][column].append(None)
+        cell = self.__cell(row, column)
+        for i in range(len(cell), target_layer + 1):
+            cell.append(None)
             self.init_cell(row, column, i)
 
     def _adjust_items_layers(self, row, column, layer, value):
         # Adjust the layers of all items over the specified layer by value.
         # WARNING: call that method AFTER creating or removing layers !!
-        for lidx in range(layer, len(self._matrix[row][column])):
-            self._matrix[row][column][lidx].pos[2] += value
+        cell = self.__cell(row, column)
+        for lidx in range(layer, len(cell)):
+            cell[lidx].pos[2] += value
 
     def clear_cell(self, row, column, layer=0):
         """Clear cell (row, column, layer)
@@ -1405,7 +2434,8 @@ class Board(base.PglBaseObject):
            catch an IndexError exception
 
         """
-        if layer >= len(self._matrix[row][column]):
+        cell = self.__cell(row, column)
+        if layer >= len(cell):
             # If the layer is greater than the number of layers, there's nothing to do
             # so we just return.
             # NOTE: That design choice is discutable. I think it could be better to
@@ -1426,6 +2456,8 @@ class Board(base.PglBaseObject):
             and item.particle_emitter in self._particle_emitters
         ):
             self._particle_emitters.discard(item.particle_emitter)
+        self.__untrack(item)
+        self.__invalidate_cell(row, column)
         # self._matrix[row][column][layer] = None
         # self.init_cell(row, column, layer)
 
@@ -1433,35 +2465,131 @@ class Board(base.PglBaseObject):
             # If the layer to clear is 0 there is nothing under it, so we
             # just put a void item.
             self.init_cell(row, column, 0)
-        elif layer == len(self._matrix[row][column]) - 1:
+        elif layer == len(cell) - 1:
             # If the layer is the last one we just remove it
-            self._matrix[row][column].pop(layer)
+            cell.pop(layer)
             # Then we make sure that no void layers remains under it.
             self._clean_layers(row, column)
-        elif layer < len(self._matrix[row][column]) - 1 and layer > 0:
+        elif layer < len(cell) - 1 and layer > 0:
             # If the layer is neither the first or last
-            if self._matrix[row][column][-1]._auto_layer:
-                self._matrix[row][column].pop(layer)
+            if cell[-1]._auto_layer:
+                cell.pop(layer)
                 self._adjust_items_layers(row, column, layer, -1)
             else:
                 self.init_cell(row, column, layer)
 
         # Now making sure that we are not leaving a cell with no layer
-        if len(self._matrix[row][column]) <= 0:
+        if len(cell) <= 0:
             # Since it is not supposed to happen it is a tough one to test. Excluding
             # for now.
-            self._matrix[row][column].append(
-                self.generate_void_cell()
-            )  # pragma: no cover
+            cell.append(self.generate_void_cell())  # pragma: no cover
+            self.__track(cell[0])  # pragma: no cover
+        self.__index_cell(row, column)
+
+    def __track(self, item):
+        # Watch an item and its sprixel to invalidate its cell when they change.
+        item.attach(self)
+        sprixel = item._sprixel
+        self.__tracked_items[item] = sprixel
+        # Shared sprixels are immutable, no need to watch them.
+        if sprixel is None or type(sprixel) is core.SharedSprixel:
+            return
+        entry = self.__sprixel_items.get(id(sprixel))
+        if entry is None:
+            entry = (sprixel, set())
+            self.__sprixel_items[id(sprixel)] = entry
+            sprixel.attach(self)
+        entry[1].add(item)
+
+    def __untrack(self, item):
+        sprixel = self.__tracked_items.pop(item, None)
+        item.detach(self)
+        if sprixel is None:
+            return
+        entry = self.__sprixel_items.get(id(sprixel))
+        if entry is not None and entry[0] is sprixel:
+            entry[1].discard(item)
+            if len(entry[1]) == 0:
+                del self.__sprixel_items[id(sprixel)]
+                sprixel.detach(self)
+
+    def handle_notification(self, subject, attribute=None, value=None):
+        """
+        A virtual method that needs to be implemented by the observer.
+        By default it does nothing but each observer needs to implement it if something
+        needs to be done when notified.
+
+        The Board watches the items placed on it and their sprixels. When a sprixel is
+        modified or replaced, the cell of the item is rendered again.
+
+        .. versionadded:: 1.4.0
+
+        :param subject: The object that has changed.
+        :type subject: :class:`~pygamelib.base.PglBaseObject`
+        :param attribute: The attribute that has changed, it is usually a "FQDN style"
+           string. This can be None.
+        :type attribute: str
+        :param value: The new value of the attribute. This can be None.
+        :type value: Any
+        """
+        if attribute in (
+            "pygamelib.board_items.BoardItem.type:changed",
+            "pygamelib.board_items.BoardItem.name:changed",
+            "pygamelib.board_items.BoardItem.animation:changed",
+        ):
+            self._movables.update(subject)
+            self._immovables.update(subject)
+        elif attribute == "pygamelib.board_items.BoardItem.sprixel:changed":
+            if subject in self.__tracked_items:
+                self.__untrack(subject)
+                self.__track(subject)
+                self.__invalidate_cell(subject.row, subject.column)
+        elif isinstance(subject, core.Sprixel):
+            entry = self.__sprixel_items.get(id(subject))
+            if entry is not None and entry[0] is subject:
+                for item in entry[1]:
+                    self.__invalidate_cell(item.row, item.column)
+
+    def __invalidate_cell(self, row, column):
+        # A cell changed: it needs to be resolved again and, if the board is streamed,
+        # its chunk needs to be saved before being evicted.
+        self.__visible_sprixels[row, column] = None
+        if self.__stream_path is not None:
+            self.__dirty_chunks.add((row // self.chunk_size, column // self.chunk_size))
+
+    def __index_cell(self, row, column):
+        # Update the spatial index with the non void items of a cell.
+        if row < 0:
+            row += self.size[1]
+        if column < 0:
+            column += self.size[0]
+        self.__spatial_index.update(
+            row,
+            column,
+            [
+                item
+                for item in self._matrix[row, column] or ()
+                if not isinstance(item, board_items.BoardItemVoid)
+            ],
+        )
+
+    def __visible_sprixel(self, row, column):
+        # Resolve the sprixel of a cell and cache it. The cells with particle emitters
+        # are not cached because render_cell() also updates the emitters positions.
+        sprixel = self.render_cell(row, column)
+        self.__irregular_cells[row, column] = sprixel.length != 1
+        for item in self._matrix[row, column] or ():
+            if getattr(item, "particle_emitter", None) is not None:
+                return sprixel
+        self.__visible_sprixels[row, column] = sprixel
+        return sprixel
 
     def _clean_layers(self, row, column):
-        layer = len(self._matrix[row][column]) - 1
+        cell = self.__cell(row, column)
+        layer = len(cell) - 1
         while 1:
-            if (
-                isinstance(self._matrix[row][column][layer], board_items.BoardItemVoid)
-                and layer > 0
-            ):
-                self._matrix[row][column].pop(layer)
+            if isinstance(cell[layer], board_items.BoardItemVoid) and layer > 0:
+                cell.pop(layer)
                 layer -= 1
             else:
                 # This statement is tested in test_engine_screen.py in the
@@ -1469,11 +2597,20 @@ class Board(base.PglBaseObject):
                 # infinite loop).
                 break  # pragma: no cover
 
-    def get_movables(self, **kwargs):
+    def get_movables(self, item_class=None, **kwargs):
         """Return a list of all the Movable objects in the Board.
 
         See :class:`pygamelib.board_items.Movable` for more on a Movable object.
 
+        .. versionchanged:: 1.4.0
+           The movables are indexed by class, type and name (the substrings of the
+           types and names included): the cost of a query depends on the number of
+           items that match and not on the total number of items. The item_class
+           parameter was added.
+
+        :param item_class: An optional class: only the instances of that class (or of
+           its subclasses) are returned.
+        :type item_class: type
         :param ``**kwargs``: an optional dictionnary with keys matching
             Movables class members and value being something contained
             in that member.
@@ -1486,26 +2623,46 @@ class Board(base.PglBaseObject):
 
             # Get all the Movable objects that has a type that contains "foe"
             foes = myboard.get_movables(type="foe")
+            # Get all the NPCs
+            npcs = myboard.get_movables(board_items.NPC)
         """
-        if kwargs:
-            retvals = []
-            for item in self._movables:
-                counter = 0
-                for arg_key, arg_value in kwargs.items():
-                    if arg_value in getattr(item, arg_key):
-                        counter += 1
-                if counter == len(kwargs):
-                    retvals.append(item)
-            return retvals
-        else:
-            return list(self._movables)
+        return list(self._movables.query(item_class, kwargs))
+
+    def iter_movables(self, item_class=None, **kwargs):
+        """Return an iterator over the Movable objects in the Board.
+
+        It accepts the same parameters than :meth:`get_movables` but does not build
+        a list.
 
-    def get_immovables(self, **kwargs):
+        .. versionadded:: 1.4.0
+
+        .. warning:: Do not place, move or remove items on the board while iterating,
+           use :meth:`get_movables` for that.
+
+        :return: An iterator over Movable items
+
+        Example::
+
+            for foe in myboard.iter_movables(type="foe"):
+                foe.actuator.pause()
+        """
+        return self._movables.query(item_class, kwargs)
+
+    def get_immovables(self, item_class=None, **kwargs):
         """Return a list of all the Immovable objects in the Board.
 
         See :class:`pygamelib.board_items.Immovable` for more on
             an Immovable object.
 
+        .. versionchanged:: 1.4.0
+           The immovables are indexed by class, type and name (the substrings of the
+           types and names included): the cost of a query depends on the number of
+           items that match and not on the total number of items. The item_class
+           parameter was added.
+
+        :param item_class: An optional class: only the instances of that class (or of
+           its subclasses) are returned.
+        :type item_class: type
         :param ``**kwargs``: an optional dictionnary with keys matching
             Immovables class members and value being something
             **contained** in that member.
@@ -1521,18 +2678,27 @@ class Board(base.PglBaseObject):
             walls = myboard.get_immovables(type="wall",name="fire")
 
         """
-        if kwargs:
-            retvals = []
-            for item in self._immovables:
-                counter = 0
-                for arg_key, arg_value in kwargs.items():
-                    if arg_value in getattr(item, arg_key):
-                        counter += 1
-                if counter == len(kwargs):
-                    retvals.append(item)
-            return retvals
-        else:
-            return list(self._immovables)
+        return list(self._immovables.query(item_class, kwargs))
+
+    def iter_immovables(self, item_class=None, **kwargs):
+        """Return an iterator over the Immovable objects in the Board.
+
+        It accepts the same parameters than :meth:`get_immovables` but does not build
+        a list.
+
+        .. versionadded:: 1.4.0
+
+        .. warning:: Do not place, move or remove items on the board while iterating,
+           use :meth:`get_immovables` for that.
+
+        :return: An iterator over Immovable items
+
+        Example::
+
+            for trap in myboard.iter_immovables(type="trap."):
+                trap.activate()
+        """
+        return self._immovables.query(item_class, kwargs)
 
     def serialize(self):
         """Return a serialized version of the board.
@@ -1544,6 +2710,28 @@ class Board(base.PglBaseObject):
             serialized_board_data = myboard.serialize()
 
         """
+        data = self.__settings()
+        data["map_data"] = {}
+
+        # Now we need to run through all the cells to store
+        # anything that is not a BoardItemVoid
+        self.__serialize_cells(self.__cells(), data["map_data"])
+
+        return data
+
+    @staticmethod
+    def __serialize_cells(cells, map_data):
+        # Store the serialized items (but the void items and the players) of the cells
+        # into map_data.
+        for y in cells:
+            for z in y:
+                if not isinstance(z, board_items.BoardItemVoid) and not isinstance(
+                    z, board_items.Player
+                ):
+                    map_data[str((z.row, z.column, z.layer))] = z.serialize()
+
+    def __settings(self):
+        # The serialized attributes of the board (everything but its content).
         data = {}
         data["name"] = self.name
         # Mostly to differentiate from serialization by Game.save_board() from pygamelib
@@ -1568,20 +2756,8 @@ class Board(base.PglBaseObject):
         data["partial_display_viewport"] = self.partial_display_viewport
         data["partial_display_focus"] = self.partial_display_focus
         data["enable_partial_display"] = self.enable_partial_display
-        data["map_data"] = {}
-
-        # Now we need to run through all the cells to store
-        # anything that is not a BoardItemVoid
-        for x in self._matrix:
-            for y in x:
-                for z in y:
-                    if not isinstance(z, board_items.BoardItemVoid) and not isinstance(
-                        z, board_items.Player
-                    ):
-                        data["map_data"][
-                            str((z.row, z.column, z.layer))
-                        ] = z.serialize()
-
+        data["chunked"] = self.chunked
+        data["chunk_size"] = self.chunk_size
         return data
 
     @classmethod
@@ -1626,6 +2802,8 @@ class Board(base.PglBaseObject):
                 partial_display_viewport=data["partial_display_viewport"],
                 partial_display_focus=data["partial_display_focus"],
                 enable_partial_display=data["enable_partial_display"],
+                chunked=data.get("chunked", False),
+                chunk_size=data.get("chunk_size", 32),
             )
             for k in data["map_data"].keys():
                 (r, c, l) = ast.literal_eval(k)
@@ -1634,6 +2812,297 @@ class Board(base.PglBaseObject):
                     tmp.place_item(item, r, c, l)
         return tmp
 
+    @property
+    def stream_path(self):
+        """
+        The directory the board is streamed from or None if the board is entirely in
+        memory (see :meth:`load_streamed`). This property is read only.
+
+        .. versionadded:: 1.4.0
+        """
+        return self.__stream_path
+
+    @classmethod
+    def load_streamed(cls, path: str):
+        """
+        Open a board saved with :meth:`save_streamed` without loading its content.
+
+        The returned board is chunked (see the chunked parameter of the constructor)
+        and its chunks are loaded from the disk when they are needed:
+
+        * when a cell is accessed (by :meth:`item`, :meth:`place_item`,
+          :meth:`render_cell`, :meth:`neighbors`, etc.),
+        * when the area that is rendered by :meth:`render_to_buffer` (the viewport if
+          partial display is enabled) approaches them,
+        * when :meth:`stream_area` is called for an area that approaches them.
+
+        The chunks that are far from all the areas streamed since the last rendering
+        are evicted (see :meth:`evict_chunks`). The memory used by a streamed board
+        and the time to load it do not depend on the size of the world. The number of
+        chunks that are loaded around the streamed areas is set by the
+        streaming_margin attribute of the board (default: 1).
+
+        The Board emits the :boldblue:`pygamelib.engine.Board.chunk:loaded` and
+        :boldblue:`pygamelib.engine.Board.chunk:evicted` events, their
+        :blue:`value` is the list of items of the chunk.
+
+        .. versionadded:: 1.4.0
+
+        .. Important:: A chunk is saved when it is evicted only if it was modified
+           through the board (items placed, moved, removed or their sprixels changed).
+
+        :param path: The directory of the board.
+        :type path: str
+        :returns: A new Board.
+        :rtype: :class:`Board`
+
+        Example::
+
+            world = Board.load_streamed("worlds/overworld")
+            world.enable_partial_display = True
+            world.partial_display_viewport = [10, 20]
+            world.place_item(player, 5000, 5000)
+        """
+        with open(os.path.join(path, "board.json"), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        data["chunked"] = True
+        data["map_data"] = {}
+        board = cls.load(data)
+        board.__stream_path = path
+        for filename in os.listdir(os.path.join(path, "chunks")):
+            name, extension = os.path.splitext(filename)
+            if extension == ".json":
+                chunk_row, chunk_column = name.split("_")
+                board.__stored_chunks.add((int(chunk_row), int(chunk_column)))
+        return board
+
+    def save_streamed(self, path: str) -> None:
+        """
+        Save the board in the streaming format: a directory that contains the settings
+        of the board (board.json) and a file for each chunk of chunk_size x chunk_size
+        cells that has items (in the chunks sub-directory). Like with
+        :meth:`serialize`, the players are not saved.
+
+        Any board can be saved that way. If the board is streamed from path, only the
+        chunks that were modified are written.
+
+        .. versionadded:: 1.4.0
+
+        :param path: The directory to save the board into. It is created if needed.
+        :type path: str
+
+        Example::
+
+            world.save_streamed("worlds/overworld")
+            world = Board.load_streamed("worlds/overworld")
+        """
+        chunks_path = os.path.join(path, "chunks")
+        os.makedirs(chunks_path, exist_ok=True)
+        size = self.chunk_size
+        cells = {}
+        for cell in self.__cells():
+            chunk_key = (cell[0].row // size, cell[0].column // size)
+            cells.setdefault(chunk_key, []).append(cell)
+        in_place = self.__stream_path is not None and os.path.abspath(
+            path
+        ) == os.path.abspath(self.__stream_path)
+        if in_place:
+            keys = set(self.__dirty_chunks)
+            self.__dirty_chunks = set()
+        else:
+            keys = set(cells.keys())
+            for filename in os.listdir(chunks_path):
+                if os.path.splitext(filename)[1] == ".json":
+                    os.remove(os.path.join(chunks_path, filename))
+            if self.__stream_path is not None:
+                # The chunks that are not loaded are copied as is.
+                for chunk_key in self.__stored_chunks - self.__loaded_chunks:
+                    shutil.copyfile(
+                        self.__chunk_file(self.__stream_path, chunk_key),
+                        self.__chunk_file(path, chunk_key),
+                    )
+        for chunk_key in keys:
+            map_data = {}
+            self.__serialize_cells(cells.get(chunk_key, []), map_data)
+            self.__write_chunk(path, chunk_key, map_data)
+        data = self.__settings()
+        # The focus is an item (or a vector) of the board, it is not saved.
+        data["partial_display_focus"] = None
+        data["map_data"] = {}
+        with open(os.path.join(path, "board.json"), "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+    def stream_area(self, row: int, column: int, height: int, width: int) -> None:
+        """
+        Load the chunks of a streamed board (see :meth:`load_streamed`) that are in an
+        area or less than streaming_margin chunks away from it. The area is
+        kept in memory until the next call to :meth:`evict_chunks`.
+
+        It is automatically called for the rendered area by :meth:`render_to_buffer`.
+        Call it for the areas that are simulated (around the NPCs that need to move
+        for example) before the board is rendered.
+
+        It does nothing if the board is not streamed.
+
+        .. versionadded:: 1.4.0
+
+        :param row: The row of the top left corner of the area.
+        :type row: int
+        :param column: The column of the top left corner of the area.
+        :type column: int
+        :param height: The height of the area.
+        :type height: int
+        :param width: The width of the area.
+        :type width: int
+
+        Example::
+
+            world.stream_area(player.row - 50, player.column - 50, 100, 100)
+        """
+        if self.__stream_path is None or height <= 0 or width <= 0:
+            return
+        size = self.chunk_size
+        margin = self.streaming_margin
+        top = max(row // size - margin, 0)
+        left = max(column // size - margin, 0)
+        bottom = min((row + height - 1) // size + margin, (self.size[1] - 1) // size)
+        right = min((column + width - 1) // size + margin, (self.size[0] - 1) // size)
+        self.__stream_areas.append((top, left, bottom, right))
+        for chunk_row in range(top, bottom + 1):
+            for chunk_column in range(left, right + 1):
+                if (chunk_row, chunk_column) not in self.__loaded_chunks:
+                    self.__load_chunk((chunk_row, chunk_column))
+
+    def evict_chunks(self) -> None:
+        """
+        Evict the loaded chunks of a streamed board (see :meth:`load_streamed`) that
+        are more than streaming_margin + 1 chunks away from all the areas
+        streamed since the last eviction. The modified chunks are saved before being
+        evicted. The chunks that contain a :class:`~pygamelib.board_items.Player` or
+        the partial display focus are always kept.
+
+        It is automatically called at the end of :meth:`render_to_buffer`.
+
+        It does nothing if the board is not streamed or if no area was streamed since
+        the last eviction.
+
+        .. versionadded:: 1.4.0
+
+        Example::
+
+            world.stream_area(0, 0, 100, 100)
+            world.evict_chunks()
+        """
+        if self.__stream_path is None or not self.__stream_areas:
+            return
+        areas = self.__stream_areas
+        self.__stream_areas = []
+        for chunk_key in list(self.__loaded_chunks):
+            for top, left, bottom, right in areas:
+                if (
+                    top - 1 <= chunk_key[0] <= bottom + 1
+                    and left - 1 <= chunk_key[1] <= right + 1
+                ):
+                    break
+            else:
+                self.__evict_chunk(chunk_key)
+
+    def __stream_cell(self, row, column):
+        # Load the chunk of a cell if it is not already.
+        if row < 0:
+            row += self.size[1]
+        if column < 0:
+            column += self.size[0]
+        chunk_key = (row // self.chunk_size, column // self.chunk_size)
+        if (
+            chunk_key not in self.__loaded_chunks
+            and 0 <= row < self.size[1]
+            and 0 <= column < self.size[0]
+        ):
+            self.__load_chunk(chunk_key)
+
+    def __load_chunk(self, chunk_key):
+        self.__loaded_chunks.add(chunk_key)
+        items = []
+        if chunk_key in self.__stored_chunks:
+            with open(
+                self.__chunk_file(self.__stream_path, chunk_key), "r", encoding="utf-8"
+            ) as f:
+                map_data = json.load(f)["map_data"]
+            for k in map_data.keys():
+                (r, c, l) = ast.literal_eval(k)
+                item = Board.instantiate_item(map_data[k])
+                if item is not None:
+                    self.place_item(item, r, c, l)
+                    items.append(item)
+        # Loading is not modifying.
+        self.__dirty_chunks.discard(chunk_key)
+        self.notify(self, "pygamelib.engine.Board.chunk:loaded", items)
+
+    def __evict_chunk(self, chunk_key):
+        chunk = self._matrix.chunks.get(chunk_key)
+        items = []
+        if chunk is not None:
+            cells = [cell for cell in chunk.flat if cell is not None]
+            focus = self.partial_display_focus
+            for cell in cells:
+                for item in cell:
+                    if isinstance(item, board_items.Player) or (
+                        focus is not None and (item is focus or item.parent is focus)
+                    ):
+                        return
+            if chunk_key in self.__dirty_chunks:
+                map_data = {}
+                self.__serialize_cells(cells, map_data)
+                self.__write_chunk(self.__stream_path, chunk_key, map_data)
+            for cell in cells:
+                for item in cell:
+                    self.__untrack(item)
+                    if getattr(item, "particle_emitter", None) is not None:
+                        self._particle_emitters.discard(item.particle_emitter)
+                    if isinstance(item.parent, board_items.BoardComplexItem):
+                        item = item.parent
+                    self._movables.discard(item)
+                    self._immovables.discard(item)
+                    if not isinstance(item, board_items.BoardItemVoid) and (
+                        item not in items
+                    ):
+                        items.append(item)
+        for grid in (self._matrix, self.__visible_sprixels, self.__irregular_cells):
+            grid.chunks.pop(chunk_key, None)
+        top = chunk_key[0] * self.chunk_size
+        left = chunk_key[1] * self.chunk_size
+        for row, column in {
+            (row, column)
+            for row, column, item in self.__spatial_index.query(
+                top, left, top + self.chunk_size - 1, left + self.chunk_size - 1
+            )
+        }:
+            self.__spatial_index.update(row, column, None)
+        self.__loaded_chunks.discard(chunk_key)
+        self.__dirty_chunks.discard(chunk_key)
+        self.notify(self, "pygamelib.engine.Board.chunk:evicted", items)
+
+    @staticmethod
+    def __chunk_file(path, chunk_key):
+        return os.path.join(path, "chunks", f"{chunk_key[0]}_{chunk_key[1]}.json")
+
+    def __write_chunk(self, path, chunk_key, map_data):
+        # Write a chunk, or remove its file if it is empty.
+        filename = self.__chunk_file(path, chunk_key)
+        if len(map_data) > 0:
+            with open(filename, "w", encoding="utf-8") as f:
+                json.dump({"map_data": map_data}, f)
+        elif os.path.exists(filename):
+            os.remove(filename)
+        if self.__stream_path is not None and os.path.abspath(
+            path
+        ) == os.path.abspath(self.__stream_path):
+            if len(map_data) > 0:
+                self.__stored_chunks.add(chunk_key)
+            else:
+                self.__stored_chunks.discard(chunk_key)
+
     @staticmethod
     def instantiate_item(data: dict):
         """Instantiate a BoardItem from its serialized data.
@@ -1677,6 +3146,16 @@ class Board(base.PglBaseObject):
         This method returns a list of objects that are all around an object between the
         position of an object and all the cells at **radius**.
 
+        The top item of each cell around the object is returned (the parts of a
+        :class:`~pygamelib.board_items.BoardComplexItem` are returned as the complex
+        item itself), sorted by position. The cell of the object and the object itself
+        are excluded. Use :meth:`items_in_area` to get the items of all the layers.
+
+        .. versionchanged:: 1.4.0
+           The neighbors are found through the spatial index of the board: only the
+           occupied cells around the object are visited. The search does not wrap
+           around the edges of the board anymore.
+
         :param radius: The radius in which non void item should be included
         :type radius: int
         :param obj: The central object. The neighbors are calculated for that object.
@@ -1700,18 +3179,662 @@ class Board(base.PglBaseObject):
                 "In Board.neighbors(object, radius), object must be a BoardItem."
                 f" Got {obj} of type {type(obj)} instead."
             )
-        return_array = []
-        for x in range(-radius, radius + 1, 1):
-            for y in range(-radius, radius + 1, 1):
-                if x == 0 and y == 0:
+        return self.__neighbors(obj, radius)
+
+    def batch_neighbors(self, objects, radius: int = 1) -> dict:
+        """Returns the neighbors of many objects in one call.
+
+        It is the same as calling :meth:`neighbors` for each object, but the
+        parameters are checked only once.
+
+        .. versionadded:: 1.4.0
+
+        :param objects: The central objects.
+        :type objects: list
+        :param radius: The radius in which non void item should be included
+        :type radius: int
+        :return: A dictionary with the objects as keys and their lists of neighbors as
+           values.
+        :rtype: dict
+        :raises PglInvalidTypeException: If radius is not an int or if one of the
+           objects is not a BoardItem.
+
+        Example::
+
+            ghosts = board.get_movables(type="ghost")
+            for ghost, items in board.batch_neighbors(ghosts, 2).items():
+                if game.player in items:
+                    ghost.actuator.pause()
+        """
+        if type(radius) is not int:
+            raise base.PglInvalidTypeException(
+                "In Board.batch_neighbors(objects, radius), radius must be an "
+                f"integer. Got {radius} of type {type(radius)} instead."
+            )
+        objects = list(objects)
+        for obj in objects:
+            if not isinstance(obj, board_items.BoardItem):
+                raise base.PglInvalidTypeException(
+                    "In Board.batch_neighbors(objects, radius), objects must be "
+                    f"BoardItems. Got {obj} of type {type(obj)} instead."
+                )
+        return {obj: self.__neighbors(obj, radius) for obj in objects}
+
+    def items_in_area(self, row: int, column: int, height: int, width: int) -> list:
+        """Returns the items (non void) of a rectangular area of the board.
+
+        The items of all the layers are returned, sorted by position. The parts of a
+        :class:`~pygamelib.board_items.BoardComplexItem` are returned as the complex
+        item itself. The area is clipped to the board.
+
+        .. versionadded:: 1.4.0
+
+        :param row: The row of the top left corner of the area.
+        :type row: int
+        :param column: The column of the top left corner of the area.
+        :type column: int
+        :param height: The height of the area.
+        :type height: int
+        :param width: The width of the area.
+        :type width: int
+        :return: A list of BoardItem. No BoardItemVoid is included.
+        :rtype: list
+        :raises PglInvalidTypeException: If one of the parameters is not an int.
+
+        Example::
+
+            # Everything in the top left room.
+            room_items = board.items_in_area(0, 0, 10, 20)
+        """
+        for value in (row, column, height, width):
+            if type(value) is not int:
+                raise base.PglInvalidTypeException(
+                    "In Board.items_in_area(row, column, height, width), all "
+                    f"parameters must be integers. Got {value} of type {type(value)}"
+                    " instead."
+                )
+        return self.__sorted_items(
+            self.__query(row, column, row + height - 1, column + width - 1)
+        )
+
+    def items_in_radius(self, row: int, column: int, radius: int) -> list:
+        """Returns the items (non void) around a position, up to **radius** cells away.
+
+        Like :meth:`neighbors` the radius is a number of cells in every direction
+        (including the diagonals). The items at the position itself are returned too.
+
+        .. versionadded:: 1.4.0
+
+        :param row: The row of the center.
+        :type row: int
+        :param column: The column of the center.
+        :type column: int
+        :param radius: The radius in which non void item should be included
+        :type radius: int
+        :return: A list of BoardItem. No BoardItemVoid is included.
+        :rtype: list
+        :raises PglInvalidTypeException: If one of the parameters is not an int.
+
+        Example::
+
+            # The blast of an explosion.
+            for item in board.items_in_radius(bomb.row, bomb.column, 3):
+                if isinstance(item, board_items.Movable):
+                    item.hp -= 10
+        """
+        for value in (row, column, radius):
+            if type(value) is not int:
+                raise base.PglInvalidTypeException(
+                    "In Board.items_in_radius(row, column, radius), all parameters "
+                    f"must be integers. Got {value} of type {type(value)} instead."
+                )
+        return self.__sorted_items(
+            self.__query(row - radius, column - radius, row + radius, column + radius)
+        )
+
+    def nearest_items(self, obj, count: int = 1, radius: int = None) -> list:
+        """Returns the **count** items (non void) that are the nearest to an object.
+
+        The distance is the number of cells between the footprint of the object and
+        the items (like the radius of :meth:`neighbors`), the ties are broken by the
+        euclidean distance. The search stops at **radius** cells from the object (or
+        at the edges of the board if radius is None), so less than **count** items
+        can be returned.
+
+        .. versionadded:: 1.4.0
+
+        :param obj: The central object.
+        :type obj: :class:`~pygamelib.board_items.BoardItem`
+        :param count: The maximum number of items to return.
+        :type count: int
+        :param radius: The maximum distance of the items. None means no limit.
+        :type radius: int
+        :return: A list of BoardItem, the nearest first. No BoardItemVoid is included.
+        :rtype: list
+        :raises PglInvalidTypeException: If obj is not a BoardItem, if count is not a
+           positive int or if radius is neither None nor an int.
+
+        Example::
+
+            target = board.nearest_items(turret, radius=10)
+            if target:
+                turret.aim(target[0])
+        """
+        if not isinstance(obj, board_items.BoardItem):
+            raise base.PglInvalidTypeException(
+                "In Board.nearest_items(obj, count, radius), obj must be a BoardItem."
+                f" Got {obj} of type {type(obj)} instead."
+            )
+        if type(count) is not int or count < 1:
+            raise base.PglInvalidTypeException(
+                "In Board.nearest_items(obj, count, radius), count must be a positive"
+                f" integer. Got {count} of type {type(count)} instead."
+            )
+        if radius is not None and type(radius) is not int:
+            raise base.PglInvalidTypeException(
+                "In Board.nearest_items(obj, count, radius), radius must be None or "
+                f"an integer. Got {radius} of type {type(radius)} instead."
+            )
+        obj, top, left, bottom, right = self.__footprint(obj)
+        limit = max(self.size) if radius is None else radius
+        # Search in a growing square: all the items at a distance up to the size of
+        # the square are in it, so once it holds enough items they are the nearest.
+        distance = 1
+        while True:
+            distance = min(distance, limit)
+            distances = {}
+            for row, column, item in self.__query(
+                top - distance, left - distance, bottom + distance, right + distance
+            ):
+                if item is obj:
                     continue
-                true_x = obj.pos[0] + x
-                true_y = obj.pos[1] + y
-                if (true_x < self.size[1] and true_y < self.size[0]) and not isinstance(
-                    self.item(true_x, true_y), board_items.BoardItemVoid
-                ):
-                    return_array.append(self.item(true_x, true_y))
-        return return_array
+                delta_row = max(top - row, 0, row - bottom)
+                delta_column = max(left - column, 0, column - right)
+                item_distance = (
+                    max(delta_row, delta_column),
+                    delta_row * delta_row + delta_column * delta_column,
+                )
+                if item not in distances or item_distance < distances[item]:
+                    distances[item] = item_distance
+            if len(distances) >= count or distance >= limit:
+                break
+            distance *= 2
+        return sorted(distances, key=distances.get)[:count]
+
+    def collisions(self, item, projection_offset: base.Vector2D = None) -> list:
+        """Returns the items of the board that collide with an item.
+
+        Like :meth:`~pygamelib.board_items.BoardItem.collides_with`, the footprints
+        (position and size) of the items are compared and the layers are not taken
+        into account. But instead of testing the items one by one, only the items
+        that are around are tested (the board keeps the footprints of its movable and
+        immovable items in a uniform grid).
+
+        .. versionadded:: 1.4.0
+
+        :param item: The item you want to check for collision. It does not need to be
+           on the board.
+        :type item: :class:`~pygamelib.board_items.BoardItem`
+        :param projection_offset: A vector to offset the position of the item. Use this
+           to detect a collision before moving the item.
+        :type projection_offset: :class:`~pygamelib.base.Vector2D`
+        :return: A list of BoardItem, sorted by position. The item itself is not
+           included.
+        :rtype: list
+        :raises PglInvalidTypeException: If item is not a BoardItem.
+
+        Example::
+
+            move = base.Vector2D(0, 2)
+            if not board.collisions(spaceship, move):
+                board.move(spaceship, move)
+        """
+        if not isinstance(item, board_items.BoardItem):
+            raise base.PglInvalidTypeException(
+                "In Board.collisions(item, projection_offset), item must be a "
+                f"BoardItem. Got {item} of type {type(item)} instead."
+            )
+        offset_row = offset_column = 0
+        if isinstance(projection_offset, base.Vector2D):
+            offset_row = round(projection_offset.row)
+            offset_column = round(projection_offset.column)
+        results = self.__broadphase.query(
+            _BroadPhase.box(item, offset_row, offset_column)
+        )
+        results.discard(item)
+        return sorted(results, key=self.__broadphase.boxes.get)
+
+    def collision_pairs(self, exact: bool = True) -> list:
+        """Returns the pairs of items of the board that collide.
+
+        The board keeps the footprints (position and size) of its movable and
+        immovable items in a uniform grid and only the items that share a cell of that
+        grid are tested against each other. Only the pairs with at least one
+        :class:`~pygamelib.board_items.Movable` are returned: the immovable items
+        cannot start colliding.
+
+        Like :meth:`~pygamelib.board_items.BoardItem.collides_with`, the layers are
+        not taken into account.
+
+        .. versionadded:: 1.4.0
+
+        :param exact: If False, the pairs of items that are close enough to collide
+           (the candidates) are returned without actually testing their footprints.
+        :type exact: bool
+        :return: A list of tuples of 2 items, each tuple sorted by position.
+        :rtype: list
+
+        Example::
+
+            # Once per frame
+            for first, second in board.collision_pairs():
+                if isinstance(first, Bullet) or isinstance(second, Bullet):
+                    explode(first, second)
+        """
+        boxes = self.__broadphase.boxes
+        return sorted(
+            self.__broadphase.pairs(self._movables, exact),
+            key=lambda pair: (boxes[pair[0]], boxes[pair[1]]),
+        )
+
+    def __footprint(self, obj):
+        # The item (a complex item instead of its parts) and the cells it covers.
+        if isinstance(obj.parent, board_items.BoardComplexItem):
+            obj = obj.parent
+        row, column = obj.pos[0], obj.pos[1]
+        if isinstance(obj, board_items.BoardComplexItem):
+            return obj, row, column, row + obj.size[1] - 1, column + obj.size[0] - 1
+        return obj, row, column, row, column
+
+    def __neighbors(self, obj, radius):
+        # The top item of each occupied cell around the position of obj (except its
+        # own cell). The spatial index gives the occupied cells.
+        row, column = obj.pos[0], obj.pos[1]
+        center = self.__footprint(obj)[0]
+        neighbors = []
+        for position in sorted(
+            {
+                (r, c)
+                for r, c, _ in self.__query(
+                    row - radius, column - radius, row + radius, column + radius
+                )
+            }
+        ):
+            if position == (row, column):
+                continue
+            item = self.item(position[0], position[1])
+            if item is not center and not isinstance(item, board_items.BoardItemVoid):
+                neighbors.append(item)
+        return neighbors
+
+    @staticmethod
+    def __sorted_items(results):
+        # The distinct items of (row, column, item) results, sorted by position.
+        positions = {}
+        for row, column, item in results:
+            if item not in positions or (row, column) < positions[item]:
+                positions[item] = (row, column)
+        return sorted(positions, key=positions.get)
+
+    def __query(self, top, left, bottom, right):
+        # The (row, column, item) of the non void items between top/left and
+        # bottom/right (included and clipped to the board). The parts of the complex
+        # items are replaced by the complex items.
+        top = max(top, 0)
+        left = max(left, 0)
+        bottom = min(bottom, self.size[1] - 1)
+        right = min(right, self.size[0] - 1)
+        if top > bottom or left > right:
+            return []
+        if self.__stream_path is not None:
+            size = self.chunk_size
+            for chunk_row in range(top // size, bottom // size + 1):
+                for chunk_column in range(left // size, right // size + 1):
+                    if (chunk_row, chunk_column) not in self.__loaded_chunks:
+                        self.__load_chunk((chunk_row, chunk_column))
+        return [
+            (
+                row,
+                column,
+                item.parent
+                if isinstance(item.parent, board_items.BoardComplexItem)
+                else item,
+            )
+            for row, column, item in self.__spatial_index.query(
+                top, left, bottom, right
+            )
+        ]
+
+
+class ProjectileSystem:
+    """
+    A projectile system moves a large number of projectiles on a board at once.
+
+    :meth:`Game.actuate_projectiles` actuates the projectiles one by one: it asks
+    their actuators for a direction, builds vectors, probes the board and moves each
+    projectile on its own. The projectile system keeps the positions, directions,
+    ranges, steps and movement speeds of its projectiles in NumPy arrays instead. At
+    each :meth:`update` all the projectiles are advanced together, the collisions are
+    detected with a single probe of the board and the moves are applied as a batch.
+
+    The rules are the ones of :meth:`Game.actuate_projectiles`: a projectile hits the
+    first non overlappable item in its path (except the types of its
+    collision_exclusions), a projectile that reaches the end of its range hits a void
+    cell (or its area of effect) and :meth:`~pygamelib.board_items.Projectile.hit` is
+    called in both cases. A projectile that was hit (or whose actuator was stopped)
+    is removed from the board at the next update.
+
+    .. versionadded:: 1.4.0
+
+    .. important:: The direction of a projectile is read once from its actuator when
+       it is added to the system. The PAUSED and STOPPED states of the actuators are
+       respected but, to change the direction of a projectile, you need to
+       :meth:`remove` it and :meth:`add` it again.
+
+    Example::
+
+        bullets = ProjectileSystem(board)
+        for column in range(board.width):
+            bullet = Projectile(direction=Direction.DOWN, range=board.height)
+            bullets.add(bullet, 0, column)
+        while game.state == State.RUNNING:
+            for bullet, objects in bullets.update(game.elapsed_time):
+                print(f"{bullet.name} hit {len(objects)} objects")
+    """
+
+    def __init__(self, board: Board = None) -> None:
+        """
+        :param board: The board the projectiles move on.
+        :type board: :class:`Board`
+
+        Example::
+
+            bullets = ProjectileSystem(game.current_board())
+        """
+        self.board = board
+        self.__projectiles = []
+        self.__pending = []
+        self.__positions = np.zeros((0, 2))
+        self.__deltas = np.zeros((0, 2))
+        self.__ranges = np.zeros(0)
+        self.__steps = np.zeros(0)
+        self.__speeds = np.zeros(0)
+        self.__dtmoves = np.zeros(0)
+
+    def __len__(self):
+        return len(self.__projectiles) + len(self.__pending)
+
+    def __contains__(self, projectile):
+        return projectile in self.__projectiles or any(
+            entry[0] is projectile for entry in self.__pending
+        )
+
+    @property
+    def projectiles(self) -> list:
+        """The projectiles of the system (read only).
+
+        :rtype: list
+
+        Example::
+
+            for bullet in bullets.projectiles:
+                bullet.model = "*"
+        """
+        self.__flush()
+        return list(self.__projectiles)
+
+    def add(self, projectile, row: int, column: int) -> None:
+        """
+        Place a projectile on the board and add it to the system.
+
+        Like in :meth:`Game.add_projectile`, a projectile placed out of the board is
+        ignored and a projectile placed on a non overlappable item hits it
+        immediately. If the projectile does not have an actuator, it is given a
+        RandomActuator that goes right and if its step is None, it is set to 1.
+
+        :param projectile: The projectile to add.
+        :type projectile: :class:`~pygamelib.board_items.Projectile`
+        :param row: The row to place the projectile at.
+        :type row: int
+        :param column: The column to place the projectile at.
+        :type column: int
+        :raises PglInvalidTypeException: If the parameters are not of the correct
+           type.
+
+        Example::
+
+            bullet = Projectile(direction=Direction.UP)
+            bullets.add(bullet, player.row - 1, player.column)
+        """
+        if not isinstance(projectile, board_items.Projectile):
+            raise base.PglInvalidTypeException(
+                "ProjectileSystem.add(projectile, row, column): projectile must be a "
+                "pygamelib.board_items.Projectile."
+            )
+        if type(row) is not int or type(column) is not int:
+            raise base.PglInvalidTypeException(
+                "ProjectileSystem.add(projectile, row, column): row and column must "
+                "be int."
+            )
+        board = self.board
+        if row < 0 or column < 0 or row >= board.height or column >= board.width:
+            return
+        check_object = board.item(row, column)
+        if (
+            not isinstance(check_object, board_items.BoardItemVoid)
+            and not check_object.overlappable()
+        ):
+            if projectile.is_aoe:
+                projectile.hit(board.neighbors(check_object, projectile.aoe_radius))
+            else:
+                projectile.hit([check_object])
+            return
+        if projectile.actuator is None:
+            projectile.actuator = actuators.RandomActuator(moveset=[Direction.RIGHT])
+        if projectile.step is None:
+            projectile.step = 1
+            projectile.step_vertical = 1
+            projectile.step_horizontal = 1
+        direction = projectile.actuator.next_move()
+        if not isinstance(direction, base.Vector2D):
+            direction = base.Vector2D.from_direction(direction, 1)
+        board.place_item(projectile, row, column)
+        self.__pending.append(
+            (
+                projectile,
+                row,
+                column,
+                direction.row * projectile.step_vertical,
+                direction.column * projectile.step_horizontal,
+            )
+        )
+
+    def remove(self, projectile) -> None:
+        """
+        Remove a projectile from the system and from the board.
+
+        :param projectile: The projectile to remove.
+        :type projectile: :class:`~pygamelib.board_items.Projectile`
+
+        Example::
+
+            bullets.remove(bullet)
+        """
+        self.__flush()
+        if projectile not in self.__projectiles:
+            return
+        keep = np.ones(len(self.__projectiles), dtype=bool)
+        keep[self.__projectiles.index(projectile)] = False
+        self.__compact(keep)
+
+    def update(self, elapsed_time: float = 0.0) -> list:
+        """
+        Advance all the projectiles of the system.
+
+        In real time mode (when the board belongs to a :class:`Game` in
+        MODE_REAL_TIME), a projectile only moves when the time elapsed since its last
+        move reaches its movement_speed.
+
+        :meth:`~pygamelib.board_items.Projectile.hit` is called for every hit, after
+        all the projectiles moved.
+
+        :param elapsed_time: The time elapsed since the last update.
+        :type elapsed_time: float
+        :return: The (projectile, objects) pairs of the hits of this update. The
+           objects are the ones that are passed to
+           :meth:`~pygamelib.board_items.Projectile.hit`.
+        :rtype: list
+
+        Example::
+
+            for bullet, objects in bullets.update(game.elapsed_time):
+                score += len(objects)
+        """
+        self.__flush()
+        projectiles = self.__projectiles
+        if not projectiles:
+            return []
+        board = self.board
+        # First, the projectiles that were stopped (by a hit or by the user) and the
+        # ones that are past their range are removed.
+        states = [projectile.actuator.state for projectile in projectiles]
+        running = np.fromiter(
+            (state == State.RUNNING for state in states), dtype=bool, count=len(states)
+        )
+        keep = (self.__ranges >= 0) & np.fromiter(
+            (state != State.STOPPED for state in states), dtype=bool, count=len(states)
+        )
+        if not keep.all():
+            running = running[keep]
+            self.__compact(keep)
+            projectiles = self.__projectiles
+        self.__dtmoves[running] += elapsed_time
+        ready = running
+        parent = board.parent
+        if isinstance(parent, Game) and parent.mode == EngineMode.MODE_REAL_TIME:
+            ready = ready & (self.__dtmoves >= self.__speeds)
+        # Then, the projectiles that ran out of range hit nothing (or their area of
+        # effect) and the other ones are projected on the board.
+        hits = [
+            (index, None)
+            for index in np.flatnonzero(ready & (self.__ranges == 0)).tolist()
+        ]
+        moving = np.flatnonzero(ready & (self.__ranges > 0))
+        targets = self.__positions[moving] + self.__deltas[moving]
+        target_cells = np.floor(targets).astype(int)
+        inside = (
+            (target_cells[:, 0] >= 0)
+            & (target_cells[:, 1] >= 0)
+            & (target_cells[:, 0] < board.height)
+            & (target_cells[:, 1] < board.width)
+        )
+        self.__ranges[moving[~inside]] = 0
+        moving = moving[inside]
+        targets = targets[inside]
+        target_cells = target_cells[inside]
+        offsets = target_cells - np.floor(self.__positions[moving]).astype(int)
+        # The projectiles that change cell check what is in their way.
+        changing = np.flatnonzero(offsets.any(axis=1))
+        blocked = np.zeros(len(moving), dtype=bool)
+        moves = []
+        move_indexes = []
+        indexes = moving.tolist()
+        offsets = offsets.tolist()
+        tops = board._top_items(map(tuple, target_cells[changing].tolist()))
+        for position, item in zip(changing.tolist(), tops):
+            projectile = projectiles[indexes[position]]
+            if (
+                item is not None
+                and item is not projectile
+                and not isinstance(item, board_items.BoardItemVoid)
+                and type(item) not in projectile.collision_exclusions
+                and not item.overlappable()
+            ):
+                blocked[position] = True
+                hits.append((indexes[position], item))
+            else:
+                moves.append((projectile, *offsets[position]))
+                move_indexes.append(indexes[position])
+        moving = moving[~blocked]
+        self.__positions[moving] = targets[~blocked]
+        self.__ranges[moving] -= self.__steps[moving]
+        self.__dtmoves[moving] = 0.0
+        for index in moving.tolist():
+            projectile = projectiles[index]
+            projectile.range -= projectile.step
+        if len(board._move_all(moves)) != len(moves):
+            # The projectiles that could not move (an item that is excluded from the
+            # collisions but is not overlappable is in the way) stay where they are.
+            cells = np.floor(self.__positions[move_indexes]).astype(int).tolist()
+            for index, cell, (projectile, _, _) in zip(move_indexes, cells, moves):
+                if cell != projectile.pos[0:2]:
+                    self.__positions[index] = projectile.pos[0:2]
+        # Finally, the hits are reported.
+        results = []
+        for index, item in sorted(hits, key=lambda hit: hit[0]):
+            projectile = projectiles[index]
+            if projectile.is_aoe:
+                objects = board.neighbors(projectile, projectile.aoe_radius)
+            elif item is None:
+                objects = [board.generate_void_cell()]
+            else:
+                objects = [item]
+            results.append((projectile, objects))
+        for projectile, objects in results:
+            projectile.hit(objects)
+        return results
+
+    def __flush(self):
+        # Move the projectiles added since the last update into the arrays.
+        pending = self.__pending
+        if not pending:
+            return
+        self.__pending = []
+        projectiles = [entry[0] for entry in pending]
+        self.__projectiles.extend(projectiles)
+        self.__positions = np.concatenate(
+            (self.__positions, [(entry[1], entry[2]) for entry in pending])
+        )
+        self.__deltas = np.concatenate(
+            (self.__deltas, [(entry[3], entry[4]) for entry in pending])
+        )
+        self.__ranges = np.concatenate(
+            (self.__ranges, [projectile.range for projectile in projectiles])
+        )
+        self.__steps = np.concatenate(
+            (self.__steps, [projectile.step for projectile in projectiles])
+        )
+        self.__speeds = np.concatenate(
+            (self.__speeds, [projectile.movement_speed for projectile in projectiles])
+        )
+        self.__dtmoves = np.concatenate(
+            (self.__dtmoves, [projectile.dtmove for projectile in projectiles])
+        )
+
+    def __compact(self, keep):
+        # Remove the projectiles that are not kept from the board and the arrays.
+        board = self.board
+        projectiles = self.__projectiles
+        for index in np.flatnonzero(~keep).tolist():
+            projectile = projectiles[index]
+            row, column, layer = projectile.pos
+            if (
+                row is not None
+                and column is not None
+                and board.item(row, column, layer) is projectile
+            ):
+                board.clear_cell(row, column, layer)
+            else:
+                board._movables.discard(projectile)
+        self.__projectiles = [
+            projectile for projectile, kept in zip(projectiles, keep) if kept
+        ]
+        self.__positions = self.__positions[keep]
+        self.__deltas = self.__deltas[keep]
+        self.__ranges = self.__ranges[keep]
+        self.__steps = self.__steps[keep]
+        self.__speeds = self.__speeds[keep]
+        self.__dtmoves = self.__dtmoves[keep]
 
 
 class Game(base.PglBaseObject):
@@ -1978,7 +4101,13 @@ class Game(base.PglBaseObject):
         with self.terminal.cbreak(), self.terminal.hidden_cursor(), (
             self.terminal.fullscreen()
         ):
-            self.__execute_run()
+            try:
+                self.__execute_run()
+            finally:
+                # Frames still in the screen's output thread must be written before
+                # leaving fullscreen mode.
+                if isinstance(self.screen, Screen):
+                    self.screen.flush()
 
     # The goal of these _run_* functions is to avoid using if statements in the while
     # loop. Each crumble of performance is worth a little bit of extra code.
@@ -2268,6 +4397,7 @@ class Game(base.PglBaseObject):
                     "board": board,
                     "npcs": [],
                     "projectiles": [],
+                    "projectile_system": None,
                 }
                 # Taking ownership
                 board.parent = self
@@ -2345,6 +4475,34 @@ class Game(base.PglBaseObject):
         else:
             raise base.PglInvalidTypeException("The level number must be an int.")
 
+    def get_projectile_system(self, level_number: int) -> ProjectileSystem:
+        """
+        This method returns the projectile system of a level. It is created the first
+        time it is needed.
+
+        The projectile system holds the projectiles added with
+        :meth:`add_projectile` and batched=True. It is updated by
+        :meth:`actuate_projectiles`.
+
+        .. versionadded:: 1.4.0
+
+        :param level_number: The number of the level.
+        :type level_number: int
+        :rtype: :class:`ProjectileSystem`
+
+        :raises PglInvalidTypeException: if the level_number is not an int.
+
+        Example::
+
+            print(f"{len(mygame.get_projectile_system(1))} bullets on screen")
+        """
+        if type(level_number) is not int:
+            raise base.PglInvalidTypeException("The level number must be an int.")
+        level = self._boards[level_number]
+        if level.get("projectile_system") is None:
+            level["projectile_system"] = ProjectileSystem(level["board"])
+        return level["projectile_system"]
+
     def current_board(self) -> Board:
         """
         This method return the board object corresponding to the current_level.
@@ -2582,11 +4740,18 @@ class Game(base.PglBaseObject):
 
         .. note:: Since version 1.2.0 and the appearance of the realtime mode, we have
            to account for movement speed. This method does it.
+
+        .. versionchanged:: 1.4.0
+           The NPCs are moved all at once with :meth:`Board.move_many`: the NPCs that
+           move to the same cell are resolved in the order of the level's NPCs list
+           and an NPC can move to a cell that another NPC leaves.
         """
         if self.state == State.RUNNING:
             if type(level_number) is int:
                 if level_number in self._boards.keys():
-                    self.screen.trigger_rendering()
+                    self.screen.trigger_rendering(self._boards[level_number]["board"])
+                    # The NPCs are moved all at once (see Board.move_many()).
+                    moves = []
                     for npc in self._boards[level_number]["npcs"]:
                         if npc.actuator.state == State.RUNNING:
                             # Account for movement speed
@@ -2604,14 +4769,17 @@ class Game(base.PglBaseObject):
                             d = nm
                             if not isinstance(nm, base.Vector2D):
                                 d = base.Vector2D.from_direction(nm, 1)
-                            self._boards[level_number]["board"].move(
-                                npc,
-                                base.Vector2D(
-                                    d.row * npc.step_vertical,
-                                    d.column * npc.step_horizontal,
-                                ),
+                            moves.append(
+                                (
+                                    npc,
+                                    (
+                                        d.row * npc.step_vertical,
+                                        d.column * npc.step_horizontal,
+                                    ),
+                                )
                             )
                             # npc.dtmove = 0.0
+                    self._boards[level_number]["board"].move_many(moves)
                     self.notify(
                         self, "pygamelib.engine.Game.actuate_npcs:npcs_actuated"
                     )
@@ -2625,14 +4793,23 @@ class Game(base.PglBaseObject):
                     "In actuate_npcs(level_number) the level_number must be an int."
                 )
 
-    def add_projectile(self, level_number, projectile, row=None, column=None):
+    def add_projectile(
+        self, level_number, projectile, row=None, column=None, batched=False
+    ):
         """
         Add a Projectile to the game. It will be placed on the board corresponding to
         level_number. Neither row nor column can be None.
 
+        .. versionchanged:: 1.4.0
+           The batched parameter adds the projectile to the
+           :class:`ProjectileSystem` of the level (see :meth:`get_projectile_system`)
+           instead of the list of projectiles. It is a lot faster when there are
+           hundreds or thousands of projectiles.
+
         Example::
 
             game.add_projectile(1, fireball, 5, 2)
+            game.add_projectile(1, bullet, 5, 2, batched=True)
 
         :param level_number: the level number of the board.
         :type level_number: int
@@ -2642,6 +4819,8 @@ class Game(base.PglBaseObject):
         :type row: int
         :param column: the column coordinate to place the Projectile at.
         :type column: int
+        :param batched: Add the projectile to the projectile system of the level.
+        :type batched: bool
 
         If either of these parameters are not of the correct type, a
         PglInvalidTypeException exception is raised.
@@ -2669,6 +4848,11 @@ class Game(base.PglBaseObject):
                             or column < 0
                         ):
                             return
+                        if batched:
+                            self.get_projectile_system(level_number).add(
+                                projectile, row, column
+                            )
+                            return
                         # If there is something were we should put the projectile,
                         # then we consider it an immediate hit.
                         check_object = self._boards[level_number]["board"].item(
@@ -2745,6 +4929,10 @@ class Game(base.PglBaseObject):
            items. If you want to detect collisions with overlappable objects, please
            implement your own projectile actuation method.
 
+        .. versionchanged:: 1.4.0
+           The projectile system of the level (the projectiles added with
+           batched=True) is updated first. See :class:`ProjectileSystem`.
+
         :param level_number: The number of the level to actuate Projectiles in.
         :type level_number: int
         :param elapsed_time: The amount of time that passed since last call. This
@@ -2770,8 +4958,13 @@ class Game(base.PglBaseObject):
         if self.state == State.RUNNING:
             if type(level_number) is int:
                 if level_number in self._boards.keys():
-                    self.screen.trigger_rendering()
+                    self.screen.trigger_rendering(self._boards[level_number]["board"])
                     board = self._boards[level_number]["board"]
+                    # The batched projectiles are all actuated at once.
+                    if self._boards[level_number].get("projectile_system") is not None:
+                        self._boards[level_number]["projectile_system"].update(
+                            elapsed_time
+                        )
                     # For each projectile we need to cover 3 cases:
                     #  1 - projectile range > 0 but the projectile collide with
                     #      something (a moving object that moves into the projectile)
@@ -2933,9 +5126,10 @@ class Game(base.PglBaseObject):
         if self.state == State.RUNNING:
             if type(level_number) is int:
                 if level_number in self._boards.keys():
-                    for item in (
-                        self._boards[level_number]["board"].get_immovables()
-                        + self._boards[level_number]["board"].get_movables()
+                    board = self._boards[level_number]["board"]
+                    # Only the items with an animation are visited.
+                    for item in list(board._immovables.animated) + list(
+                        board._movables.animated
                     ):
                         if item.animation is not None:
                             item.animation.dtanimate += elapsed_time
@@ -3007,7 +5201,7 @@ class Game(base.PglBaseObject):
         ):
             self._boards[self.current_level]["board"].move(self.player, direction, step)
             if isinstance(self.screen, Screen):
-                self.screen.trigger_rendering()
+                self.screen.trigger_rendering(self._boards[self.current_level]["board"])
 
     def display_board(self):
         """Display the current board.
@@ -3088,6 +5282,11 @@ class Game(base.PglBaseObject):
         the freshly created board to a lvl_number.
         It then create the NPCs and add them to the board.
 
+        .. versionchanged:: 1.4.0
+           If filename is a directory, the board is streamed from it (see
+           :meth:`Board.load_streamed`). The NPCs are added to the level when their
+           chunk is loaded and removed when it is evicted.
+
         :param filename: The file to load
         :type filename: str
         :param lvl_number: The level number to associate the board to. Default is 0.
@@ -3099,6 +5298,19 @@ class Game(base.PglBaseObject):
             mynewboard = game.load_board( 'awesome_level.json', 1 )
             game.change_level( 1 )
         """
+        if os.path.isdir(filename):
+            local_board = Board.load_streamed(filename)
+            self.add_board(lvl_number, local_board)
+            local_board.attach(self)
+            with open(os.path.join(filename, "board.json"), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if "library" in data.keys():
+                self.object_library = []
+                for e in data["library"]:
+                    item = Board.instantiate_item(e)
+                    if item is not None:
+                        self.object_library.append(item)
+            return local_board
         data = dict()
         with open(filename, "r", encoding="utf-8") as f:
             data = json.load(f)
@@ -3220,6 +5432,10 @@ class Game(base.PglBaseObject):
 
         If Game.object_library is not an empty array, it will be saved also.
 
+        .. versionchanged:: 1.4.0
+           A streamed board (see :meth:`Board.load_streamed`) is saved in the streaming
+           format: filename is a directory.
+
         .. warning:: In version 1.3.0 the :class:`~pygamelib.engine.Board` class changed
            a lot and a layer system has been added. Therefor, boards saved from version
            1.3.0+ are *not* compatible with previous version. Previous boards can be
@@ -3240,8 +5456,17 @@ class Game(base.PglBaseObject):
                 " does not correspond to any level associated with a board in "
                 "Game.save_board()"
             )
-        # With version 1.3.0+ this method is a lot cleaner...
-        data = self._boards[lvl_number]["board"].serialize()
+        board = self._boards[lvl_number]["board"]
+        if board.stream_path is not None:
+            # Streamed boards are saved in the streaming format and the library is
+            # stored with the settings of the board.
+            board.save_streamed(filename)
+            filename = os.path.join(filename, "board.json")
+            with open(filename, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        else:
+            # With version 1.3.0+ this method is a lot cleaner...
+            data = board.serialize()
         if len(self.object_library) > 0:
             data["library"] = []
             for o in self.object_library:
@@ -3250,6 +5475,44 @@ class Game(base.PglBaseObject):
         with open(filename, "w", encoding="utf-8") as f:
             json.dump(data, f)
 
+    def handle_notification(self, subject, attribute=None, value=None):
+        """
+        A virtual method that needs to be implemented by the observer.
+        By default it does nothing but each observer needs to implement it if something
+        needs to be done when notified.
+
+        The Game watches the streamed boards loaded by :meth:`load_board`: the NPCs of
+        the chunks that are loaded are added to the level and the NPCs of the chunks
+        that are evicted are removed from it.
+
+        .. versionadded:: 1.4.0
+
+        :param subject: The object that has changed.
+        :type subject: :class:`~pygamelib.base.PglBaseObject`
+        :param attribute: The attribute that has changed, it is usually a "FQDN style"
+           string. This can be None.
+        :type attribute: str
+        :param value: The new value of the attribute. This can be None.
+        :type value: Any
+        """
+        if attribute not in (
+            "pygamelib.engine.Board.chunk:loaded",
+            "pygamelib.engine.Board.chunk:evicted",
+        ):
+            return
+        for level in self._boards.values():
+            if level["board"] is not subject:
+                continue
+            for npc in value:
+                if not isinstance(npc, board_items.NPC):
+                    continue
+                if attribute == "pygamelib.engine.Board.chunk:loaded":
+                    level["npcs"].append(npc)
+                    if isinstance(npc.actuator, actuators.PathFinder):
+                        npc.actuator.game = self
+                elif npc in level["npcs"]:
+                    level["npcs"].remove(npc)
+
     def start(self):
         """Set the game engine state to RUNNING.
 
@@ -4055,10 +6318,13 @@ class Screen(base.PglBaseObject):
     :func:`render()` if needed (i.e: if something has change in the display buffer). The
     buffers are only rendered when needed.
 
-    When :func:`render()` is called it goes through the display buffer and render
-    each elements transforming it into a printable sequence that is stored in the
-    frame buffer. The rendering is done from the bottom right corner of the screen to
-    the top left corner. This allows for cleaning junk characters at no additional cost.
+    When :func:`render()` is called it goes through the elements placed in the display
+    buffer and render each elements transforming it into a printable sequence that is
+    stored in the frame buffer. The rendering is done from the bottom right corner of
+    the screen to the top left corner. This allows for cleaning junk characters at no
+    additional cost. The screen keeps track of the areas that changed since the last
+    rendering cycle (through the notifications of the placed elements) and only renders
+    these areas again when it can.
 
     **TL;DR:** The **display buffer** hold the objects placed on the screen while the
     **frame buffer** hold the rendered representation of the display buffer.
@@ -4173,17 +6439,54 @@ class Screen(base.PglBaseObject):
             ]
         )
         self._is_dirty = False
+        # Output thread (see threaded_update). The frames handed off to that thread are
+        # never written by the main thread: object frame buffers are split into
+        # (sgr, text) cells before the hand-off and typed frame buffers are swapped with
+        # a spare buffer (triple buffering: one rendered into, one pending, one being
+        # written).
         self._run_threaded_loop = False
         self._rendering_thread = None
+        self.__presenter = threading.Condition()
+        self.__pending_frame = None
+        self.__presenting = False
+        self.__spare_buffers = []
+        self.__presenter_error = None
         self._current_rendering_cycle = 0
         self.__scene_graph = []
+        self.__delta_update = False
+        self.__scroll_update = False
+        self.__synchronized_update = False
+        self.__typed_buffer = False
+        # Placed elements registry: (row, column) -> [element, rendering pass,
+        # footprint]. The footprint is the area of the frame buffer the element renders
+        # into. Rendering only goes through that registry.
+        self.__placed = {}
+        # The registry sorted in rendering order (None when it needs to be sorted).
+        self.__render_order = None
+        # Areas of the frame buffer that need to be re-rendered. If __full_render is
+        # True, the whole display buffer is rendered instead.
+        self.__dirty_regions = []
+        self.__full_render = False
+        self.__blank_cell = core.Sprixel(" ").__repr__()
+        # Split strings cache used by the output encoder.
+        self.__sgr_cache = {}
+        self.__color_depth = ColorDepth.TRUE_COLOR
+        # SGR sequences converted to the color depth.
+        self.__quantized_sgr = {}
+        # The last frame emitted to the terminal (a list of rows of (sgr, text) cells).
+        # It is only maintained when delta_update is True.
+        self._last_frame = None
+        # The cells of the last frame emitted when typed_buffer is True.
+        self.__last_cells = None
 
     def clear(self):
         """
         This methods clear the screen.
         """
+        self.flush()
         sys.stdout.write(self.terminal.clear)
         sys.stdout.flush()
+        self._last_frame = None
 
     def clear_buffers(self):
         """This methods clear the Screen's buffers (both display and frame buffer).
@@ -4211,13 +6514,22 @@ class Screen(base.PglBaseObject):
                 for j in range(0, self.__height, 1)
             ]
         )
-        self._frame_buffer = np.array(
+        self._frame_buffer = self.__new_frame_buffer()
+        self.__placed = {}
+        self.__render_order = None
+        self.__dirty_regions = []
+        self.__full_render = False
+        self._is_dirty = False
+
+    def __new_frame_buffer(self):
+        if self.__typed_buffer:
+            return core.FrameBuffer(self.__width, self.__height)
+        return np.array(
             [
                 [core.Sprixel(" ") for i in range(0, self.__width, 1)]
                 for j in range(0, self.__height, 1)
             ]
         )
-        self._is_dirty = False
 
     def clear_frame_buffer(self):
         """
@@ -4241,12 +6553,8 @@ class Screen(base.PglBaseObject):
         """
         # TODO: BUG: This is not clearing the buffer, this is recreating it...
         #       FIXME: Create one empty sprixel and put it in every cells the buffer
-        self._frame_buffer = np.array(
-            [
-                [core.Sprixel(" ") for i in range(0, self.__width, 1)]
-                for j in range(0, self.__height, 1)
-            ]
-        )
+        self._frame_buffer = self.__new_frame_buffer()
+        self.__full_render = True
         self._is_dirty = True
 
     @property
@@ -4299,6 +6607,9 @@ class Screen(base.PglBaseObject):
            :func:`render()` before writing anything into the frame buffer. Or else it
            will be squashed in the next rendering cycle.
 
+        If :attr:`typed_buffer` is True, the buffer is a
+        :class:`~pygamelib.gfx.core.FrameBuffer` (which can be used the same way).
+
         .. versionadded:: 1.3.0
 
         .. image:: https://img.shields.io/badge/rendering%20stack-ISM-green
@@ -4310,6 +6621,301 @@ class Screen(base.PglBaseObject):
         """
         return self._frame_buffer
 
+    @property
+    def delta_update(self):
+        """
+        Get and set the delta update mode, must be a bool.
+
+        When delta update is enabled, the screen keeps a copy of the last frame emitted
+        to the terminal and :func:`update()` only writes the cells that changed since
+        then (using cursor positioning escape sequences to jump from one run of changed
+        cells to the next). On big screens where only a small part of the frame changes
+        at each update, it saves a lot of terminal bandwidth (which is particularly
+        noticeable over SSH).
+
+        The first update after enabling the delta update mode (or after
+        :func:`clear()`, :func:`force_update()` or any method of the **Direct Display**
+        stack) is a full repaint.
+
+        Default value is False.
+
+        .. WARNING:: Delta updates rely on the frame buffer convention that each cell
+           represent exactly one character on screen (wide characters must be followed
+           by an empty cell). Content that does not follow that convention may be
+           misplaced.
+
+        Example::
+
+            screen.delta_update = True
+            screen.place(my_board, 0, 0)
+            # First update is a full repaint
+            screen.update()
+            # Following updates only write what changed on the board.
+            screen.update()
+
+        .. versionadded:: 1.4.0
+
+        .. image:: https://img.shields.io/badge/rendering%20stack-ISM-green
+
+        .. NOTE:: This method is part of the **Improved Screen Management** rendering
+           stack and is incompatible with the methods identified as being part of the
+           **Legacy Direct Display** stack.
+        """
+        return self.__delta_update
+
+    @delta_update.setter
+    def delta_update(self, value):
+        if type(value) is bool:
+            # The output thread reads and writes the last frame.
+            self.flush()
+            self.__delta_update = value
+            self._last_frame = None
+        else:
+            raise base.PglInvalidTypeException(
+                "Screen.delta_update: value needs to be a bool."
+            )
+
+    @property
+    def scroll_update(self):
+        """
+        Get and set the scroll update mode, must be a bool.
+
+        This mode extends the delta update mode (see :attr:`delta_update`, which needs
+        to be enabled too). When a band of rows of the frame is the same as in the last
+        frame but shifted up or down (like a :class:`Board` with partial display
+        enabled, that follows a focus moving vertically), :func:`update()` asks the
+        terminal to scroll that band (with a scroll region) instead of writing it
+        again. Only the rows that are exposed by the scrolling (and the cells that
+        differ) are then written.
+
+        Terminals have no (widely supported) way of scrolling horizontally: horizontal
+        scrolling is sent as regular delta updates.
+
+        Default value is False.
+
+        .. WARNING:: A scroll region spans the whole width of the terminal. If the
+           screen is narrower than the terminal, the content on the right of the
+           screen is scrolled too.
+
+        Example::
+
+            screen.delta_update = True
+            screen.scroll_update = True
+
+        .. versionadded:: 1.4.0
+
+        .. image:: https://img.shields.io/badge/rendering%20stack-ISM-green
+
+        .. NOTE:: This method is part of the **Improved Screen Management** rendering
+           stack and is incompatible with the methods identified as being part of the
+           **Legacy Direct Display** stack.
+        """
+        return self.__scroll_update
+
+    @scroll_update.setter
+    def scroll_update(self, value):
+        if type(value) is bool:
+            self.__scroll_update = value
+        else:
+            raise base.PglInvalidTypeException(
+                "Screen.scroll_update: value needs to be a bool."
+            )
+
+    @property
+    def color_depth(self):
+        """
+        Get and set the color depth of the screen's output, must be a
+        :class:`~pygamelib.constants.ColorDepth`.
+
+        All the colors are defined in true color (24 bits) in the library. When the
+        color depth is set to ColorDepth.COLORS_256 or ColorDepth.COLORS_16,
+        :func:`update()` converts the colors to the closest color of the 256 or 16
+        colors palette. The escape sequences of these palettes are a lot shorter, which
+        means a lot less bytes per frame to send to the terminal (very useful over a
+        slow or remote connection). It is also useful for terminals that do not support
+        true colors.
+
+        The conversion of each color is done only once and cached.
+
+        Default value is ColorDepth.TRUE_COLOR.
+
+        Example::
+
+            screen.color_depth = constants.ColorDepth.COLORS_256
+
+        .. versionadded:: 1.4.0
+
+        .. image:: https://img.shields.io/badge/rendering%20stack-ISM-green
+
+        .. NOTE:: This method is part of the **Improved Screen Management** rendering
+           stack and is incompatible with the methods identified as being part of the
+           **Legacy Direct Display** stack.
+        """
+        return self.__color_depth
+
+    @color_depth.setter
+    def color_depth(self, value):
+        if isinstance(value, ColorDepth):
+            self.flush()
+            self.__color_depth = value
+            self.__quantized_sgr = {}
+            self._last_frame = None
+        else:
+            raise base.PglInvalidTypeException(
+                "Screen.color_depth: value needs to be a constants.ColorDepth."
+            )
+
+    @property
+    def synchronized_update(self):
+        """
+        Get and set the synchronized update mode, must be a bool.
+
+        When enabled, each frame written by :func:`update()` is wrapped into the
+        "synchronized update" escape sequences (DEC private mode 2026). Terminals that
+        support it hold the display until the whole frame is received, which avoids
+        tearing and flickering at high frame rates. Terminals that do not support it
+        simply ignore the sequences.
+
+        Default value is False.
+
+        Example::
+
+            screen.synchronized_update = True
+
+        .. versionadded:: 1.4.0
+
+        .. image:: https://img.shields.io/badge/rendering%20stack-ISM-green
+
+        .. NOTE:: This method is part of the **Improved Screen Management** rendering
+           stack and is incompatible with the methods identified as being part of the
+           **Legacy Direct Display** stack.
+        """
+        return self.__synchronized_update
+
+    @synchronized_update.setter
+    def synchronized_update(self, value):
+        if type(value) is bool:
+            self.__synchronized_update = value
+        else:
+            raise base.PglInvalidTypeException(
+                "Screen.synchronized_update: value needs to be a bool."
+            )
+
+    @property
+    def threaded_update(self):
+        """
+        Get and set the threaded update mode, must be a bool.
+
+        When enabled, :func:`update()` does not write to the terminal anymore. It
+        renders the frame and hands it off to an output thread that encodes and writes
+        it, while the game goes on with the next frame. That way, a slow terminal (or a
+        slow connection) does not slow down the game logic.
+
+        The frame is captured when handed off (the sprixels of the frame buffer are
+        split into strings, a typed frame buffer is swapped with a spare buffer), so
+        the game can change the sprixels of the next frame while the previous one is
+        being written. If the output thread is still busy when a new frame is handed
+        off, the frame that was waiting is dropped (only the latest frame is written).
+
+        Disabling the threaded update mode waits for the output thread to write the
+        last frame and stops it. Use :func:`flush()` to wait for the output without
+        stopping the thread.
+
+        Default value is False.
+
+        Example::
+
+            screen.threaded_update = True
+            while playing:
+                # Returns as soon as the frame is rendered.
+                screen.update()
+            screen.threaded_update = False
+
+        .. versionadded:: 1.4.0
+
+        .. image:: https://img.shields.io/badge/rendering%20stack-ISM-green
+
+        .. NOTE:: This method is part of the **Improved Screen Management** rendering
+           stack and is incompatible with the methods identified as being part of the
+           **Legacy Direct Display** stack.
+        """
+        return self._run_threaded_loop
+
+    @threaded_update.setter
+    def threaded_update(self, value):
+        if type(value) is not bool:
+            raise base.PglInvalidTypeException(
+                "Screen.threaded_update: value needs to be a bool."
+            )
+        if value == self._run_threaded_loop:
+            return
+        if value:
+            self._run_threaded_loop = True
+            self._rendering_thread = threading.Thread(
+                target=self.__presenter_loop,
+                name="pygamelib.engine.Screen.threaded_update",
+                daemon=True,
+            )
+            self._rendering_thread.start()
+        else:
+            with self.__presenter:
+                self._run_threaded_loop = False
+                self.__presenter.notify_all()
+            # The thread writes the pending frame before stopping.
+            self._rendering_thread.join()
+            self._rendering_thread = None
+            self.__raise_presenter_error()
+
+    @property
+    def typed_buffer(self):
+        """
+        Get and set the typed frame buffer mode, must be a bool.
+
+        By default, the frame buffer is a NumPy array of objects (strings and
+        sprixels). When the typed buffer mode is enabled, the frame buffer is a
+        :class:`~pygamelib.gfx.core.FrameBuffer` instead: a structured NumPy array
+        storing the code point, colors, attributes and width of each cell.
+
+        All the elements that can be placed on screen render into both types of
+        buffers. With the typed buffer, clearing the frame buffer, blitting sprites
+        and comparing frames (in :attr:`delta_update` mode, only the rows that changed
+        are encoded again) are vectorized operations.
+
+        Changing the mode creates a new (empty) frame buffer and triggers a full
+        rendering.
+
+        Default value is False.
+
+        Example::
+
+            screen.typed_buffer = True
+            screen.delta_update = True
+
+        .. versionadded:: 1.4.0
+
+        .. image:: https://img.shields.io/badge/rendering%20stack-ISM-green
+
+        .. NOTE:: This method is part of the **Improved Screen Management** rendering
+           stack and is incompatible with the methods identified as being part of the
+           **Legacy Direct Display** stack.
+        """
+        return self.__typed_buffer
+
+    @typed_buffer.setter
+    def typed_buffer(self, value):
+        if type(value) is not bool:
+            raise base.PglInvalidTypeException(
+                "Screen.typed_buffer: value needs to be a bool."
+            )
+        if value == self.__typed_buffer:
+            return
+        self.flush()
+        self.__typed_buffer = value
+        self._frame_buffer = self.__new_frame_buffer()
+        self.__last_cells = None
+        self._last_frame = None
+        self.__invalidate(None)
+
     @property
     def vcenter(self):
         """Return the vertical center of the screen as an int.
@@ -4334,6 +6940,17 @@ class Screen(base.PglBaseObject):
         """
         Update the screen. Update means write the frame buffer on screen.
 
+        The frame is encoded before being written: the screen keeps track of the
+        terminal colors and styles and only emits the SGR sequences when they change
+        from one cell to the next. Large areas of the same color are therefore written
+        with a single color sequence.
+
+        If :attr:`delta_update` is True, only the cells that changed since the last
+        update are written.
+
+        The whole frame is assembled in memory and written to the terminal in one go
+        (with a single system call most of the time).
+
         Example::
 
             mygame = Game()
@@ -4352,16 +6969,401 @@ class Screen(base.PglBaseObject):
         """
         if self._is_dirty:
             self.render()
-        print(self.terminal.home, end="", flush=False)
-        screen_buffer = self._frame_buffer
-        for row in range(0, screen_buffer.shape[0] - 1):
-            print("".join(map(str, screen_buffer[row])), flush=False)
-        print(
-            "".join(map(str, screen_buffer[screen_buffer.shape[0] - 1])),
-            end="",
-            flush=False,
+        if self._run_threaded_loop:
+            self.__hand_off()
+        else:
+            self.__present(self._frame_buffer)
+
+    def __present(self, frame_buffer):
+        # Encode a frame buffer and write it to the terminal.
+        if isinstance(frame_buffer, core.FrameBuffer):
+            frame = self.__split_frame_buffer(frame_buffer)
+        elif type(frame_buffer) is list:
+            # Already split by __hand_off().
+            frame = frame_buffer
+        else:
+            frame = [self.__split_cells(row) for row in frame_buffer]
+        output = []
+        if (
+            self.__delta_update
+            and self._last_frame is not None
+            and len(self._last_frame) == len(frame)
+        ):
+            if self.__scroll_update:
+                self.__encode_scroll(frame, output)
+            state = self.__encode_delta(frame, output)
+        else:
+            output.append(self.terminal.home)
+            state = ""
+            for row in range(0, len(frame)):
+                if row > 0:
+                    output.append("\n")
+                state = self.__encode_cells(frame[row], output, state)
+            # Reset the attributes before clearing so the background color does not
+            # bleed into the cleared area.
+            if state != "":
+                output.append("\x1b[0m")
+                state = ""
+            output.append(self.terminal.clear_eos)
+        if state != "":
+            output.append("\x1b[0m")
+        if self.__delta_update:
+            self._last_frame = frame
+        if output:
+            if self.__synchronized_update:
+                output.insert(0, "\x1b[?2026h")
+                output.append("\x1b[?2026l")
+            self.__write("".join(output))
+
+    def __write(self, data):
+        # Write the whole frame with as few system calls as possible (usually one),
+        # bypassing Python's text I/O layer when stdout is backed by a file descriptor.
+        stream = sys.stdout
+        try:
+            fd = stream.fileno()
+        except (AttributeError, OSError, ValueError):
+            # Not a real file (StringIO, redirected output, etc.)
+            stream.write(data)
+            stream.flush()
+            return
+        # Whatever was printed before must reach the terminal first.
+        stream.flush()
+        view = memoryview(
+            data.encode(
+                getattr(stream, "encoding", None) or "utf-8",
+                getattr(stream, "errors", None) or "strict",
+            )
         )
-        print(self.terminal.clear_eos, end="", flush=True)
+        while len(view) > 0:
+            view = view[os.write(fd, view) :]
+
+    def __hand_off(self):
+        # Give the frame to the output thread. If the previous frame has not been
+        # picked up yet, it is dropped: only the latest frame matters.
+        self.__raise_presenter_error()
+        frame_buffer = self._frame_buffer
+        if not isinstance(frame_buffer, core.FrameBuffer):
+            # The cells of an object frame buffer are live sprixels that the game
+            # changes for the next frame. They are split into immutable (sgr, text)
+            # cells here, so the output thread never reads them, and the frame buffer
+            # is kept.
+            frame = [self.__split_cells(row) for row in frame_buffer]
+            with self.__presenter:
+                self.__pending_frame = frame
+                self.__presenter.notify_all()
+            return
+        # A typed frame buffer only holds values: it is swapped with a spare one.
+        with self.__presenter:
+            if isinstance(self.__pending_frame, core.FrameBuffer):
+                self.__spare_buffers.append(self.__pending_frame)
+            self.__pending_frame = frame_buffer
+            back_buffer = None
+            while len(self.__spare_buffers) > 0:
+                back_buffer = self.__spare_buffers.pop()
+                if (
+                    type(back_buffer) is type(frame_buffer)
+                    and back_buffer.shape == frame_buffer.shape
+                ):
+                    break
+                back_buffer = None
+            self.__presenter.notify_all()
+        # The back buffer needs the content of the frame for the incremental
+        # rendering.
+        if back_buffer is None:
+            back_buffer = core.FrameBuffer(frame_buffer.width, frame_buffer.height)
+        np.copyto(back_buffer.cells, frame_buffer.cells)
+        self._frame_buffer = back_buffer
+
+    def __presenter_loop(self):
+        # Main loop of the output thread.
+        presenter = self.__presenter
+        while True:
+            with presenter:
+                while self.__pending_frame is None and self._run_threaded_loop:
+                    presenter.wait()
+                frame_buffer = self.__pending_frame
+                if frame_buffer is None:
+                    return
+                self.__pending_frame = None
+                self.__presenting = True
+            try:
+                self.__present(frame_buffer)
+            except Exception as error:
+                self.__presenter_error = error
+            finally:
+                with presenter:
+                    self.__presenting = False
+                    if isinstance(frame_buffer, core.FrameBuffer):
+                        self.__spare_buffers.append(frame_buffer)
+                    presenter.notify_all()
+
+    def __raise_presenter_error(self):
+        # Errors of the output thread are raised in the main thread.
+        error = self.__presenter_error
+        if error is not None:
+            self.__presenter_error = None
+            raise error
+
+    def flush(self):
+        """
+        Wait for the output thread to write all the frames handed off to it.
+
+        If :attr:`threaded_update` is False, this method does nothing.
+
+        An error that occurred while writing a frame in the output thread is raised
+        here (or by the next call to :func:`update()`).
+
+        Example::
+
+            screen.threaded_update = True
+            screen.update()
+            # Make sure the frame is on screen before printing something else.
+            screen.flush()
+
+        .. versionadded:: 1.4.0
+
+        .. image:: https://img.shields.io/badge/rendering%20stack-ISM-green
+
+        .. NOTE:: This method is part of the **Improved Screen Management** rendering
+           stack and is incompatible with the methods identified as being part of the
+           **Legacy Direct Display** stack.
+        """
+        with self.__presenter:
+            while self.__rendering_thread_alive() and (
+                self.__pending_frame is not None or self.__presenting
+            ):
+                self.__presenter.wait()
+        self.__raise_presenter_error()
+
+    def __rendering_thread_alive(self):
+        return self._rendering_thread is not None and self._rendering_thread.is_alive()
+
+    def __split_cells(self, cells):
+        # Split each cell of a frame buffer row into a (sgr, text) tuple. sgr is the
+        # SGR sequence (colors and styles) the text needs to be printed with.
+        split = []
+        append = split.append
+        cache = self.__sgr_cache
+        sprixel_type = core.Sprixel
+        for cell in cells:
+            if isinstance(cell, sprixel_type):
+                append((cell._color_cache, cell.model))
+                continue
+            if type(cell) is not str:
+                cell = str(cell)
+            parts = cache.get(cell)
+            if parts is None:
+                parts = self.__split_string(cell)
+            append(parts)
+        return self.__quantize_cells(split)
+
+    def __split_frame_buffer(self, frame_buffer):
+        # Split a typed frame buffer. In delta update mode, only the rows that changed
+        # since the last frame are split again (found with a vectorized comparison).
+        last_frame = self._last_frame
+        last_cells = self.__last_cells
+        if (
+            self.__delta_update
+            and last_frame is not None
+            and last_cells is not None
+            and last_cells.shape == frame_buffer.shape
+            and len(last_frame) == frame_buffer.height
+        ):
+            changed = np.flatnonzero(frame_buffer.diff(last_cells).any(axis=1))
+            changed = changed.tolist()
+            frame = list(last_frame)
+            for row, cells in zip(changed, frame_buffer.split_rows(changed)):
+                frame[row] = self.__quantize_cells(cells)
+        else:
+            frame = [
+                self.__quantize_cells(cells) for cells in frame_buffer.split_rows()
+            ]
+        if self.__delta_update:
+            self.__last_cells = frame_buffer.cells.copy()
+        return frame
+
+    def __quantize_cells(self, split):
+        # Convert the SGR sequences of split cells to the screen's color depth.
+        if self.__color_depth == ColorDepth.TRUE_COLOR:
+            return split
+        quantized = self.__quantized_sgr
+        quantize = self.__quantize_sgr
+        return [
+            (quantized[sgr] if sgr in quantized else quantize(sgr), text)
+            for sgr, text in split
+        ]
+
+    def __quantize_sgr(self, sgr):
+        # Convert the colors of an SGR sequence to the screen's color depth. The result
+        # is cached, so each color is only converted once.
+        params = []
+        for sequence in sgr.split("\x1b[")[1:]:
+            params.extend(sequence[:-1].split(";"))
+        out = []
+        idx = 0
+        while idx < len(params):
+            param = params[idx]
+            if param in ("38", "48") and idx + 1 < len(params):
+                color = None
+                if params[idx + 1] == "2" and idx + 4 < len(params):
+                    rgb = tuple(
+                        min(int(v or 0), 255) for v in params[idx + 2 : idx + 5]
+                    )
+                    idx += 5
+                    if self.__color_depth == ColorDepth.COLORS_256:
+                        color = _nearest_color_256(rgb)
+                    else:
+                        color = _nearest_color_16(rgb)
+                elif params[idx + 1] == "5" and idx + 2 < len(params):
+                    color = int(params[idx + 2] or 0) % 256
+                    idx += 3
+                    if self.__color_depth == ColorDepth.COLORS_16:
+                        color = _NEAREST_16_OF_256[color]
+                if color is None:
+                    # Malformed sequence, keep what's left as is.
+                    out.extend(params[idx:])
+                    break
+                if self.__color_depth == ColorDepth.COLORS_256:
+                    out.extend((param, "5", str(color)))
+                else:
+                    base_code = 30 if param == "38" else 40
+                    if color >= 8:
+                        base_code += 60
+                        color -= 8
+                    out.append(str(base_code + color))
+            else:
+                out.append(param)
+                idx += 1
+        quantized = ""
+        if len(out) > 0:
+            quantized = f"\x1b[{';'.join(out)}m"
+        if len(self.__quantized_sgr) >= 4096:
+            self.__quantized_sgr.clear()
+        self.__quantized_sgr[sgr] = quantized
+        return quantized
+
+    def __split_string(self, string):
+        # Strings are usually pre-rendered cells like "<SGR><char>\x1b[0m" (that's
+        # what Sprixel.__repr__() or Text produce). Strings that cannot be split are
+        # printed as is (starting from a reset state).
+        text = string
+        if text.endswith("\x1b[0m"):
+            text = text[:-4]
+        sgr = ""
+        match = _SGR_PREFIX.match(text)
+        if match is not None:
+            sgr = match.group(0)
+            text = text[match.end() :]
+            reset = sgr.rfind("\x1b[0m")
+            if reset != -1:
+                sgr = sgr[reset + 4 :]
+        if "\x1b" in text:
+            parts = ("", string)
+        else:
+            parts = (sgr, text)
+        if len(self.__sgr_cache) >= 4096:
+            self.__sgr_cache.clear()
+        self.__sgr_cache[string] = parts
+        return parts
+
+    def __encode_cells(self, cells, output, state):
+        # Encode a run of (sgr, text) cells into output. state is the SGR state of the
+        # terminal before the run ("" for the default state and None if unknown). An
+        # SGR sequence is only emitted when it changes. Return the new state.
+        append = output.append
+        for sgr, text in cells:
+            if sgr != state:
+                if state != "":
+                    append("\x1b[0m")
+                append(sgr)
+                state = sgr
+            append(text)
+            if "\x1b" in text:
+                # The text changed the attributes by itself.
+                state = None
+        return state
+
+    def __encode_scroll(self, frame, output):
+        # Detect a band of rows that scrolled (up or down) since the last emitted
+        # frame. The band is scrolled by the terminal (scroll region + SU/SD) and the
+        # last frame is shifted the same way, so that the delta encoding only writes
+        # the exposed rows (and whatever else changed).
+        last_frame = self._last_frame
+        height = len(frame)
+        changed = [
+            r
+            for r in range(0, height)
+            if frame[r] is not last_frame[r] and frame[r] != last_frame[r]
+        ]
+        if len(changed) < 2:
+            return
+        best_gain = 1
+        best = None
+        # Scrolling more than a few rows at once is unlikely (and not worth it).
+        for shift in range(1, min(height, 5)):
+            for direction in (shift, -shift):
+                gained = [
+                    r
+                    for r in changed
+                    if 0 <= r + direction < height
+                    and frame[r] == last_frame[r + direction]
+                ]
+                if len(gained) > best_gain:
+                    best_gain = len(gained)
+                    best = (direction, gained[0], gained[-1])
+        if best is None:
+            return
+        direction, first, last = best
+        shifted = list(last_frame)
+        if direction > 0:
+            # The content moved up: rows [first, last + direction] scroll up.
+            top = first
+            bottom = last + direction
+            shifted[top : bottom + 1 - direction] = last_frame[
+                top + direction : bottom + 1
+            ]
+            shifted[bottom + 1 - direction : bottom + 1] = [[]] * direction
+            output.append(f"\x1b[{top + 1};{bottom + 1}r\x1b[{direction}S")
+        else:
+            # The content moved down: rows [first + direction, last] scroll down.
+            top = first + direction
+            bottom = last
+            shifted[top - direction : bottom + 1] = last_frame[
+                top : bottom + 1 + direction
+            ]
+            shifted[top : top - direction] = [[]] * -direction
+            output.append(f"\x1b[{top + 1};{bottom + 1}r\x1b[{-direction}T")
+        # Reset the scroll region to the whole terminal.
+        output.append("\x1b[r")
+        self._last_frame = shifted
+
+    def __encode_delta(self, frame, output):
+        # Encode only the runs of cells that changed since the last emitted frame. Each
+        # run is prefixed by a cursor positioning sequence (CUP, 1-based coordinates).
+        last_frame = self._last_frame
+        # The previous update always leaves the terminal in the default state.
+        state = ""
+        for row in range(0, len(frame)):
+            cells = frame[row]
+            previous = last_frame[row]
+            if cells is previous or cells == previous:
+                continue
+            width = len(cells)
+            if len(previous) != width:
+                output.append(f"\x1b[{row + 1};1H")
+                state = self.__encode_cells(cells, output, state)
+                continue
+            col = 0
+            while col < width:
+                if cells[col] == previous[col]:
+                    col += 1
+                    continue
+                start = col
+                while col < width and cells[col] != previous[col]:
+                    col += 1
+                output.append(f"\x1b[{row + 1};{start + 1}H")
+                state = self.__encode_cells(cells[start:col], output, state)
+        return state
 
     def render(self):
         """Render the display buffer into the frame buffer.
@@ -4382,75 +7384,145 @@ class Screen(base.PglBaseObject):
         """
         if self._is_dirty is False:
             return
-        # All these variables are here for performances.
-        # https://wiki.python.org/moin/PythonSpeed/PerformanceTips (old but I do get
-        # better performances with that trick)
-        row = self._display_buffer.shape[0] - 1
-        screen_buffer = self._frame_buffer
-        display_buffer = self._display_buffer
-        s_width = display_buffer.shape[1]
-        s_height = display_buffer.shape[0]
-        later_passes = []
-        while row >= 0:
-            col = display_buffer.shape[1] - 1
-            while col >= 0:
-                i = display_buffer[row][col]
-                # Test if the cell should be rendered on a later pass.
-                if (
-                    hasattr(i, "__rendering_pass")
-                    and getattr(i, "__rendering_pass") > 1
-                    and hasattr(i, "render_to_buffer")
-                ):
-                    if getattr(i, "__rendering_pass") < len(later_passes):
-                        later_passes[getattr(i, "__rendering_pass")].append(
-                            {"item": i, "row": row, "column": col}
-                        )
-                    else:
-                        later_passes.extend(
-                            []
-                            for _ in range(
-                                getattr(i, "__rendering_pass") - len(later_passes)
-                            )
-                        )
-                        later_passes[getattr(i, "__rendering_pass") - 1].append(
-                            {"item": i, "row": row, "column": col}
-                        )
-                    col -= 1
+        if (
+            self.__full_render
+            or len(self.__dirty_regions) == 0
+            or not self.__render_regions()
+        ):
+            self.__render_all()
+        self.__dirty_regions = []
+        self.__full_render = False
+        self._is_dirty = False
+
+    def __render_all(self):
+        # Clearing the frame buffer is the equivalent of rendering the empty cells of
+        # the display buffer.
+        frame_buffer = self._frame_buffer
+        frame_buffer[:, :] = self.__blank_cell
+        s_height, s_width = frame_buffer.shape
+        for position, entry in self.__ordered_elements():
+            entry[0].render_to_buffer(
+                frame_buffer, position[0], position[1], s_height, s_width
+            )
+            # The frame buffer is now in sync with the element, so is its footprint.
+            entry[2] = self.__footprint(entry[0], position[0], position[1])
+
+    def __ordered_elements(self):
+        # Return the placed elements in rendering order: by rendering pass and, within
+        # a pass, from the bottom right corner of the screen to the top left corner
+        # (this allows for cleaning junk characters at no additional cost).
+        if self.__render_order is None:
+            self.__render_order = sorted(
+                self.__placed.items(), key=lambda e: (e[1][1], -e[0][0], -e[0][1])
+            )
+        return self.__render_order
+
+    def __render_regions(self):
+        # Only re-render the dirty regions of the frame buffer. Return False if it
+        # cannot be done (and the whole display buffer needs to be rendered).
+        regions = self.__dirty_regions
+        entries = self.__ordered_elements()
+        selected = [False] * len(entries)
+        # Any element that overlaps a dirty region has to be rendered again. Since it
+        # is going to overwrite its entire footprint, that footprint is dirty too.
+        grown = True
+        while grown:
+            grown = False
+            for idx in range(0, len(entries)):
+                if selected[idx]:
                     continue
-                i.render_to_buffer(
-                    screen_buffer,
-                    row,
-                    col,
-                    s_height,
-                    s_width,
-                )
-                # # If not, we render the cell now.
-                # if hasattr(i, "render_to_buffer"):
-                #     # If the item is capable of rendering itself in the buffer, we let
-                #     # it do so.
-                #     i.render_to_buffer(
-                #         screen_buffer,
-                #         row,
-                #         col,
-                #         s_height,
-                #         s_width,
-                #     )
-                # elif hasattr(i, "__repr__"):
-                #     # Else we use the __repr__ method to render the cell.
-                #     # It is for the sprixels.
-                #     screen_buffer[row][col] = i.__repr__()
-                col -= 1
-            row -= 1
-        # Now we render the later passes.
-        for items in later_passes:
-            for i in items:
-                # Since we already cheched if the item is capable of rendering itself,
-                # we can safely assume it has a render_to_buffer method.
-                i["item"].render_to_buffer(
-                    screen_buffer, i["row"], i["column"], s_height, s_width
+                rect = entries[idx][1][2]
+                if rect is None:
+                    # No way to know if it overlaps or not.
+                    return False
+                for region in regions:
+                    if (
+                        rect[0] < region[2]
+                        and region[0] < rect[2]
+                        and rect[1] < region[3]
+                        and region[1] < rect[3]
+                    ):
+                        selected[idx] = True
+                        regions.append(rect)
+                        grown = True
+                        break
+        frame_buffer = self._frame_buffer
+        for region in regions:
+            frame_buffer[region[0] : region[2], region[1] : region[3]] = (
+                self.__blank_cell
+            )
+        s_height, s_width = frame_buffer.shape
+        for idx in range(0, len(entries)):
+            if selected[idx]:
+                position, entry = entries[idx]
+                entry[0].render_to_buffer(
+                    frame_buffer, position[0], position[1], s_height, s_width
                 )
+                entry[2] = self.__footprint(entry[0], position[0], position[1])
+        return True
+
+    def __footprint(self, element, row, column):
+        # Return the area (top, left, bottom, right) of the frame buffer an element
+        # renders into, or None if it cannot be determined.
+        if isinstance(element, core.Sprixel):
+            height = width = 1
+        elif isinstance(element, base.Text):
+            font = element.font
+            lines = element.text.splitlines()
+            if font is None:
+                height = len(lines)
+                width = max([len(line) for line in lines], default=0)
+            else:
+                height = len(lines) * (font.height + font.vertical_spacing)
+                width = element.length
+        elif isinstance(element, core.Sprite):
+            height = element.size[1]
+            # A wide sprixel on the last column overflows its sprite.
+            width = element.size[0] + 1
+        elif isinstance(element, Board):
+            if len(element._particle_emitters) > 0:
+                # Particles can go anywhere.
+                return None
+            height = element.size[1]
+            width = self.__width - column
+        elif isinstance(element, board_items.BoardComplexItem):
+            height = element.sprite.size[1]
+            width = element.sprite.size[0]
+        elif isinstance(element, board_items.BoardItem):
+            height = 1
+            width = element._sprixel.length
+        elif pgl_isinstance(element, "pygamelib.gfx.ui.Widget"):
+            height = element.height
+            width = element.width
+        else:
+            return None
+        return (
+            row,
+            column,
+            min(row + height, self.__height),
+            min(column + width, self.__width),
+        )
 
-        self._is_dirty = False
+    def __invalidate(self, region):
+        # Mark a region of the frame buffer for rendering. None means everything.
+        if region is None:
+            self.__full_render = True
+            self.__dirty_regions = []
+        elif not self.__full_render:
+            self.__dirty_regions.append(region)
+        self._is_dirty = True
+
+    def __invalidate_element(self, element):
+        # Mark the area of an element (before and after its change) for rendering.
+        found = False
+        for position, entry in self.__placed.items():
+            if entry[0] is element:
+                found = True
+                self.__invalidate(entry[2])
+                entry[2] = self.__footprint(element, position[0], position[1])
+                self.__invalidate(entry[2])
+        if not found:
+            self.__invalidate(None)
 
     def force_render(self):
         """
@@ -4473,7 +7545,7 @@ class Screen(base.PglBaseObject):
            **Legacy Direct Display** stack.
 
         """
-        self._is_dirty = True
+        self.__invalidate(None)
         self.render()
 
     def force_update(self):
@@ -4494,16 +7566,28 @@ class Screen(base.PglBaseObject):
            **Legacy Direct Display** stack.
 
         """
-        self._is_dirty = True
+        self.__invalidate(None)
+        self.flush()
+        self._last_frame = None
         self.update()
 
-    def trigger_rendering(self):
+    def trigger_rendering(self, element=None):
         """
         Trigger the frame buffer for rendering at the next update.
 
+        :param element: An element placed on screen. If set, only the area of the
+           screen covered by that element (and the elements overlapping it) is rendered
+           again. Otherwise the entire frame buffer is.
+        :type element: various
+
         Example::
 
             screen.trigger_rendering()
+            # Only re-render the board
+            screen.trigger_rendering(my_board)
+
+        .. versionchanged:: 1.4.0
+           Added the element parameter.
 
         .. versionadded:: 1.3.0
 
@@ -4514,7 +7598,10 @@ class Screen(base.PglBaseObject):
            **Direct Display** stack.
 
         """
-        self._is_dirty = True
+        if element is None:
+            self.__invalidate(None)
+        else:
+            self.__invalidate_element(element)
 
     def place(self, element=None, row=None, column=None, rendering_pass=1):
         """Place an element on the screen.
@@ -4612,7 +7699,13 @@ class Screen(base.PglBaseObject):
             #     # Game.instance().session_log(f"Attaching to {element}")
             #     element.attach(self)
             #     element.store_screen_position(row, column)
-            self._is_dirty = True
+            previous = self.__placed.get((row, column))
+            if previous is not None:
+                self.__invalidate(previous[2])
+            footprint = self.__footprint(element, row, column)
+            self.__placed[(row, column)] = [element, rendering_pass, footprint]
+            self.__render_order = None
+            self.__invalidate(footprint)
             return
         else:
             raise base.PglInvalidTypeException(
@@ -4654,7 +7747,12 @@ class Screen(base.PglBaseObject):
             if isinstance(self._display_buffer[row][column], base.PglBaseObject):
                 self._display_buffer[row][column].detach(self)
             self._display_buffer[row][column] = core.Sprixel(" ")
-            self._is_dirty = True
+            entry = self.__placed.pop((row, column), None)
+            self.__render_order = None
+            if entry is None:
+                self.__invalidate(None)
+            else:
+                self.__invalidate(entry[2])
 
     def get(self, row: int, column: int):
         """
@@ -4726,6 +7824,7 @@ class Screen(base.PglBaseObject):
 
         """
         # Funny how the documentation is waaayyy bigger than the code ;)
+        self._last_frame = None
         print(
             *text,
             self.terminal.clear_eol,
@@ -4792,6 +7891,7 @@ class Screen(base.PglBaseObject):
         eol = ""
         if clear_eol:
             eol = self.terminal.clear_eol
+        self._last_frame = None
         with self.terminal.location(column, row):
             print(text, eol, end=end, file=file, flush=flush)
 
@@ -4882,6 +7982,7 @@ class Screen(base.PglBaseObject):
            **Improved Screen Management** stack.
 
         """
+        self._last_frame = None
         null_sprixel = core.Sprixel()
         for r in range(0, sprite.size[1]):
             for c in range(0, sprite.size[0]):
@@ -4902,5 +8003,8 @@ class Screen(base.PglBaseObject):
         """
         When a Screen object is notified, it set the display buffer to be rendered
         before the next update.
+
+        Only the area of the screen covered by the notifying element (and the elements
+        overlapping it) is rendered again.
         """
-        self._is_dirty = True
+        self.__invalidate_element(subject)
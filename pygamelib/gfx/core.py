@@ -7,6 +7,9 @@ __docformat__ = "restructuredtext"
 
    pygamelib.gfx.core.Color
    pygamelib.gfx.core.Sprixel
+   pygamelib.gfx.core.SharedSprixel
+   pygamelib.gfx.core.SprixelPalette
+   pygamelib.gfx.core.FrameBuffer
    pygamelib.gfx.core.Sprite
    pygamelib.gfx.core.SpriteCollection
    pygamelib.gfx.core.Animation
@@ -18,13 +21,15 @@ from pygamelib.assets import graphics
 from pygamelib.functions import pgl_isinstance
 import random
 import time
-from collections import UserDict
+from collections import UserDict, OrderedDict
 from uuid import uuid4
 import json
 import re
 from pygamelib import assets
 import importlib_resources
 from pathlib import Path
+import numpy as np
+import weakref
 
 
 class Color(base.PglBaseObject):
@@ -370,6 +375,9 @@ class Sprixel(base.PglBaseObject):
                                         ))
     """
 
+    # The SGR sequences of the (bg, fg) colors pairs already built.
+    __sgr_sequences = {}
+
     def __init__(self, model="", bg_color=None, fg_color=None, is_bg_transparent=None):
         """
         :param model: The model, it can be any string. Preferrably a single character.
@@ -385,7 +393,9 @@ class Sprixel(base.PglBaseObject):
 
         """
         super().__init__()
-        self.__color_cache = ""
+        # The SGR sequence of the sprixel colors. It is also used by the Screen's output
+        # encoder.
+        self._color_cache = ""
         self.__bg_color = None
         self.__fg_color = None
         self.__length = 0
@@ -414,19 +424,32 @@ class Sprixel(base.PglBaseObject):
             self.is_bg_transparent = True
 
     def __repr__(self):
-        return f"{self.__color_cache}{self.model}\x1b[0m"
+        return f"{self._color_cache}{self.model}\x1b[0m"
 
     def __str__(self):  # pragma: no cover
         return self.__repr__()
 
     def __build_color_cache(self):
-        t = base.Console.instance()
-        bgc = fgc = ""
-        if self.bg_color is not None and isinstance(self.bg_color, Color):
-            bgc = t.on_color_rgb(self.bg_color.r, self.bg_color.g, self.bg_color.b)
-        if self.fg_color is not None and isinstance(self.fg_color, Color):
-            fgc = t.color_rgb(self.fg_color.r, self.fg_color.g, self.fg_color.b)
-        self.__color_cache = f"{bgc}{fgc}"
+        # Building the sequences is slow, so they are memoized by colors values.
+        bg = self.__bg_color
+        fg = self.__fg_color
+        key = (
+            None if bg is None else (bg.r, bg.g, bg.b),
+            None if fg is None else (fg.r, fg.g, fg.b),
+        )
+        sgr = Sprixel.__sgr_sequences.get(key)
+        if sgr is None:
+            t = base.Console.instance()
+            bgc = fgc = ""
+            if bg is not None:
+                bgc = t.on_color_rgb(bg.r, bg.g, bg.b)
+            if fg is not None:
+                fgc = t.color_rgb(fg.r, fg.g, fg.b)
+            sgr = f"{bgc}{fgc}"
+            if len(Sprixel.__sgr_sequences) >= 4096:
+                Sprixel.__sgr_sequences.clear()
+            Sprixel.__sgr_sequences[key] = sgr
+        self._color_cache = sgr
 
     def __eq__(self, other):
         if isinstance(other, Sprixel):
@@ -928,6 +951,785 @@ class Sprixel(base.PglBaseObject):
         return cls("  ", Color(255, 255, 0))
 
 
+class SharedSprixel(Sprixel):
+    """
+    A SharedSprixel is an immutable :class:`Sprixel` meant to be shared by many
+    objects (like all the void cells of a board).
+
+    .. versionadded:: 1.4.0
+
+    You should not create SharedSprixel objects directly, use
+    :meth:`SprixelPalette.sprixel` instead: the palette makes sure that there is only
+    one SharedSprixel for each combination of model, colors and transparency.
+
+    Since it is shared, a SharedSprixel cannot be modified: setting its model, colors
+    or transparency raises a :class:`~pygamelib.base.PglException`. Use
+    :meth:`~Sprixel.copy` to get a regular (mutable) Sprixel.
+    :meth:`~pygamelib.board_items.BoardItem.mutable_sprixel` does it for the board
+    items (copy-on-write).
+
+    Its escape sequence is computed only once at creation.
+
+    .. WARNING:: The colors of a SharedSprixel are shared too. Do not modify them.
+    """
+
+    def __init__(self, model="", bg_color=None, fg_color=None, is_bg_transparent=None):
+        super().__init__(model, bg_color, fg_color, is_bg_transparent)
+        self.__encoded = super().__repr__()
+        self.__frozen = True
+
+    def __setattr__(self, name, value):
+        if name in ["model", "bg_color", "fg_color", "is_bg_transparent"] and getattr(
+            self, "_SharedSprixel__frozen", False
+        ):
+            raise base.PglException(
+                "immutable_sprixel",
+                f"SharedSprixel: {name} cannot be modified because the sprixel is "
+                "shared. Use copy() (or BoardItem.mutable_sprixel()) to get a "
+                "modifiable sprixel.",
+            )
+        super().__setattr__(name, value)
+
+    def __repr__(self):
+        return self.__encoded
+
+
+class SprixelPalette(object):
+    """
+    The SprixelPalette is an interning layer for sprixels (a flyweight factory). It
+    hands out shared immutable sprixels (:class:`SharedSprixel`) keyed by model,
+    background color, foreground color and transparency.
+
+    .. versionadded:: 1.4.0
+
+    Using the palette for sprixels that are repeated a lot (like the void cells of a
+    :class:`~pygamelib.engine.Board`) saves a lot of memory and allocations: all the
+    cells share the same Sprixel instead of each owning a copy.
+
+    The palette used by the engine is available through :meth:`instance`.
+
+    Example::
+
+        palette = SprixelPalette.instance()
+        grass = palette.sprixel(" ", Color(0, 128, 0))
+        # Same model, same colors: same sprixel.
+        grass is palette.sprixel(" ", Color(0, 128, 0))  # True
+    """
+
+    __instance = None
+
+    def __init__(self):
+        self.__sprixels = {}
+
+    @classmethod
+    def instance(cls):
+        """Returns the shared instance of the palette (used by the engine).
+
+        .. versionadded:: 1.4.0
+
+        :return: The default palette.
+        :rtype: :class:`SprixelPalette`
+
+        Example::
+
+           palette = SprixelPalette.instance()
+        """
+        if cls.__instance is None:
+            cls.__instance = cls()
+        return cls.__instance
+
+    def sprixel(self, model="", bg_color=None, fg_color=None, is_bg_transparent=None):
+        """Return the shared sprixel for these model, colors and transparency.
+
+        .. versionadded:: 1.4.0
+
+        The parameters are the same than the :class:`Sprixel` constructor. The colors
+        are copied so modifying them later does not affect the shared sprixel.
+
+        :param model: The model of the sprixel.
+        :type model: str
+        :param bg_color: The background color.
+        :type bg_color: :class:`Color`
+        :param fg_color: The foreground color.
+        :type fg_color: :class:`Color`
+        :param is_bg_transparent: Set the background of the Sprixel to be transparent.
+        :type is_bg_transparent: bool
+        :return: A shared, immutable sprixel.
+        :rtype: :class:`SharedSprixel`
+
+        Example::
+
+            wall = SprixelPalette.instance().sprixel("#", None, Color(128, 128, 128))
+        """
+        if not (bg_color is None or isinstance(bg_color, Color)) or not (
+            fg_color is None or isinstance(fg_color, Color)
+        ):
+            raise base.PglInvalidTypeException(
+                "SprixelPalette.sprixel(model, bg_color, fg_color, is_bg_transparent): "
+                "bg_color and fg_color need to be Color objects (or None)."
+            )
+        # Same default transparency than the Sprixel constructor.
+        if type(is_bg_transparent) is not bool:
+            is_bg_transparent = bg_color is None and (
+                is_bg_transparent is None or is_bg_transparent == ""
+            )
+        key = (
+            model,
+            None if bg_color is None else (bg_color.r, bg_color.g, bg_color.b),
+            None if fg_color is None else (fg_color.r, fg_color.g, fg_color.b),
+            is_bg_transparent,
+        )
+        sprix = self.__sprixels.get(key)
+        if sprix is None:
+            sprix = SharedSprixel(
+                model,
+                None if bg_color is None else bg_color.copy(),
+                None if fg_color is None else fg_color.copy(),
+                is_bg_transparent,
+            )
+            self.__sprixels[key] = sprix
+        return sprix
+
+    def share(self, sprixel):
+        """Return the shared equivalent of a sprixel.
+
+        .. versionadded:: 1.4.0
+
+        :param sprixel: The sprixel to share.
+        :type sprixel: :class:`Sprixel`
+        :return: A shared, immutable sprixel equal to sprixel.
+        :rtype: :class:`SharedSprixel`
+
+        Example::
+
+            palette = SprixelPalette.instance()
+            void_sprixel = palette.share(board.ui_board_void_cell_sprixel)
+        """
+        if isinstance(sprixel, SharedSprixel):
+            return sprixel
+        if not isinstance(sprixel, Sprixel):
+            raise base.PglInvalidTypeException(
+                "SprixelPalette.share(sprixel): sprixel needs to be a Sprixel object."
+            )
+        return self.sprixel(
+            sprixel.model,
+            sprixel.bg_color,
+            sprixel.fg_color,
+            sprixel.is_bg_transparent,
+        )
+
+    def clear(self):
+        """Empty the palette. Sprixels already handed out remain valid.
+
+        .. versionadded:: 1.4.0
+
+        Example::
+
+            SprixelPalette.instance().clear()
+        """
+        self.__sprixels = {}
+
+    def __len__(self):
+        return len(self.__sprixels)
+
+
+# Flags of the attrs field of the FrameBuffer cells.
+_CELL_FG = 1
+_CELL_BG = 2
+_CELL_RAW = 4
+# The fg/bg field holds the index of a color of the 256 colors palette (in its first
+# component) instead of an RGB color.
+_CELL_FG_INDEXED = 8
+_CELL_BG_INDEXED = 16
+# The flags of the SGR styles (bold, dim, italic, underline, blink, reverse, hidden
+# and strike) by SGR code, and the codes that reset them.
+_CELL_STYLES = {code: 32 << idx for idx, code in enumerate((1, 2, 3, 4, 5, 7, 8, 9))}
+_CELL_STYLES_RESETS = {
+    22: _CELL_STYLES[1] | _CELL_STYLES[2],
+    23: _CELL_STYLES[3],
+    24: _CELL_STYLES[4],
+    25: _CELL_STYLES[5],
+    27: _CELL_STYLES[7],
+    28: _CELL_STYLES[8],
+    29: _CELL_STYLES[9],
+}
+# Glyphs above the last unicode code point are interned strings.
+_GLYPH_INTERNED = 0x110000
+# Number of interned glyphs above which the unused ones are dropped.
+_GLYPH_TABLE_SIZE = 4096
+# A pre-rendered cell: SGR sequences, text and an optional reset (the format used
+# by Sprixel.__repr__() for example).
+_SGR_CELL = re.compile(r"^((?:\x1b\[[0-9;]*m)*)([^\x1b]*)(?:\x1b\[0m)?$")
+
+
+def _parse_sgr(sequences):
+    # Decompose SGR sequences into the (fg, bg, attrs) of a cell. Return None if
+    # they use a parameter that a cell cannot hold.
+    fg = bg = (0, 0, 0)
+    attrs = 0
+    params = []
+    for sequence in sequences.split("\x1b[")[1:]:
+        params.extend(sequence[:-1].split(";"))
+    idx = 0
+    while idx < len(params):
+        code = int(params[idx] or 0)
+        idx += 1
+        if code == 0:
+            fg = bg = (0, 0, 0)
+            attrs = 0
+        elif code in _CELL_STYLES:
+            attrs |= _CELL_STYLES[code]
+        elif code in _CELL_STYLES_RESETS:
+            attrs &= ~_CELL_STYLES_RESETS[code]
+        elif code in (38, 48):
+            if idx + 1 < len(params) and params[idx] == "5":
+                color = (int(params[idx + 1] or 0) & 255, 0, 0)
+                indexed = True
+                idx += 2
+            elif idx + 3 < len(params) and params[idx] == "2":
+                color = tuple(int(c or 0) & 255 for c in params[idx + 1 : idx + 4])
+                indexed = False
+                idx += 4
+            else:
+                return None
+            if code == 38:
+                fg = color
+                attrs = (attrs & ~_CELL_FG_INDEXED) | _CELL_FG
+                if indexed:
+                    attrs |= _CELL_FG_INDEXED
+            else:
+                bg = color
+                attrs = (attrs & ~_CELL_BG_INDEXED) | _CELL_BG
+                if indexed:
+                    attrs |= _CELL_BG_INDEXED
+        elif 30 <= code <= 37 or 90 <= code <= 97:
+            fg = (code - 30 if code < 90 else code - 82, 0, 0)
+            attrs |= _CELL_FG | _CELL_FG_INDEXED
+        elif 40 <= code <= 47 or 100 <= code <= 107:
+            bg = (code - 40 if code < 100 else code - 92, 0, 0)
+            attrs |= _CELL_BG | _CELL_BG_INDEXED
+        elif code == 39:
+            fg = (0, 0, 0)
+            attrs &= ~(_CELL_FG | _CELL_FG_INDEXED)
+        elif code == 49:
+            bg = (0, 0, 0)
+            attrs &= ~(_CELL_BG | _CELL_BG_INDEXED)
+        else:
+            return None
+    return fg, bg, attrs
+
+
+def _indexed_sgr_param(index, base_code):
+    # The SGR parameter of a color of the 256 colors palette (base_code is 30 for the
+    # foreground and 40 for the background).
+    if index < 8:
+        return str(base_code + index)
+    if index < 16:
+        return str(base_code + 60 + index - 8)
+    return f"{base_code + 8};5;{index}"
+
+
+class FrameBuffer(object):
+    """
+    A FrameBuffer is a typed frame buffer: an alternative to the NumPy object arrays
+    (of strings and sprixels) used by :class:`~pygamelib.engine.Screen`.
+
+    .. versionadded:: 1.4.0
+
+    All the cells are stored in a single NumPy structured array (:attr:`cells`) of
+    :attr:`CELL_DTYPE`. Each cell has the following fields:
+
+     * glyph: the unicode code point of the character (multi-characters models and
+       raw strings are interned and get an id above the last code point),
+     * fg: the foreground color as an (r, g, b) triplet,
+     * bg: the background color as an (r, g, b) triplet,
+     * attrs: flags telling if the foreground and background colors are set (and
+       if they are RGB colors or colors of the 256 colors palette), the styles of the
+       cell (bold, underline, etc.) and if the glyph is a raw string (a string with
+       escape sequences that cannot be decomposed into colors, styles and text),
+     * width: the display width of the glyph.
+
+    Clearing (:meth:`fill`), compositing (:meth:`blit`) and comparing
+    (:meth:`diff`) frames are therefore vectorized operations.
+
+    A FrameBuffer can also be used like the object arrays:
+    buffer[row][column] = value, where value is a :class:`Sprixel` or a string, and
+    buffer[row][column] returns a :class:`Sprixel` (or the string for raw strings).
+    Slicing it in 2 dimensions returns a FrameBuffer that is a view on the same
+    cells. That way, all the render_to_buffer() methods work with a FrameBuffer.
+
+    Example::
+
+        buffer = FrameBuffer(80, 24)
+        buffer[0][0] = Sprixel("@", Color(0, 0, 0), Color(255, 255, 0))
+        sprite_cells = FrameBuffer.encode_array(
+            [[Sprixel(" ", Color(255, 0, 0)), Sprixel(" ", Color(0, 255, 0))]]
+        )
+        buffer.blit(sprite_cells, 10, 10)
+    """
+
+    CELL_DTYPE = np.dtype(
+        [
+            ("glyph", np.uint32),
+            ("fg", np.uint8, (3,)),
+            ("bg", np.uint8, (3,)),
+            ("attrs", np.uint16),
+            ("width", np.uint16),
+        ]
+    )
+
+    # Shared by all frame buffers so glyph ids and styles are the same everywhere.
+    # The interned glyphs that are not used anymore are dropped when the table is
+    # full (see __collect_glyphs), their ids are never reused.
+    __glyphs = {}
+    __glyph_strings = {}
+    __glyph_id = _GLYPH_INTERNED
+    __glyph_table_size = _GLYPH_TABLE_SIZE
+    __recent_glyphs = set()
+    __buffers = weakref.WeakSet()
+    __styles = {}
+    __encoded = {}
+
+    def __init__(self, width=None, height=None, fill=" "):
+        """
+        :param width: The width of the buffer.
+        :type width: int
+        :param height: The height of the buffer.
+        :type height: int
+        :param fill: The initial value of all the cells.
+        :type fill: :class:`Sprixel` | str
+        """
+        if type(width) is not int or type(height) is not int:
+            raise base.PglInvalidTypeException(
+                "FrameBuffer(width, height, fill): width and height need to be int."
+            )
+        self.__cells = np.empty((height, width), dtype=FrameBuffer.CELL_DTYPE)
+        FrameBuffer.__buffers.add(self)
+        self.fill(fill)
+
+    @classmethod
+    def _from_cells(cls, cells):
+        # Wrap an existing array of cells (usually a view) without copying it.
+        buffer = cls.__new__(cls)
+        buffer.__cells = cells
+        FrameBuffer.__buffers.add(buffer)
+        return buffer
+
+    @property
+    def cells(self):
+        """The structured NumPy array of the cells (read only property).
+
+        .. versionadded:: 1.4.0
+        """
+        return self.__cells
+
+    @property
+    def shape(self):
+        """The shape of the buffer: (height, width) (read only property).
+
+        .. versionadded:: 1.4.0
+        """
+        return self.__cells.shape
+
+    @property
+    def width(self):
+        """The width of the buffer (read only property).
+
+        .. versionadded:: 1.4.0
+        """
+        return self.__cells.shape[1]
+
+    @property
+    def height(self):
+        """The height of the buffer (read only property).
+
+        .. versionadded:: 1.4.0
+        """
+        return self.__cells.shape[0]
+
+    @classmethod
+    def glyph(cls, text):
+        """Return the glyph id of a string.
+
+        .. versionadded:: 1.4.0
+
+        :param text: The text of the cell.
+        :type text: str
+        :return: The code point of text if it is a single character, an interned id
+           otherwise.
+        :rtype: int
+
+        Example::
+
+            FrameBuffer.glyph("@")  # 64
+        """
+        if len(text) == 1:
+            return ord(text)
+        glyph = cls.__glyphs.get(text)
+        if glyph is None:
+            if len(cls.__glyphs) >= cls.__glyph_table_size:
+                cls.__collect_glyphs()
+            glyph = cls.__glyph_id
+            FrameBuffer.__glyph_id += 1
+            cls.__glyphs[text] = glyph
+            cls.__glyph_strings[glyph] = text
+        cls.__recent_glyphs.add(glyph)
+        return glyph
+
+    @classmethod
+    def __collect_glyphs(cls):
+        # Drop the interned glyphs that are not in a frame buffer and were not used
+        # since the last collection (the cells being encoded may not be in a frame
+        # buffer yet).
+        used = set(cls.__recent_glyphs)
+        for buffer in list(cls.__buffers):
+            glyphs = buffer.__cells["glyph"]
+            used.update(np.unique(glyphs[glyphs >= _GLYPH_INTERNED]).tolist())
+        for text, glyph in list(cls.__glyphs.items()):
+            if glyph not in used:
+                del cls.__glyphs[text]
+                del cls.__glyph_strings[glyph]
+        cls.__recent_glyphs.clear()
+        cls.__encoded.clear()
+        # If most of the glyphs are in use, the table grows instead.
+        FrameBuffer.__glyph_table_size = max(
+            _GLYPH_TABLE_SIZE, 2 * len(cls.__glyphs)
+        )
+
+    @classmethod
+    def interned_glyphs(cls):
+        """Return the number of interned glyphs (multi-characters models and raw
+        strings) known by the frame buffers.
+
+        .. versionadded:: 1.4.0
+
+        :rtype: int
+        """
+        return len(cls.__glyphs)
+
+    @classmethod
+    def glyph_text(cls, glyph):
+        """Return the string of a glyph id (the reverse of :meth:`glyph`).
+
+        .. versionadded:: 1.4.0
+
+        :param glyph: A glyph id.
+        :type glyph: int
+        :rtype: str
+        """
+        if glyph < _GLYPH_INTERNED:
+            return chr(glyph)
+        return cls.__glyph_strings.get(glyph, "")
+
+    @classmethod
+    def encode(cls, value):
+        """Encode a value into a cell record.
+
+        .. versionadded:: 1.4.0
+
+        :param value: A sprixel or a string (a pre-rendered cell like the ones
+           produced by Sprixel.__repr__() for example). Other objects are converted to
+           strings.
+        :type value: :class:`Sprixel` | str
+        :return: A record that can be stored in the cells array.
+        :rtype: tuple
+
+        Example::
+
+            buffer.cells[0, 0] = FrameBuffer.encode(Sprixel("#"))
+        """
+        if isinstance(value, Sprixel):
+            attrs = 0
+            fg = bg = (0, 0, 0)
+            if value.fg_color is not None:
+                attrs |= _CELL_FG
+                fg = (value.fg_color.r, value.fg_color.g, value.fg_color.b)
+            if value.bg_color is not None:
+                attrs |= _CELL_BG
+                bg = (value.bg_color.r, value.bg_color.g, value.bg_color.b)
+            return (cls.glyph(value.model), fg, bg, attrs, min(value.length, 65535))
+        if isinstance(value, np.void) and value.dtype == cls.CELL_DTYPE:
+            return value
+        if type(value) is not str:
+            value = str(value)
+        record = cls.__encoded.get(value)
+        if record is None:
+            match = _SGR_CELL.match(value)
+            parsed = None if match is None else _parse_sgr(match.group(1))
+            if parsed is None:
+                text = value
+                record = (cls.glyph(value), (0, 0, 0), (0, 0, 0), _CELL_RAW)
+            else:
+                text = match.group(2)
+                record = (cls.glyph(text),) + parsed
+            record += (min(base.Console.instance().length(text), 65535),)
+            if len(cls.__encoded) >= 4096:
+                cls.__encoded.clear()
+            cls.__encoded[value] = record
+        return record
+
+    @classmethod
+    def decode(cls, record):
+        """Decode a cell record.
+
+        .. versionadded:: 1.4.0
+
+        :param record: A cell of the cells array.
+        :type record: numpy.void
+        :return: A sprixel, or a string if the cell holds a raw string or uses
+           styles or palette colors (that a sprixel cannot hold).
+        :rtype: :class:`Sprixel` | str
+        """
+        attrs = int(record["attrs"])
+        text = cls.glyph_text(int(record["glyph"]))
+        if attrs & _CELL_RAW:
+            return text
+        if attrs & ~(_CELL_FG | _CELL_BG):
+            style = (
+                (attrs << 48)
+                | (int(record["fg"][0]) << 40)
+                | (int(record["fg"][1]) << 32)
+                | (int(record["fg"][2]) << 24)
+                | (int(record["bg"][0]) << 16)
+                | (int(record["bg"][1]) << 8)
+                | int(record["bg"][2])
+            )
+            sgr = cls.__styles.get(style)
+            if sgr is None:
+                sgr = cls.__sgr(style)
+            return f"{sgr}{text}\x1b[0m"
+        bg_color = fg_color = None
+        if attrs & _CELL_BG:
+            bg_color = Color(*record["bg"].tolist())
+        if attrs & _CELL_FG:
+            fg_color = Color(*record["fg"].tolist())
+        return Sprixel(text, bg_color, fg_color)
+
+    @classmethod
+    def encode_array(cls, values):
+        """Encode a 2 dimensions array (or list of lists) of values into an array of
+        cells that can be blitted into a FrameBuffer.
+
+        .. versionadded:: 1.4.0
+
+        :param values: The values to encode (see :meth:`encode`).
+        :type values: list | numpy.array
+        :rtype: numpy.array
+
+        Example::
+
+            cells = FrameBuffer.encode_array([[Sprixel("#"), Sprixel("#")]])
+        """
+        height = len(values)
+        width = len(values[0]) if height > 0 else 0
+        cells = np.empty((height, width), dtype=cls.CELL_DTYPE)
+        encode = cls.encode
+        for row in range(0, height):
+            cells[row] = [encode(value) for value in values[row]]
+        return cells
+
+    def fill(self, value):
+        """Set all the cells of the buffer to the same value.
+
+        .. versionadded:: 1.4.0
+
+        :param value: The value (see :meth:`encode`).
+        :type value: :class:`Sprixel` | str
+
+        Example::
+
+            buffer.fill(Sprixel(" "))
+        """
+        self.__cells[...] = self.encode(value)
+
+    def blit(self, cells, row, column, mask=None):
+        """Copy an array of cells into the buffer at the given position. The parts
+        that fall outside of the buffer are clipped.
+
+        .. versionadded:: 1.4.0
+
+        :param cells: The cells to copy (see :meth:`encode_array`).
+        :type cells: numpy.array | :class:`FrameBuffer`
+        :param row: The row of the buffer where the top left cell goes.
+        :type row: int
+        :param column: The column of the buffer where the top left cell goes.
+        :type column: int
+        :param mask: An optional boolean array of the same shape as cells. Only the
+           cells where the mask is True are copied.
+        :type mask: numpy.array
+
+        Example::
+
+            buffer.blit(sprite_cells, 10, 10, sprite_cells["glyph"] != 0)
+        """
+        if isinstance(cells, FrameBuffer):
+            cells = cells.cells
+        height, width = self.__cells.shape
+        top = max(row, 0)
+        left = max(column, 0)
+        bottom = min(row + cells.shape[0], height)
+        right = min(column + cells.shape[1], width)
+        if top >= bottom or left >= right:
+            return
+        src = (slice(top - row, bottom - row), slice(left - column, right - column))
+        if mask is None:
+            self.__cells[top:bottom, left:right] = cells[src]
+        else:
+            np.copyto(self.__cells[top:bottom, left:right], cells[src], where=mask[src])
+
+    def diff(self, other):
+        """Compare the buffer with another one of the same shape.
+
+        .. versionadded:: 1.4.0
+
+        :param other: The buffer (or array of cells) to compare with.
+        :type other: :class:`FrameBuffer` | numpy.array
+        :return: A boolean array that is True for the cells that differ.
+        :rtype: numpy.array
+
+        Example::
+
+            changed_rows = buffer.diff(previous_buffer).any(axis=1)
+        """
+        if isinstance(other, FrameBuffer):
+            other = other.cells
+        if other.shape != self.__cells.shape:
+            raise base.PglException(
+                "frame_buffer_shape_mismatch",
+                "FrameBuffer.diff(other): other needs to have the same shape.",
+            )
+        shape = self.__cells.shape + (7,)
+        # A cell is 14 bytes: compare them as 7 integers.
+        words = np.ascontiguousarray(self.__cells).view(np.uint16).reshape(shape)
+        other = np.ascontiguousarray(other).view(np.uint16).reshape(shape)
+        return (words != other).any(axis=2)
+
+    def copy(self):
+        """Return a copy of the buffer.
+
+        .. versionadded:: 1.4.0
+        """
+        return FrameBuffer._from_cells(self.__cells.copy())
+
+    def split_rows(self, rows=None):
+        """Return rows of the buffer as lists of (sgr, text) tuples, where sgr is the
+        SGR sequence (colors) the text needs to be printed with. This is the format
+        used by the output encoder of :class:`~pygamelib.engine.Screen`.
+
+        .. versionadded:: 1.4.0
+
+        :param rows: The indexes of the rows to split (all of them by default).
+        :type rows: list
+        :rtype: list
+        """
+        cells = self.__cells if rows is None else self.__cells[rows]
+        fg = cells["fg"].astype(np.int64)
+        bg = cells["bg"].astype(np.int64)
+        # One integer per style (attributes and colors).
+        styles = (
+            (cells["attrs"].astype(np.int64) << 48)
+            | (fg[..., 0] << 40)
+            | (fg[..., 1] << 32)
+            | (fg[..., 2] << 24)
+            | (bg[..., 0] << 16)
+            | (bg[..., 1] << 8)
+            | bg[..., 2]
+        ).tolist()
+        glyphs = cells["glyph"].tolist()
+        sgr_cache = FrameBuffer.__styles
+        glyph_strings = FrameBuffer.__glyph_strings
+        split = []
+        for row in range(0, len(glyphs)):
+            split_row = []
+            append = split_row.append
+            for glyph, style in zip(glyphs[row], styles[row]):
+                sgr = sgr_cache.get(style)
+                if sgr is None:
+                    sgr = FrameBuffer.__sgr(style)
+                if glyph < _GLYPH_INTERNED:
+                    append((sgr, chr(glyph)))
+                else:
+                    append((sgr, glyph_strings.get(glyph, "")))
+            split.append(split_row)
+        return split
+
+    @classmethod
+    def __sgr(cls, style):
+        # Build (and cache) the SGR sequence of a style.
+        attrs = style >> 48
+        sgr = ""
+        if not attrs & _CELL_RAW:
+            t = base.Console.instance()
+            params = [str(code) for code, flag in _CELL_STYLES.items() if attrs & flag]
+            if params:
+                sgr += f"\x1b[{';'.join(params)}m"
+            if attrs & _CELL_BG_INDEXED:
+                sgr += f"\x1b[{_indexed_sgr_param((style >> 16) & 255, 40)}m"
+            elif attrs & _CELL_BG:
+                sgr += t.on_color_rgb(
+                    (style >> 16) & 255, (style >> 8) & 255, style & 255
+                )
+            if attrs & _CELL_FG_INDEXED:
+                sgr += f"\x1b[{_indexed_sgr_param((style >> 40) & 255, 30)}m"
+            elif attrs & _CELL_FG:
+                sgr += t.color_rgb(
+                    (style >> 40) & 255, (style >> 32) & 255, (style >> 24) & 255
+                )
+        if len(cls.__styles) >= 4096:
+            cls.__styles.clear()
+        cls.__styles[style] = sgr
+        return sgr
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            return _FrameBufferRow(self.__cells[key])
+        cells = self.__cells[key]
+        if cells.ndim == 0:
+            return self.decode(cells)
+        if cells.ndim == 1:
+            return _FrameBufferRow(cells)
+        return FrameBuffer._from_cells(cells)
+
+    def __setitem__(self, key, value):
+        if isinstance(value, FrameBuffer):
+            value = value.cells
+        if not isinstance(value, np.ndarray):
+            value = self.encode(value)
+        self.__cells[key] = value
+
+    def __len__(self):
+        return self.__cells.shape[0]
+
+    def __iter__(self):
+        for cells in self.__cells:
+            yield _FrameBufferRow(cells)
+
+
+class _FrameBufferRow(object):
+    # A row of a FrameBuffer. It encodes and decodes the cells on the fly so the
+    # buffer[row][column] syntax works.
+    __slots__ = ("_cells",)
+
+    def __init__(self, cells):
+        self._cells = cells
+
+    def __getitem__(self, key):
+        cells = self._cells[key]
+        if cells.ndim == 0:
+            return FrameBuffer.decode(cells)
+        return [FrameBuffer.decode(cell) for cell in cells]
+
+    def __setitem__(self, key, value):
+        if isinstance(value, list):
+            value = [FrameBuffer.encode(v) for v in value]
+        elif not isinstance(value, np.ndarray):
+            value = FrameBuffer.encode(value)
+        self._cells[key] = value
+
+    def __len__(self):
+        return self._cells.shape[0]
+
+
 class Sprite(base.PglBaseObject):
     """
     The Sprite object represent a 2D "image" that can be used to represent any complex
@@ -1057,6 +1859,8 @@ class Sprite(base.PglBaseObject):
             self.default_sprixel = default_sprixel
         self.row_offset = 0
         self.column_offset = 0
+        # Opacity mask and opaque spans, computed on demand (see opacity_mask).
+        self._opacity = None
         # Double linking here, GC will hate it...
         self._initial_text_object = None
         if self.name is None or type(self.name) is not str:
@@ -1099,6 +1903,7 @@ class Sprite(base.PglBaseObject):
             [self.default_sprixel for i in range(0, self.size[0])]
             for j in range(0, self.size[1])
         ]
+        self._opacity = None
 
     def copy(self):
         """
@@ -1198,6 +2003,7 @@ class Sprite(base.PglBaseObject):
                 "Sprite.set_sprixel(row, column, val) val needs to be a Sprixel"
             )
         self._sprixels[row][column] = value
+        self._opacity = None
         self.notify(
             self,
             "pygamelib.gfx.core.Sprite.sprixel:changed",
@@ -1316,6 +2122,7 @@ class Sprite(base.PglBaseObject):
                     for column in range(len(sprixels_list[row]), max_width):
                         sprixels_list[row].append(default_sprixel)
             new_sprite._sprixels = sprixels_list
+            new_sprite._opacity = None
             new_sprite.size = [max_width, height]
         return new_sprite
 
@@ -1413,6 +2220,7 @@ class Sprite(base.PglBaseObject):
                 max_width = width
             height += 1
         self.size = [max_width, height]
+        self._opacity = None
         return self.size
 
     def set_transparency(self, state):
@@ -1496,6 +2304,86 @@ class Sprite(base.PglBaseObject):
         self.calculate_size()
         return self.size[1]
 
+    @property
+    def opacity_mask(self):
+        """
+        Property that returns the opacity mask of the Sprite.
+
+        .. versionadded:: 1.4.0
+
+        The mask is a numpy array of booleans with the shape (height, width) of the
+        sprite. A cell is True when the sprixel is opaque and False when it is a null
+        sprixel (i.e: :class:`Sprixel()`) or None. Null sprixels are not rendered: the
+        content behind them is left untouched.
+
+        The mask and the opaque spans (see :py:attr:`opaque_spans`) are computed once
+        and then cached until :py:meth:`set_sprixel`, :py:meth:`empty` or
+        :py:meth:`calculate_size` is called.
+
+        .. WARNING:: Modifying the sprixels of the sprite in place (like
+           `sprite.sprixel(0, 0).model = ""`) does not update the mask. In that case,
+           use :py:meth:`set_sprixel` or call :py:meth:`calculate_size` afterward.
+
+        Example::
+
+            if not sprite.opacity_mask.any():
+                print("This sprite is invisible!")
+        """
+        return self.__opacity()[0]
+
+    @property
+    def opaque_spans(self):
+        """
+        Property that returns the contiguous opaque spans of each row of the Sprite.
+
+        .. versionadded:: 1.4.0
+
+        It is a list with one element per row. Each element is a list of
+        (start, end, narrow) tuples, where start and end are the first and last + 1
+        columns of a run of opaque sprixels, and narrow is True if all the sprixels of
+        the run are 1 character wide.
+
+        This is what :py:meth:`render_to_buffer` uses to copy the sprite to the frame
+        buffer. Like :py:attr:`opacity_mask`, it is cached.
+
+        Example::
+
+            for start, end, narrow in sprite.opaque_spans[0]:
+                print(f"Columns {start} to {end - 1} are opaque.")
+        """
+        return self.__opacity()[1]
+
+    def __opacity(self):
+        if self._opacity is not None:
+            return self._opacity
+        null_sprixel = Sprixel()
+        width, height = self.size
+        mask = np.zeros((height, width), dtype=bool)
+        spans = []
+        for r in range(0, height):
+            line = self._sprixels[r]
+            row_spans = []
+            start = None
+            narrow = True
+            for c in range(0, min(width, len(line))):
+                sprix = line[c]
+                if sprix is None or sprix == null_sprixel:
+                    if start is not None:
+                        row_spans.append((start, c, narrow))
+                        start = None
+                    continue
+                mask[r, c] = True
+                if start is None:
+                    start = c
+                    narrow = True
+                if sprix.length != 1:
+                    narrow = False
+            if start is not None:
+                row_spans.append((start, min(width, len(line)), narrow))
+            spans.append(row_spans)
+        self._opacity = (mask, spans)
+        return self._opacity
+
     @classmethod
     def load(cls, data):
         """
@@ -1662,10 +2550,14 @@ class Sprite(base.PglBaseObject):
 
         .. versionadded:: 1.3.0
 
+        .. versionchanged:: 1.4.0
+           The sprite is copied by contiguous opaque spans (see
+           :py:attr:`opaque_spans`) instead of sprixel by sprixel.
+
         This method is automatically called by :func:`pygamelib.engine.Screen.render`.
 
         :param buffer: A screen buffer to render the item into.
-        :type buffer: numpy.array
+        :type buffer: numpy.array | :class:`FrameBuffer`
         :param row: The row to render in.
         :type row: int
         :param column: The column to render in.
@@ -1693,24 +2585,68 @@ class Sprite(base.PglBaseObject):
 
         ro = self.row_offset
         co = self.column_offset
-        # Attempt at optimization.
+        # The sprite is copied span by span: null sprixels are transparent and the
+        # spans are cached (see opaque_spans).
+        spans = self.opaque_spans
+        sprixels = self._sprixels
         null_sprixel = Sprixel()
-        get_sprixel = self.sprixel
-        for sr in range(row, min(self.size[1] + row, buffer_height)):
-            for sc in range(column, min(self.size[0] + column, buffer_width)):
-                sprix = get_sprixel(sr - row + ro, sc - column + co)
-                # Need to check the empty/null sprixel in the sprite
-                # because for the sprite we just skip and leave the
-                # sprixel that is behind but when it comes to screen we
-                # cannot leave a blank cell.
-                if sprix == null_sprixel:
+        height = min(self.size[1] - ro, buffer_height - row)
+        width = min(self.size[0] - co, buffer_width - column)
+        if height <= 0 or width <= 0:
+            return
+        if isinstance(buffer, FrameBuffer):
+            # Encode the visible part of the sprite and copy it in one go. The extra
+            # column is for a wide sprixel on the last column.
+            block_width = min(width + 1, buffer_width - column)
+            encode = FrameBuffer.encode
+            continuation = encode(null_sprixel)
+            cells = np.empty((height, block_width), dtype=FrameBuffer.CELL_DTYPE)
+            mask = np.zeros((height, block_width), dtype=bool)
+            for r in range(0, height):
+                line = sprixels[r + ro]
+                for start, end, narrow in spans[r + ro]:
+                    start = max(start - co, 0)
+                    end = min(end - co, width)
+                    if start >= end:
+                        continue
+                    mask[r, start:end] = True
+                    if narrow:
+                        cells[r, start:end] = [
+                            encode(sprix) for sprix in line[start + co : end + co]
+                        ]
+                        continue
+                    for c in range(start, end):
+                        sprix = line[c + co]
+                        cells[r, c] = encode(sprix)
+                        for wc in range(c + 1, min(c + sprix.length, block_width)):
+                            cells[r, wc] = continuation
+                            mask[r, wc] = True
+            buffer.blit(cells, row, column, mask)
+            return
+        # The parts of the sprite that are above or on the left of the buffer are
+        # clipped.
+        left = max(-column, 0)
+        for r in range(max(-row, 0), height):
+            line = sprixels[r + ro]
+            buffer_row = buffer[row + r]
+            for start, end, narrow in spans[r + ro]:
+                start = max(start - co, left)
+                end = min(end - co, width)
+                if start >= end:
+                    continue
+                if narrow:
+                    buffer_row[column + start : column + end] = line[
+                        start + co : end + co
+                    ]
                     continue
-                # TODO: If the Sprite has sprixels with length > 1 this
-                # is going to be a mess.
-                # buffer[sr][sc] = sprix.__repr__()
-                buffer[sr][sc] = sprix
-                for c in range(sc + 1, sc + sprix.length):
-                    buffer[sr][c] = null_sprixel
+                # Wide sprixels: the cells they cover are replaced by null sprixels.
+                for c in range(start, end):
+                    sprix = line[c + co]
+                    buffer_row[column + c] = sprix
+                    for wc in range(
+                        column + c + 1, min(column + c + sprix.length, buffer_width)
+                    ):
+                        buffer_row[wc] = null_sprixel
 
 
 class SpriteCollection(UserDict):
@@ -2403,6 +3339,11 @@ class Font:
     Glyphs are cached (particularly if you change the colors) so it is always beneficial
     to reuse a font object.
 
+    .. versionchanged:: 1.4.0
+       The cache of colored glyphs is a bounded LRU (least recently used) cache. Its
+       limits are set with the glyphs_cache_size and glyphs_cache_max_sprixels
+       parameters and its statistics are returned by :func:`glyphs_cache_info`.
+
     Example::
 
         myfont = Font("8bits")
@@ -2412,7 +3353,13 @@ class Font:
 
     """
 
-    def __init__(self, font_name: str = None, search_directories: list = None) -> None:
+    def __init__(
+        self,
+        font_name: str = None,
+        search_directories: list = None,
+        glyphs_cache_size: int = 512,
+        glyphs_cache_max_sprixels: int = None,
+    ) -> None:
         """
 
         :param font_name: The name of the font to load upon object construction.
@@ -2420,6 +3367,13 @@ class Font:
         :param search_directories: A list of directories to search for the font. The
            items of the list are strings representing a relative or absolute path.
         :type search_directories: list
+        :param glyphs_cache_size: The maximum number of colored glyphs kept in cache
+           (default: 512).
+        :type glyphs_cache_size: int
+        :param glyphs_cache_max_sprixels: The maximum number of sprixels held by the
+           cached glyphs (None for no limit). As glyphs sizes differ greatly from one
+           font to another, it is a better bound of the memory used by the cache.
+        :type glyphs_cache_max_sprixels: int
 
         .. important:: The search directories **must** contain a "fonts" directory, that
            itself contains the font at the correct format.
@@ -2439,7 +3393,25 @@ class Font:
         """
         # TODO: Add a parameter to specify a list of directories to look into.
         super().__init__()
-        self.__glyphs_cache = {}
+        if type(glyphs_cache_size) is not int or glyphs_cache_size < 1:
+            raise base.PglInvalidTypeException(
+                "Font(): glyphs_cache_size needs to be a strictly positive integer."
+            )
+        if glyphs_cache_max_sprixels is not None and (
+            type(glyphs_cache_max_sprixels) is not int or glyphs_cache_max_sprixels < 1
+        ):
+            raise base.PglInvalidTypeException(
+                "Font(): glyphs_cache_max_sprixels needs to be None or a strictly "
+                "positive integer."
+            )
+        # The colored glyphs, from the least to the most recently used.
+        self.__glyphs_cache = OrderedDict()
+        self.__glyphs_cache_size = glyphs_cache_size
+        self.__glyphs_cache_max_sprixels = glyphs_cache_max_sprixels
+        self.__glyphs_cache_sprixels = 0
+        self.__glyphs_cache_hits = 0
+        self.__glyphs_cache_misses = 0
+        self.__glyphs_cache_evictions = 0
         self.__config = None
         self.__sprite_collection = None
         self.__name = None
@@ -2602,18 +3574,91 @@ class Font:
         """
         return self.__name
 
-    @staticmethod
-    def __glyph_colors_to_string(
-        glyph_name: str = None, fg_color: Color = None, bg_color: Color = None
-    ) -> str:
-        # Serialize a glyph and its colors as a string.
-        serstr = glyph_name
-        for c in (fg_color, bg_color):
-            if c is None:
-                serstr = f"{serstr}:{-1}:{-1}:{-1}"
-            else:
-                serstr = f"{serstr}:{c.r}:{c.g}:{c.b}"
-        return serstr
+    def glyphs_cache_info(self) -> dict:
+        """
+        Return the statistics of the colored glyphs cache.
+
+        .. versionadded:: 1.4.0
+
+        The returned dictionary has the following keys:
+
+         * hits: the number of glyphs returned from the cache.
+         * misses: the number of glyphs that had to be built.
+         * evictions: the number of glyphs removed from the cache to respect the
+           limits.
+         * size: the number of glyphs in the cache.
+         * max_size: the maximum number of glyphs in the cache.
+         * sprixels: the number of sprixels held by the cached glyphs.
+         * max_sprixels: the maximum number of sprixels held by the cached glyphs (or
+           None).
+
+        :rtype: dict
+
+        Example::
+
+            info = myfont.glyphs_cache_info()
+            print(f"Hit ratio: {info['hits'] / (info['hits'] + info['misses'])}")
+        """
+        return {
+            "hits": self.__glyphs_cache_hits,
+            "misses": self.__glyphs_cache_misses,
+            "evictions": self.__glyphs_cache_evictions,
+            "size": len(self.__glyphs_cache),
+            "max_size": self.__glyphs_cache_size,
+            "sprixels": self.__glyphs_cache_sprixels,
+            "max_sprixels": self.__glyphs_cache_max_sprixels,
+        }
+
+    def clear_glyphs_cache(self) -> None:
+        """
+        Empty the colored glyphs cache. The statistics are reset too.
+
+        .. versionadded:: 1.4.0
+
+        Example::
+
+            myfont.clear_glyphs_cache()
+        """
+        self.__glyphs_cache.clear()
+        self.__glyphs_cache_sprixels = 0
+        self.__glyphs_cache_hits = 0
+        self.__glyphs_cache_misses = 0
+        self.__glyphs_cache_evictions = 0
+
+    def __colorize(self, glyph_name: str, fg_color: Color, bg_color: Color) -> Sprite:
+        # Build a copy of the glyph where the colors of the font are replaced. The
+        # colors are copied so the cached glyph cannot be modified by a change of the
+        # colors given in parameters.
+        source = self.__sprite_collection[glyph_name]
+        cfg_fg = self.__config["fg_color"]
+        cfg_bg = self.__config["bg_color"]
+        colors = (fg_color, bg_color)
+        sprixels = []
+        for r in range(0, source.size[1]):
+            line = []
+            for sprix in source.sprixel(r):
+                fg = sprix.fg_color
+                bg = sprix.bg_color
+                if fg == cfg_fg:
+                    fg = colors[0]
+                elif fg == cfg_bg:
+                    fg = colors[1]
+                if bg == cfg_fg:
+                    bg = colors[0]
+                elif bg == cfg_bg:
+                    bg = colors[1]
+                line.append(
+                    Sprixel(
+                        sprix.model,
+                        None if bg is None else bg.copy(),
+                        None if fg is None else fg.copy(),
+                        sprix.is_bg_transparent,
+                    )
+                )
+            sprixels.append(line)
+        return Sprite(
+            sprixels, source.default_sprixel.copy(), source.parent, name=source.name
+        )
 
     def glyph(
         self,
@@ -2654,24 +3699,31 @@ class Font:
             glyph_name = "default"
         if fg_color is None and bg_color is None:
             return self.__sprite_collection[glyph_name]
-        else:
-            gcolstr = Font.__glyph_colors_to_string(glyph_name, fg_color, bg_color)
-            if gcolstr in self.__glyphs_cache.keys():
-                return self.__glyphs_cache[gcolstr]
-            else:
-                # new_sprite = copy.deepcopy(self.__sprite_collection[glyph_name])
-                new_sprite = self.__sprite_collection[glyph_name].copy()
-                sprite_sprixel = new_sprite.sprixel
-                cfg = self.__config
-                for r in range(new_sprite.height):
-                    for c in range(new_sprite.width):
-                        if sprite_sprixel(r, c).fg_color == cfg["fg_color"]:
-                            sprite_sprixel(r, c).fg_color = fg_color
-                        elif sprite_sprixel(r, c).fg_color == cfg["bg_color"]:
-                            sprite_sprixel(r, c).fg_color = bg_color
-                        if sprite_sprixel(r, c).bg_color == cfg["fg_color"]:
-                            sprite_sprixel(r, c).bg_color = fg_color
-                        elif sprite_sprixel(r, c).bg_color == cfg["bg_color"]:
-                            sprite_sprixel(r, c).bg_color = bg_color
-                self.__glyphs_cache[gcolstr] = new_sprite
-                return new_sprite
+        key = (
+            glyph_name,
+            None if fg_color is None else (fg_color.r, fg_color.g, fg_color.b),
+            None if bg_color is None else (bg_color.r, bg_color.g, bg_color.b),
+        )
+        cache = self.__glyphs_cache
+        new_sprite = cache.get(key)
+        if new_sprite is not None:
+            cache.move_to_end(key)
+            self.__glyphs_cache_hits += 1
+            return new_sprite
+        self.__glyphs_cache_misses += 1
+        new_sprite = self.__colorize(glyph_name, fg_color, bg_color)
+        cache[key] = new_sprite
+        self.__glyphs_cache_sprixels += new_sprite.size[0] * new_sprite.size[1]
+        # Evict the least recently used glyphs (but never the one just built).
+        max_sprixels = self.__glyphs_cache_max_sprixels
+        while len(cache) > 1 and (
+            len(cache) > self.__glyphs_cache_size
+            or (
+                max_sprixels is not None
+                and self.__glyphs_cache_sprixels > max_sprixels
+            )
+        ):
+            _, evicted = cache.popitem(last=False)
+            self.__glyphs_cache_sprixels -= evicted.size[0] * evicted.size[1]
+            self.__glyphs_cache_evictions += 1
+        return new_sprite
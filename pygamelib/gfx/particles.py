@@ -132,6 +132,9 @@ class Particle(base.PglBaseObject):
         self.sprixel = sprixel
         if sprixel is None:
             self.sprixel = core.Sprixel(graphics.GeometricShapes.BULLET)
+        # The sprixel written in the frame buffer. It is allocated once and updated
+        # from the live sprixel at each rendering (see _rendered_sprixel()).
+        self._rendered = None
         self.__last_update = time.time()
 
     def serialize(self):
@@ -374,12 +377,39 @@ class Particle(base.PglBaseObject):
         self.lifespan -= 1
         self.__last_update = now
 
+    def _rendered_sprixel(self, bg_color: core.Color = None) -> core.Sprixel:
+        # Return the sprixel the particle renders into (never the live one, the next
+        # particles on the same cell might modify it). It is created once and then
+        # updated in place: only the attributes that differ are set, so rendering does
+        # not allocate anything.
+        source = self.sprixel
+        rendered = self._rendered
+        if rendered is None or type(rendered) is not type(source):
+            rendered = copy(source)
+            # The copy shares the observers of the live sprixel.
+            rendered._observers = []
+            rendered.bg_color = bg_color
+            self._rendered = rendered
+            return rendered
+        if rendered.model != source.model:
+            rendered.model = source.model
+        if rendered.fg_color is not source.fg_color:
+            rendered.fg_color = source.fg_color
+        if rendered.bg_color is not bg_color:
+            rendered.bg_color = bg_color
+        rendered.is_bg_transparent = source.is_bg_transparent
+        return rendered
+
     def render(self, sprixel: core.Sprixel = None):
         """
         Render the particle as a :class:`~pygamelib.gfx.core.Sprixel`. This method is
         called by the :class:`~pygamelib.gfx.particles.ParticleEmitter` render_to_buffer
         method.
 
+        .. versionchanged:: 1.4.0
+           The returned sprixel is owned by the particle and reused from one rendering
+           to the next (only its attributes are updated) instead of being a new copy.
+
         It takes a :class:`~pygamelib.gfx.core.Sprixel` as a parameter. This Sprixel is
         given by the ParticleEmitter.render_to_buffer() method and if it is not None,
         the particle will render itself into that :class:`~pygamelib.gfx.core.Sprixel`
@@ -407,21 +437,13 @@ class Particle(base.PglBaseObject):
         elif isinstance(sprixel, core.Sprixel):
             # This sprixel might be modified later in the rendering cycle so we want to
             # make sure that the next particle will only overide the rendered sprixel,
-            # not our live one. While preserving the
-            # NOTE: on the other hand, the model is overwritten at each update... I need
-            # to test to see if I could save the copy...
-            # ret = deepcopy(self.sprixel)
-            ret = copy(self.sprixel)
-            ret.bg_color = sprixel.bg_color
-            return ret
+            # not our live one. While preserving the background color of the cell.
+            return self._rendered_sprixel(sprixel.bg_color)
         else:
             # This sprixel might be modified later in the rendering cycle so we want to
             # make sure that the next particle will only overide the rendered sprixel,
             # not our live one.
-            # NOTE: on the other hand, the model is overwritten at each update... I need
-            # to test to see if I could save the copy...
-            # return deepcopy(self.sprixel)
-            return copy(self.sprixel)
+            return self._rendered_sprixel(self.sprixel.bg_color)
 
     def finished(self) -> bool:
         """
@@ -1051,19 +1073,13 @@ class PartitionParticle(Particle):
         elif isinstance(sprixel, core.Sprixel):
             # This sprixel might be modified later in the rendering cycle so we want to
             # make sure that the next particle will only overide the rendered sprixel,
-            # not our live one. While preserving the
-            # NOTE: on the other hand, the model is overwritten at each update... I need
-            # to test to see if I could save the copy...
-            ret = deepcopy(self.sprixel)
-            ret.bg_color = sprixel.bg_color
-            return ret
+            # not our live one. While preserving the background color of the cell.
+            return self._rendered_sprixel(sprixel.bg_color)
         else:
             # This sprixel might be modified later in the rendering cycle so we want to
             # make sure that the next particle will only overide the rendered sprixel,
             # not our live one.
-            # NOTE: on the other hand, the model is overwritten at each update... I need
-            # to test to see if I could save the copy...
-            return deepcopy(self.sprixel)
+            return self._rendered_sprixel(self.sprixel.bg_color)
 
 
 class RandomColorParticle(Particle):
@@ -1,6 +1,7 @@
 import pygamelib.base as base
 import pygamelib.gfx.core as core
 from pygamelib.constants import Direction
+import numpy as np
 import unittest
 
 
@@ -220,6 +221,41 @@ class TestBase(unittest.TestCase):
         self.assertEqual(text.fg_color, text2.fg_color)
         self.assertEqual(text.style, None)
 
+    def test_text_render_cache(self):
+        text = base.Text("ab\ncd", style=base.Style.BRIGHT)
+        buffer = np.full((3, 3), " ", dtype=object)
+        text.render_to_buffer(buffer, 1, 1, 3, 3)
+        self.assertEqual(buffer[1][1], base.Style.BRIGHT + "a\x1b[0m")
+        self.assertEqual(buffer[2][2], base.Style.BRIGHT + "d\x1b[0m")
+        self.assertEqual(buffer[0].tolist(), [" "] * 3)
+        # The cache is invalidated when the style or the text change.
+        text.style = ""
+        text.render_to_buffer(buffer, 0, 0, 3, 3)
+        self.assertEqual(buffer[0][0], "a\x1b[0m")
+        text.text = "xyzw"
+        text.render_to_buffer(buffer, 0, 0, 3, 3)
+        self.assertEqual(buffer[0].tolist(), ["x\x1b[0m", "y\x1b[0m", "z\x1b[0m"])
+        text.render_to_buffer(buffer, 0, 5, 3, 3)
+        # With a font, the glyphs are composed once in a sprite.
+        font = core.Font("8bits")
+        text = base.Text("ab", core.Color(1, 2, 3), font=font)
+        self.assertEqual(text.length, 18)
+        buffer = np.full((font.height, text.length), " ", dtype=object)
+        text.render_to_buffer(buffer, 0, 0, font.height, text.length)
+        glyph = font.glyph("b", core.Color(1, 2, 3))
+        for r in range(0, glyph.size[1]):
+            for c in range(0, glyph.size[0]):
+                if glyph.opacity_mask[r, c]:
+                    self.assertIs(buffer[r][9 + c], glyph.sprixel(r, c))
+        # Changing a color renders the glyphs again.
+        text.fg_color.r = 100
+        text.render_to_buffer(buffer, 0, 0, font.height, text.length)
+        glyph = font.glyph("b", core.Color(100, 2, 3))
+        for r in range(0, glyph.size[1]):
+            for c in range(0, glyph.size[0]):
+                if glyph.opacity_mask[r, c]:
+                    self.assertEqual(buffer[r][9 + c], glyph.sprixel(r, c))
+
     def test_pgl_base_object(self):
         o1 = base.PglBaseObject()
         o2 = base.PglBaseObject()
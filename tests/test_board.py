@@ -4,6 +4,10 @@ import pygamelib.board_items as pgl_board_items
 import pygamelib.gfx.core as gfx_core
 from pygamelib.gfx import particles
 from pygamelib import constants
+import numpy as np
+import os
+import random
+import tempfile
 import unittest
 
 
@@ -276,6 +280,119 @@ class TestBoard(unittest.TestCase):
         with self.assertRaises(base.PglInvalidTypeException):
             self.board.move(i, "constants.DOWN", 1)
 
+    def test_move_complex_footprint(self):
+        board = pgl_engine.Board(size=[20, 10])
+        activations = []
+        boss = pgl_board_items.ComplexNPC(
+            sprite=gfx_core.Sprite(
+                sprixels=[
+                    [gfx_core.Sprixel(str(r * 4 + c)) for c in range(4)]
+                    for r in range(3)
+                ]
+            )
+        )
+        board.place_item(boss, 2, 2)
+        switch = pgl_board_items.GenericActionableStructure(
+            action=activations.append,
+            action_parameters=["switch"],
+            perm=constants.Permission.ALL_CHARACTERS_AUTHORIZED,
+        )
+        switch.set_overlappable(True)
+        switch.set_restorable(True)
+        board.place_item(switch, 3, 6)
+        board.move(boss, constants.Direction.RIGHT, 1)
+        self.assertEqual(activations, [["switch"]])
+        self.assertEqual(boss.pos, [2, 3, 1])
+        # The switch stays under the boss: it is not activated again.
+        board.move(boss, constants.Direction.LEFT, 1)
+        self.assertEqual(activations, [["switch"]])
+        board.move(boss, constants.Direction.LEFT, 1)
+        self.assertEqual(boss.pos, [2, 1, 0])
+        for row in range(3):
+            for column in range(4):
+                part = boss.item(row, column)
+                self.assertIs(board._matrix[2 + row, 1 + column][0], part)
+                self.assertEqual(part.pos, [2 + row, 1 + column, 0])
+                self.assertEqual(
+                    board.render_cell(2 + row, 1 + column).model, str(row * 4 + column)
+                )
+        for row in range(2, 5):
+            self.assertIsInstance(board.item(row, 5), pgl_board_items.BoardItemVoid)
+        self.assertIs(board.item(3, 6), switch)
+        self.assertEqual(board.items_in_area(0, 0, 10, 20), [boss, switch])
+        self.assertEqual(board.get_movables(), [boss])
+        # A wall entering the footprint blocks the move.
+        board.place_item(pgl_board_items.Wall(), 5, 4)
+        board.move(boss, constants.Direction.DOWN, 1)
+        self.assertEqual(boss.pos, [2, 1, 0])
+        board.move(boss, constants.Direction.UP, 2)
+        self.assertEqual(boss.pos, [0, 1, 0])
+        self.assertIsInstance(board.item(4, 1), pgl_board_items.BoardItemVoid)
+
+    def test_move_many(self):
+        class Observer(base.PglBaseObject):
+            def __init__(self):
+                super().__init__()
+                self.events = []
+
+            def handle_notification(self, subject, attribute=None, value=None):
+                self.events.append((attribute, value))
+
+        board = pgl_engine.Board(size=[10, 10])
+        observer = Observer()
+        board.attach(observer)
+        line = [pgl_board_items.NPC() for _ in range(4)]
+        for column, npc in enumerate(line):
+            board.place_item(npc, 0, column)
+        observer.events.clear()
+        # The followers move after the leader, whatever the order of the batch.
+        moved = board.move_many([(npc, constants.Direction.RIGHT) for npc in line])
+        self.assertEqual(moved, line)
+        self.assertEqual([npc.column for npc in line], [1, 2, 3, 4])
+        self.assertEqual(
+            observer.events, [("pygamelib.engine.Board.move_many:items_moved", line)]
+        )
+        # Destination conflicts: the first item of the batch wins.
+        first = pgl_board_items.NPC()
+        second = pgl_board_items.NPC()
+        board.place_item(first, 5, 4)
+        board.place_item(second, 5, 6)
+        self.assertEqual(
+            board.move_many([(second, (0, -1)), (first, base.Vector2D(0, 1))]),
+            [second],
+        )
+        self.assertEqual(first.pos, [5, 4, 0])
+        self.assertEqual(second.pos, [5, 5, 0])
+        # Items that would need to move after each other in a cycle are blocked.
+        self.assertEqual(
+            board.move_many(
+                [(first, constants.Direction.RIGHT), (second, constants.Direction.LEFT)]
+            ),
+            [],
+        )
+        # Walls and board edges still block.
+        board.place_item(pgl_board_items.Wall(), 6, 4)
+        self.assertEqual(
+            board.move_many(
+                [(first, constants.Direction.DOWN), (line[0], constants.Direction.UP)]
+            ),
+            [],
+        )
+        self.assertEqual(board.move_many([(first, constants.Direction.NO_DIR)]), [])
+        # Complex items are moved too.
+        boss = pgl_board_items.ComplexNPC(
+            sprite=gfx_core.Sprite(size=[2, 2], default_sprixel=gfx_core.Sprixel("B"))
+        )
+        board.place_item(boss, 8, 0)
+        self.assertEqual(board.move_many([(boss, (0, 2))]), [boss])
+        self.assertEqual(boss.pos, [8, 2, 0])
+        self.assertIs(board.item(9, 3), boss)
+        self.assertIsInstance(board.item(8, 0), pgl_board_items.BoardItemVoid)
+        with self.assertRaises(base.PglObjectIsNotMovableException):
+            board.move_many([(pgl_board_items.Wall(), (0, 1))])
+        with self.assertRaises(base.PglInvalidTypeException):
+            board.move_many([(first, "right")])
+
     def test_move_simple(self):
         def _act(p):
             setattr(p[0], "test_callback", True)
@@ -462,6 +579,498 @@ class TestBoard(unittest.TestCase):
         )
         self.assertIsInstance(board.render_cell(5, 5), gfx_core.Sprixel)
 
+    def test_shared_void_sprixel(self):
+        board = pgl_engine.Board(
+            size=[4, 4],
+            ui_board_void_cell_sprixel=gfx_core.Sprixel(" ", gfx_core.Color(0, 0, 1)),
+        )
+        self.assertIs(board.item(0, 0)._sprixel, board.item(3, 3)._sprixel)
+        self.assertIsInstance(board.render_cell(1, 1), gfx_core.SharedSprixel)
+        self.assertIs(board.generate_void_cell()._sprixel, board.item(0, 0)._sprixel)
+        # Shared sprixels cannot be modified: items copy them on demand.
+        with self.assertRaises(base.PglException):
+            board.item(0, 0).sprixel.bg_color = gfx_core.Color(255, 0, 0)
+        self.assertIsInstance(board.item(0, 0).sprixel, gfx_core.SharedSprixel)
+        board.item(0, 0).mutable_sprixel().bg_color = gfx_core.Color(255, 0, 0)
+        self.assertEqual(board.item(0, 1).sprixel.bg_color, gfx_core.Color(0, 0, 1))
+        self.assertEqual(board.item(0, 0).sprixel.bg_color, gfx_core.Color(255, 0, 0))
+        self.assertIs(board.item(0, 1)._sprixel, board.item(3, 3)._sprixel)
+        board.item(1, 0).model = "@"
+        self.assertEqual(board.item(1, 1).model, " ")
+        self.assertEqual(board.item(1, 0).model, "@")
+        # Placing, moving and rendering an item do not copy its shared sprixel when
+        # its background color does not change.
+        shared = gfx_core.SprixelPalette.instance().sprixel("@")
+        npc = pgl_board_items.NPC(sprixel=shared)
+        board = pgl_engine.Board(size=[4, 4])
+        board.place_item(npc, 0, 0)
+        board.move(npc, constants.Direction.RIGHT, 1)
+        screen = pgl_engine.Screen(4, 4)
+        screen.place(npc, 0, 0)
+        screen.render()
+        self.assertIs(npc._sprixel, shared)
+        # Reading and serializing the items do not copy their shared sprixels.
+        walls = [pgl_board_items.Wall(sprixel=shared) for i in range(0, 5)]
+        for i in range(0, 5):
+            board.place_item(walls[i], 3, i % 4, i // 4)
+        self.assertEqual(walls[0].sprixel.model, "@")
+        data = board.serialize()
+        board.item(2, 2).serialize()
+        self.assertEqual(data["map_data"]["(3, 0, 0)"]["sprixel"]["model"], "@")
+        for wall in walls:
+            self.assertIs(wall._sprixel, shared)
+        self.assertIs(board.item(2, 2)._sprixel, board.item(2, 3)._sprixel)
+        board = pgl_engine.Board(size=[2, 2], ui_board_void_cell="..")
+        self.assertIs(board.item(0, 0)._sprixel, board.item(1, 1)._sprixel)
+        self.assertEqual(board.item(0, 0).model, "..")
+        self.assertTrue(board.item(0, 0)._sprixel.is_bg_transparent)
+
+    def test_visible_sprixels_cache(self):
+        def rendered(board):
+            buffer = np.full((3, 3), None, dtype=object)
+            board.render_to_buffer(buffer, 0, 0, 3, 3)
+            return buffer
+
+        board = pgl_engine.Board(
+            size=[3, 3],
+            ui_board_void_cell_sprixel=gfx_core.Sprixel(" ", gfx_core.Color(0, 0, 1)),
+        )
+        npc = pgl_board_items.NPC(sprixel=gfx_core.Sprixel("@"))
+        board.place_item(npc, 1, 1)
+        self.assertEqual(rendered(board)[1][1].model, "@")
+        # The transparent background is resolved once and cached.
+        self.assertEqual(rendered(board)[1][1].bg_color, gfx_core.Color(0, 0, 1))
+        self.assertIs(rendered(board)[1][1], rendered(board)[1][1])
+        # Modified and replaced sprixels are rendered again.
+        npc.sprixel.model = "N"
+        self.assertEqual(rendered(board)[1][1].model, "N")
+        npc.sprixel = gfx_core.Sprixel("P", gfx_core.Color(1, 2, 3))
+        self.assertEqual(rendered(board)[1][1].bg_color, gfx_core.Color(1, 2, 3))
+        board.item(1, 2).mutable_sprixel().bg_color = gfx_core.Color(9, 9, 9)
+        self.assertEqual(rendered(board)[1][2].bg_color, gfx_core.Color(9, 9, 9))
+        board.move(npc, constants.Direction.RIGHT, 1)
+        buffer = rendered(board)
+        self.assertEqual(buffer[1][1].model, " ")
+        self.assertEqual(buffer[1][2].model, "P")
+        # Sprixels shared by items are only watched once.
+        wall_sprixel = gfx_core.Sprixel("#")
+        walls = [pgl_board_items.Wall(sprixel=wall_sprixel) for _ in range(0, 3)]
+        for column in range(0, 3):
+            board.place_item(walls[column], 0, column)
+        wall_sprixel.model = "="
+        self.assertEqual([cell.model for cell in rendered(board)[0]], ["="] * 3)
+        self.assertEqual(wall_sprixel._observers.count(board), 1)
+        for wall in walls:
+            board.remove_item(wall)
+        self.assertNotIn(board, wall_sprixel._observers)
+        self.assertEqual(rendered(board)[0][0].model, " ")
+        board.clear_cell(1, 2)
+        self.assertEqual(rendered(board)[1][2].model, " ")
+        self.assertNotIn(board, npc._observers)
+
+    def test_render_to_buffer_clipping(self):
+        board = pgl_engine.Board(
+            size=[50, 50],
+            ui_board_void_cell_sprixel=gfx_core.Sprixel("."),
+        )
+        # Only the part of the board that fits in the buffer is rendered.
+        buffer = np.full((4, 6), None, dtype=object)
+        board.render_to_buffer(buffer, 1, 2, 4, 6)
+        self.assertTrue((buffer[0] == None).all())  # noqa: E711
+        self.assertTrue((buffer[:, 0:2] == None).all())  # noqa: E711
+        self.assertEqual([cell.model for cell in buffer[3][2:]], ["."] * 4)
+        # The buffer can be smaller than the advertised geometry.
+        board.render_to_buffer(buffer[1:, 2:], 0, 0, 4, 6)
+        # Wide sprixels are padded on the row they are rendered on.
+        board = pgl_engine.Board(
+            size=[10, 10],
+            ui_board_void_cell_sprixel=gfx_core.Sprixel("##"),
+            enable_partial_display=True,
+            partial_display_viewport=[2, 2],
+        )
+        board.partial_display_focus = board.item(6, 6)
+        buffer = np.full((4, 5), None, dtype=object)
+        board.render_to_buffer(buffer, 0, 0, 4, 5)
+        self.assertEqual(buffer[0][0].model, "##")
+        self.assertEqual(buffer[0][1], "")
+        self.assertEqual(buffer[3][3], "")
+        self.assertEqual(buffer[3][4].model, "##")
+
+    def test_render_to_buffer_scrolling(self):
+        board = pgl_engine.Board(
+            size=[20, 10],
+            ui_board_void_cell_sprixel=gfx_core.Sprixel("."),
+            enable_partial_display=True,
+            partial_display_viewport=[2, 3],
+        )
+        for column in range(0, 20):
+            board.place_item(
+                pgl_board_items.Wall(sprixel=gfx_core.Sprixel(chr(65 + column))),
+                0,
+                column,
+            )
+        player = pgl_board_items.Player(sprixel=gfx_core.Sprixel("@"))
+        board.place_item(player, 2, 5)
+        board.partial_display_focus = player
+        buffer = np.full((4, 6), None, dtype=object)
+        for column in range(5, 10):
+            board.move(player, constants.Direction.RIGHT, 1)
+            board.render_to_buffer(buffer, 0, 0, 4, 6)
+            self.assertEqual(
+                [cell.model for cell in buffer[0]],
+                [chr(65 + c) for c in range(column - 2, column + 4)],
+            )
+            self.assertEqual(buffer[2][3].model, "@")
+        # Wide sprixels are still padded.
+        board.item(3, 7).sprixel = gfx_core.Sprixel("日")
+        board.render_to_buffer(buffer, 0, 0, 4, 6)
+        self.assertEqual(buffer[3][0].model, "日")
+        self.assertEqual(buffer[3][1], "")
+        self.assertEqual(buffer[3][2].model, ".")
+
+    def test_lazy_void_cells(self):
+        board = pgl_engine.Board(
+            size=[1000, 1000], ui_board_void_cell_sprixel=gfx_core.Sprixel(".")
+        )
+        # Nothing is materialized until a cell is used.
+        self.assertEqual(board.layers(999, 999), 1)
+        self.assertEqual(board.render_cell(999, 999).model, ".")
+        buffer = np.full((2, 2), None, dtype=object)
+        board.render_to_buffer(buffer, 0, 0, 2, 2)
+        self.assertEqual(buffer[1][1].model, ".")
+        self.assertEqual(board.serialize()["map_data"], {})
+        self.assertIsNone(board._matrix[999, 999])
+        void = board.item(999, 999)
+        self.assertIsInstance(void, pgl_board_items.BoardItemVoid)
+        self.assertEqual(void.pos, [999, 999, 0])
+        self.assertIs(void.parent, board)
+        self.assertIs(board.item(999, 999), void)
+        self.assertIs(board.item(-1, -1), void)
+        # Materialized voids are still rendered and watched.
+        void.model = "#"
+        self.assertEqual(board.render_cell(999, 999).model, "#")
+        board.place_item(pgl_board_items.Wall(), 500, 500, 2)
+        self.assertEqual(board.layers(500, 500), 3)
+        board.clear_cell(500, 500, 2)
+        self.assertEqual(board.layers(500, 500), 1)
+        self.assertIsInstance(board.item(500, 500), pgl_board_items.BoardItemVoid)
+
+    def test_chunked_board(self):
+        board = pgl_engine.Board(
+            size=[10000, 10000],
+            chunked=True,
+            ui_board_void_cell_sprixel=gfx_core.Sprixel("."),
+        )
+        self.assertEqual(len(board._matrix.chunks), 0)
+        npc = pgl_board_items.NPC(sprixel=gfx_core.Sprixel("N"))
+        wall = pgl_board_items.Wall(sprixel=gfx_core.Sprixel("#"))
+        board.place_item(npc, 5000, 5055)
+        board.place_item(wall, 5000, 5056)
+        self.assertIs(board.item(5000, 5055), npc)
+        self.assertEqual(board.neighbors(npc), [wall])
+        board.move(npc, constants.Direction.RIGHT, 1)
+        self.assertIs(board.item(5000, 5055), npc)
+        board.move(npc, constants.Direction.LEFT, 1)
+        self.assertIs(board.item(5000, 5054), npc)
+        self.assertIsInstance(board.item(5000, 5055), pgl_board_items.BoardItemVoid)
+        self.assertEqual(board.render_cell(5000, 5056).model, "#")
+        self.assertEqual(board.render_cell(9999, 9999).model, ".")
+        buffer = np.full((2, 4), None, dtype=object)
+        board.partial_display_viewport = [1, 2]
+        board.partial_display_focus = npc
+        board.enable_partial_display = True
+        board.render_to_buffer(buffer, 0, 0, 2, 4)
+        self.assertEqual([c.model for c in buffer[1]], [".", ".", "N", "."])
+        # Only the chunks that were written to are allocated.
+        self.assertEqual(len(board._matrix.chunks), 2)
+        data = board.serialize()
+        self.assertTrue(data["chunked"])
+        loaded = pgl_engine.Board.load(data)
+        self.assertTrue(loaded.chunked)
+        self.assertEqual(loaded.item(5000, 5056).model, "#")
+        self.assertEqual(len(loaded._matrix.chunks), 2)
+        with self.assertRaises(base.PglException):
+            pgl_engine.Board(chunked=True, chunk_size=0)
+
+    def test_streamed_board(self):
+        board = pgl_engine.Board(
+            size=[2000, 2000],
+            chunk_size=16,
+            ui_board_void_cell_sprixel=gfx_core.Sprixel("."),
+        )
+        board.place_item(pgl_board_items.Wall(sprixel=gfx_core.Sprixel("#")), 10, 10)
+        board.place_item(
+            pgl_board_items.Wall(sprixel=gfx_core.Sprixel("W")), 1500, 1500
+        )
+        board.place_item(pgl_board_items.NPC(sprixel=gfx_core.Sprixel("N")), 1500, 1502)
+        with tempfile.TemporaryDirectory() as path:
+            board.save_streamed(path)
+            self.assertEqual(
+                sorted(os.listdir(os.path.join(path, "chunks"))),
+                ["0_0.json", "93_93.json"],
+            )
+            world = pgl_engine.Board.load_streamed(path)
+            self.assertEqual(world.stream_path, path)
+            self.assertTrue(world.chunked)
+            self.assertEqual(len(world._matrix.chunks), 0)
+            self.assertEqual(len(world.get_immovables()), 0)
+            # Accessing a cell loads its chunk.
+            self.assertEqual(world.item(10, 10).model, "#")
+            self.assertEqual(len(world.get_immovables()), 1)
+            # Rendering loads the chunks around the viewport and evicts the others.
+            player = pgl_board_items.Player(sprixel=gfx_core.Sprixel("@"))
+            world.place_item(player, 1500, 1498)
+            world.enable_partial_display = True
+            world.partial_display_viewport = [5, 10]
+            world.partial_display_focus = player
+            buffer = np.full((10, 20), None, dtype=object)
+            world.render_to_buffer(buffer, 0, 0, 10, 20)
+            self.assertEqual(
+                "".join([c.model for c in buffer[5]]), "..........@.W.N....."
+            )
+            self.assertEqual(world.get_immovables()[0].model, "W")
+            self.assertEqual(len(world.get_movables()), 2)
+            # The modified chunks are saved when they are evicted.
+            world.item(1500, 1500).sprixel = gfx_core.Sprixel("X")
+            world.remove_item(world.item(1500, 1502))
+            world.remove_item(player)
+            world.place_item(player, 20, 20)
+            world.render_to_buffer(buffer, 0, 0, 10, 20)
+            self.assertEqual(world.get_movables(), [player])
+            world = pgl_engine.Board.load_streamed(path)
+            self.assertEqual(world.item(1500, 1500).model, "X")
+            self.assertIsInstance(world.item(1500, 1502), pgl_board_items.BoardItemVoid)
+            with tempfile.TemporaryDirectory() as copy_path:
+                world.save_streamed(copy_path)
+                self.assertEqual(
+                    sorted(os.listdir(os.path.join(copy_path, "chunks"))),
+                    ["0_0.json", "93_93.json"],
+                )
+        # Not streamed: nothing to do.
+        board.stream_area(0, 0, 10, 10)
+        board.evict_chunks()
+        self.assertIsNone(board.stream_path)
+
+    def test_indexed_queries(self):
+        board = pgl_engine.Board(size=[20, 20])
+        for i in range(10):
+            board.place_item(pgl_board_items.Wall(item_type="wall"), 0, i)
+            board.place_item(
+                pgl_board_items.GenericStructure(item_type=f"trap.{i}", name="t"), 1, i
+            )
+        npc = pgl_board_items.NPC(item_type="foe", name="bob")
+        board.place_item(npc, 5, 5)
+        board.place_item(pgl_board_items.Player(), 6, 6)
+        self.assertEqual(len(board.get_immovables(type="trap.")), 10)
+        self.assertEqual(len(board.get_immovables(type="trap.", name="t")), 10)
+        self.assertEqual(len(board.get_immovables(type="trap.3")), 1)
+        self.assertEqual(len(board.get_immovables(type="ap.", name="x")), 0)
+        self.assertEqual(len(board.get_immovables(pgl_board_items.Wall)), 10)
+        self.assertEqual(
+            len(board.get_immovables(pgl_board_items.Immovable, type="wall")), 10
+        )
+        self.assertEqual(board.get_movables(pgl_board_items.NPC), [npc])
+        self.assertEqual(board.get_movables(name="bo"), [npc])
+        self.assertEqual(len(list(board.iter_movables())), 2)
+        self.assertEqual(list(board.iter_movables(type="foe")), [npc])
+        # The indexes follow the changes of the items.
+        npc.type = "friend"
+        self.assertEqual(board.get_movables(type="foe"), [])
+        self.assertEqual(board.get_movables(type="friend"), [npc])
+        board.item(1, 3).name = "renamed"
+        self.assertEqual(len(board.get_immovables(name="t")), 9)
+        board.clear_cell(1, 4)
+        self.assertEqual(len(board.get_immovables(type="trap.")), 9)
+        board.move(npc, constants.Direction.UP, 1)
+        self.assertEqual(board.get_movables(type="friend"), [npc])
+        board.remove_item(npc)
+        self.assertEqual(board.get_movables(pgl_board_items.NPC), [])
+        # Only the animated items are indexed as such.
+        self.assertEqual(len(board._immovables.animated), 0)
+        board.item(0, 0).animation = gfx_core.Animation(frames=["a", "b"])
+        self.assertEqual(len(board._immovables.animated), 1)
+
+    def test_indexed_name_queries(self):
+        # Many distinct names: the "contains" filters go through the sorted
+        # substrings of the names instead of testing every name.
+        board = pgl_engine.Board(size=[100, 100])
+        walls = []
+        for i in range(0, 10000):
+            wall = pgl_board_items.Wall(name=f"wall{i}")
+            board.place_item(wall, i // 100, i % 100)
+            walls.append(wall)
+
+        def names(value):
+            return sorted(item.name for item in board.get_immovables(name=value))
+
+        def expected(value):
+            return sorted(wall.name for wall in walls if value in wall.name)
+
+        self.assertEqual(names("wall1234"), ["wall1234"])
+        self.assertEqual(names("zzz"), [])
+        index = board._immovables.attributes["name"]
+        self.assertEqual(len(index.pending), 0)
+        for value in ("wall99", "999", "ll5", "l", "0", "", "wall10000"):
+            self.assertEqual(names(value), expected(value))
+        # Renamed, removed and new items.
+        walls[1234].name = "tower"
+        board.remove_item(walls.pop(999))
+        walls.append(pgl_board_items.Wall(name="x999x"))
+        board.place_item(walls[-1], 9, 99)
+        self.assertEqual(names("999"), expected("999"))
+        self.assertEqual(names("wall1234"), [])
+        self.assertEqual(names("owe"), ["tower"])
+
+    def test_spatial_queries(self):
+        board = pgl_engine.Board(size=[40, 40])
+        npc = pgl_board_items.NPC()
+        board.place_item(npc, 10, 10)
+        floor = pgl_board_items.GenericStructure(overlappable=True, restorable=True)
+        board.place_item(floor, 11, 11)
+        under = pgl_board_items.NPC()
+        board.place_item(under, 11, 11)
+        far = pgl_board_items.Wall()
+        board.place_item(far, 20, 30)
+        corner = pgl_board_items.Wall()
+        board.place_item(corner, 39, 39)
+        complex_item = pgl_board_items.Tile(
+            sprite=gfx_core.Sprite(size=[3, 2], default_sprixel=gfx_core.Sprixel("#"))
+        )
+        board.place_item(complex_item, 5, 12)
+        # The top item of each cell is returned (complex items once per cell).
+        self.assertEqual(board.neighbors(npc, 1), [under])
+        self.assertEqual(board.neighbors(npc, 4), [complex_item] * 3 + [under])
+        # The complex item itself is excluded.
+        self.assertEqual(board.neighbors(complex_item, 4), [])
+        self.assertEqual(board.neighbors(complex_item.item(1, 2), 4), [npc])
+        # No wrap around the edges of the board.
+        wall = pgl_board_items.Wall()
+        board.place_item(wall, 0, 0)
+        self.assertEqual(board.neighbors(wall, 2), [])
+        self.assertEqual(board.items_in_area(0, 0, 12, 12), [wall, npc, floor, under])
+        self.assertEqual(board.items_in_area(-5, -5, 6, 6), [wall])
+        self.assertEqual(board.items_in_radius(20, 30, 0), [far])
+        self.assertEqual(board.items_in_radius(39, 39, 5), [corner])
+        self.assertEqual(board.nearest_items(npc), [floor])
+        self.assertEqual(
+            board.nearest_items(npc, 4), [floor, under, complex_item, wall]
+        )
+        self.assertEqual(len(board.nearest_items(npc, 10)), 6)
+        self.assertEqual(board.nearest_items(npc, 10, 3), [floor, under])
+        self.assertEqual(
+            board.batch_neighbors([npc, wall], 1), {npc: [under], wall: []}
+        )
+        # The index follows the changes of the board.
+        board.move(under, constants.Direction.DOWN, 1)
+        self.assertEqual(board.neighbors(npc, 1), [floor])
+        board.remove_item(floor)
+        self.assertEqual(board.neighbors(npc, 1), [])
+        board.clear_cell(20, 30)
+        self.assertEqual(board.items_in_radius(20, 30, 1), [])
+        with self.assertRaises(base.PglInvalidTypeException):
+            board.items_in_area(0, 0, "1", 1)
+        with self.assertRaises(base.PglInvalidTypeException):
+            board.items_in_radius(0, 0, 1.5)
+        with self.assertRaises(base.PglInvalidTypeException):
+            board.nearest_items("npc")
+        with self.assertRaises(base.PglInvalidTypeException):
+            board.nearest_items(npc, 0)
+        with self.assertRaises(base.PglInvalidTypeException):
+            board.nearest_items(npc, 1, "2")
+        with self.assertRaises(base.PglInvalidTypeException):
+            board.batch_neighbors([npc], "1")
+        with self.assertRaises(base.PglInvalidTypeException):
+            board.batch_neighbors([npc, "wall"])
+
+    def test_neighbors_baseline(self):
+        # The neighbors found through the spatial index are the ones of a scan of
+        # every cell around the object.
+        def scan(board, obj, radius):
+            items = []
+            for row in range(obj.pos[0] - radius, obj.pos[0] + radius + 1):
+                for column in range(obj.pos[1] - radius, obj.pos[1] + radius + 1):
+                    if (
+                        (row, column) == (obj.pos[0], obj.pos[1])
+                        or not 0 <= row < board.size[1]
+                        or not 0 <= column < board.size[0]
+                    ):
+                        continue
+                    item = board.item(row, column)
+                    if item is not obj and not isinstance(
+                        item, pgl_board_items.BoardItemVoid
+                    ):
+                        items.append(item)
+            return items
+
+        rng = random.Random(21)
+        board = pgl_engine.Board(size=[20, 15])
+        items = []
+        for i in range(0, 80):
+            item = rng.choice(
+                [
+                    pgl_board_items.NPC,
+                    pgl_board_items.Wall,
+                    lambda: pgl_board_items.GenericStructure(overlappable=True),
+                ]
+            )()
+            board.place_item(
+                item, rng.randrange(0, 15), rng.randrange(0, 20), rng.randrange(0, 3)
+            )
+            items.append(item)
+        board.place_item(
+            pgl_board_items.Tile(
+                sprite=gfx_core.Sprite(
+                    size=[3, 2], default_sprixel=gfx_core.Sprixel("#")
+                )
+            ),
+            6,
+            8,
+        )
+        for i in range(0, 20):
+            board.remove_item(items.pop(rng.randrange(0, len(items))))
+        for item in items:
+            for radius in range(0, 4):
+                self.assertEqual(
+                    board.neighbors(item, radius), scan(board, item, radius)
+                )
+
+    def test_collisions(self):
+        board = pgl_engine.Board(size=[40, 40])
+        ship = pgl_board_items.ComplexNPC(
+            sprite=gfx_core.Sprite(size=[3, 2], default_sprixel=gfx_core.Sprixel("#"))
+        )
+        board.place_item(ship, 10, 10)
+        enemy = pgl_board_items.ComplexNPC(
+            sprite=gfx_core.Sprite(size=[2, 2], default_sprixel=gfx_core.Sprixel("@"))
+        )
+        board.place_item(enemy, 10, 14)
+        wall = pgl_board_items.Wall()
+        board.place_item(wall, 12, 11)
+        far_wall = pgl_board_items.Wall()
+        board.place_item(far_wall, 30, 30)
+        board.place_item(pgl_board_items.Wall(), 30, 31)
+        self.assertEqual(board.collision_pairs(), [])
+        self.assertEqual(board.collisions(ship), [])
+        self.assertEqual(board.collisions(ship, base.Vector2D(0, 2)), [enemy])
+        self.assertEqual(board.collisions(ship, base.Vector2D(1, 0)), [wall])
+        # The candidates share a cell of the grid but do not necessarily collide.
+        self.assertIn((ship, enemy), board.collision_pairs(False))
+        self.assertIn((ship, wall), board.collision_pairs(False))
+        # The footprints follow the items.
+        board.move(enemy, constants.Direction.LEFT, 1)
+        self.assertEqual(board.collision_pairs(), [])
+        bullet = pgl_board_items.Projectile()
+        board.place_item(bullet, 11, 13)
+        self.assertEqual(board.collision_pairs(), [(enemy, bullet)])
+        self.assertEqual(board.collisions(bullet), [enemy])
+        board.move(enemy, constants.Direction.UP, 1)
+        self.assertEqual(board.collision_pairs(), [])
+        self.assertEqual(board.collisions(bullet, base.Vector2D(0, -1)), [ship])
+        board.remove_item(ship)
+        self.assertEqual(board.collisions(bullet, base.Vector2D(0, -1)), [])
+        with self.assertRaises(base.PglInvalidTypeException):
+            board.collisions("ship")
+
 
 if __name__ == "__main__":
     unittest.main()
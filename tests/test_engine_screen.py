@@ -1,7 +1,17 @@
-from pygamelib import engine, board_items, functions, base
-from pygamelib.gfx.core import SpriteCollection, Sprixel, Color, Sprite, Font
+from pygamelib import engine, board_items, functions, base, constants
+from pygamelib.gfx.core import (
+    SpriteCollection,
+    Sprixel,
+    Color,
+    Sprite,
+    Font,
+    FrameBuffer,
+)
 from pygamelib.gfx import particles
 import unittest
+import contextlib
+import io
+import os
 
 
 class TB(base.PglBaseObject):
@@ -295,6 +305,333 @@ class TestBase(unittest.TestCase):
         s.delete(0, 0)
         self.assertEqual(len(obj._observers), 0)
 
+    def test_screen_delta_update(self):
+        s = engine.Screen(10, 3)
+        self.assertFalse(s.delta_update)
+        with self.assertRaises(base.PglInvalidTypeException):
+            s.delta_update = 1
+        s.delta_update = True
+        s.place(TB(), 1, 2)
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            s.update()
+        # First update is a full repaint
+        self.assertIn(s.terminal.home, out.getvalue())
+        self.assertIn("TB", out.getvalue())
+        self.assertIsNotNone(s._last_frame)
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            s.update()
+        # Nothing changed, nothing is written
+        self.assertEqual(out.getvalue(), "")
+        s.delete(1, 2)
+        s.place(TB(), 2, 5)
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            s.update()
+        self.assertIn("\x1b[2;3H", out.getvalue())
+        self.assertIn("\x1b[3;6H", out.getvalue())
+        self.assertIn("TB", out.getvalue())
+        self.assertNotIn("\x1b[1;", out.getvalue())
+        s.force_update()
+        self.assertIsNotNone(s._last_frame)
+        s.delta_update = False
+        self.assertIsNone(s._last_frame)
+
+    def test_screen_scroll_update(self):
+        s = engine.Screen(4, 6)
+        self.assertFalse(s.scroll_update)
+        with self.assertRaises(base.PglInvalidTypeException):
+            s.scroll_update = 1
+        s.delta_update = True
+        s.scroll_update = True
+        lines = ["aaaa", "bbbb", "cccc", "dddd", "eeee", "ffff", "gggg"]
+
+        def draw(offset):
+            for r in range(0, 6):
+                for c in range(0, 4):
+                    s.buffer[r][c] = lines[r + offset][c]
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                s.update()
+            return out.getvalue()
+
+        draw(0)
+        # The content moved up by one row: the terminal scrolls it and only the last
+        # row is written.
+        output = draw(1)
+        self.assertEqual(output, "\x1b[1;6r\x1b[1S\x1b[r\x1b[6;1Hgggg")
+        # And down.
+        output = draw(0)
+        self.assertEqual(output, "\x1b[1;6r\x1b[1T\x1b[r\x1b[1;1Haaaa")
+        self.assertEqual(draw(0), "")
+        s.scroll_update = False
+        self.assertNotIn("\x1b[1S", draw(1))
+
+    def test_screen_sgr_coalescing(self):
+        s = engine.Screen(10, 2)
+        red = "\x1b[48;2;255;0;0m"
+        blue = "\x1b[48;2;0;0;255m\x1b[38;2;255;255;255m"
+        for c in range(10):
+            s.buffer[0][c] = f"{red} \x1b[0m"
+        s.buffer[1][0] = f"{blue}#\x1b[0m"
+        s.buffer[1][1] = f"{blue}#\x1b[0m"
+        s.buffer[1][2] = "\x1b[1mbold\x1b[0m"
+        s.buffer[1][3] = Sprixel("\x1b[4mu\x1b[0m")
+        s.buffer[1][4] = Sprixel("x")
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            s.update()
+        output = out.getvalue()
+        # Only one SGR sequence for the whole red row.
+        self.assertEqual(output.count(red), 1)
+        self.assertIn(red + " " * 10, output)
+        self.assertEqual(output.count(blue), 1)
+        self.assertIn(blue + "##\x1b[0m\x1b[1mbold", output)
+        self.assertIn("\x1b[4mu\x1b[0m\x1b[0mx", output)
+        self.assertIn("\x1b[0m", output[-10:])
+
+    def test_screen_frame_writer(self):
+        s = engine.Screen(4, 2)
+        self.assertFalse(s.synchronized_update)
+        with self.assertRaises(base.PglInvalidTypeException):
+            s.synchronized_update = "yes"
+        s.synchronized_update = True
+        s.place(TB(), 0, 0)
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            s.update()
+        self.assertTrue(out.getvalue().startswith("\x1b[?2026h"))
+        self.assertTrue(out.getvalue().endswith("\x1b[?2026l"))
+        # With a real file descriptor, the frame is written with os.write.
+        read_fd, write_fd = os.pipe()
+        with open(write_fd, "w", encoding="utf-8") as stream:
+            with contextlib.redirect_stdout(stream):
+                s.force_update()
+        with open(read_fd, "rb") as stream:
+            data = stream.read().decode("utf-8")
+        self.assertTrue(data.startswith("\x1b[?2026h"))
+        self.assertIn("TB", data)
+        self.assertTrue(data.endswith("\x1b[?2026l"))
+
+    def test_screen_dirty_regions(self):
+        s = engine.Screen(10, 10)
+        t1 = base.Text("hello")
+        t2 = base.Text("world")
+        s.place(t1, 0, 0)
+        s.place(t2, 5, 0)
+        s.render()
+        self.assertEqual(s.buffer[0][4], "o\x1b[0m")
+        # Junk outside of the dirty regions is left untouched by a partial render.
+        s.buffer[9][9] = "X"
+        t1.text = "hi"
+        self.assertTrue(s.need_rendering)
+        s.render()
+        self.assertEqual(s.buffer[0][1], "i\x1b[0m")
+        self.assertNotIn("o", s.buffer[0][4])
+        self.assertEqual(s.buffer[5][0], "w\x1b[0m")
+        self.assertEqual(s.buffer[9][9], "X")
+        # An element rendered on a higher pass is rendered again over the dirty area.
+        sprite = Sprite(size=[4, 4], default_sprixel=Sprixel("#"))
+        s.place(sprite, 4, 0)
+        s.render()
+        # Same pass: the sprite is rendered after the text (placed lower on screen).
+        self.assertEqual(s.buffer[5][0].model, "#")
+        s.place(t2, 5, 0, 2)
+        s.render()
+        self.assertEqual(s.buffer[5][0], "w\x1b[0m")
+        self.assertEqual(s.buffer[5][4], "d\x1b[0m")
+        self.assertEqual(s.buffer[6][0].model, "#")
+        s.trigger_rendering(sprite)
+        s.render()
+        self.assertEqual(s.buffer[5][0], "w\x1b[0m")
+        self.assertEqual(s.buffer[9][9], "X")
+        s.delete(4, 0)
+        s.render()
+        self.assertEqual(s.buffer[6][0], " \x1b[0m")
+        self.assertEqual(s.buffer[5][1], "o\x1b[0m")
+        # Elements with an unknown footprint trigger a full render.
+        s.place(TB(), 8, 0)
+        s.render()
+        self.assertNotEqual(s.buffer[9][9], "X")
+        self.assertEqual(s.buffer[8][0], "T")
+
+    def test_screen_rendering_passes(self):
+        s = engine.Screen(10, 5)
+        s.place(base.Text("3"), 0, 0, 3)
+        s.place(base.Text("22"), 1, 0, 2)
+        s.place(base.Text("333"), 1, 1, 3)
+        s.place(base.Text("1111"), 2, 0)
+        s.place(base.Text("22"), 2, 1, 2)
+        s.render()
+        # Higher passes are rendered on top, whatever the order of placement.
+        self.assertEqual(s.buffer[0][0], "3\x1b[0m")
+        self.assertEqual(s.buffer[1][0], "2\x1b[0m")
+        self.assertEqual(s.buffer[1][1], "3\x1b[0m")
+        self.assertEqual(s.buffer[2][0], "1\x1b[0m")
+        self.assertEqual(s.buffer[2][1], "2\x1b[0m")
+        self.assertEqual(s.buffer[2][3], "1\x1b[0m")
+        s.delete(1, 0)
+        s.delete(1, 1)
+        s.force_render()
+        self.assertEqual(s.buffer[1][0], " \x1b[0m")
+        self.assertEqual(s.buffer[1][1], " \x1b[0m")
+        s.clear_buffers()
+        s.force_render()
+        self.assertEqual(s.buffer[2][0], " \x1b[0m")
+
+    def test_screen_color_depth(self):
+        s = engine.Screen(3, 1)
+        self.assertEqual(s.color_depth, constants.ColorDepth.TRUE_COLOR)
+        with self.assertRaises(base.PglInvalidTypeException):
+            s.color_depth = 256
+        s.buffer[0][0] = "\x1b[48;2;255;0;0m\x1b[38;2;250;250;250m#\x1b[0m"
+        s.buffer[0][1] = "\x1b[1m\x1b[38;5;21mb\x1b[0m"
+        s.buffer[0][2] = "\x1b[48;2;1;2m?\x1b[0m"
+        s.color_depth = constants.ColorDepth.COLORS_256
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            s.update()
+        self.assertIn("\x1b[48;5;196;38;5;231m#", out.getvalue())
+        self.assertIn("\x1b[1;38;5;21mb", out.getvalue())
+        self.assertIn("\x1b[48;2;1;2m?", out.getvalue())
+        s.color_depth = constants.ColorDepth.COLORS_16
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            s.update()
+        self.assertIn("\x1b[101;97m#", out.getvalue())
+        self.assertIn("\x1b[1;34mb", out.getvalue())
+        # The typed buffer decomposes the styled cells: they are quantized too.
+        s = engine.Screen(2, 1)
+        s.typed_buffer = True
+        s.render()
+        s.buffer[0][0] = "\x1b[1m\x1b[38;5;21mb\x1b[0m"
+        s.buffer[0][1] = "\x1b[4;38;5;196mc\x1b[0m"
+        s.color_depth = constants.ColorDepth.COLORS_16
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            s.update()
+        self.assertIn("\x1b[1;34mb", out.getvalue())
+        self.assertIn("\x1b[4;91mc", out.getvalue())
+        self.assertNotIn("38;", out.getvalue())
+
+    def test_screen_color_tables(self):
+        # The lookup tables give the same colors as a search of the whole palette.
+        palette = engine._XTERM_PALETTE
+        colors = list(palette) + [(v, v, v) for v in range(0, 256)]
+        colors += [(v, 255 - v, (v * 7) % 256) for v in range(0, 256)]
+        for rgb in colors:
+            self.assertEqual(
+                engine._nearest_color_256(rgb), engine._nearest_color(rgb, palette, 16)
+            )
+            self.assertEqual(
+                engine._nearest_color_16(rgb), engine._nearest_color(rgb, palette[:16])
+            )
+        self.assertEqual(engine._nearest_color_256((88, 88, 88)), 240)
+        # The cache of the system colors is bounded.
+        self.assertIsNotNone(engine._nearest_color_16.cache_info().maxsize)
+
+    def test_screen_threaded_update(self):
+        class BrokenStream(io.StringIO):
+            def write(self, data):
+                raise OSError("broken")
+
+        s = engine.Screen(6, 2)
+        s.flush()
+        self.assertFalse(s.threaded_update)
+        with self.assertRaises(base.PglInvalidTypeException):
+            s.threaded_update = 1
+        s.threaded_update = True
+        s.threaded_update = True
+        self.assertTrue(s._rendering_thread.is_alive())
+        s.place("A", 0, 0)
+        s.place("B", 1, 2)
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            buffer = s.buffer
+            s.update()
+            s.flush()
+        self.assertIn("A", out.getvalue())
+        self.assertIn("B", out.getvalue())
+        # The frame was split before the hand-off: the frame buffer is kept.
+        self.assertIs(s.buffer, buffer)
+        # The sprixels changed by the game while the output thread is busy do not
+        # leak into the frame that was handed off.
+        sprixel = Sprixel("C", fg_color=Color(0, 0, 255))
+        s.place(sprixel, 1, 4)
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            with s._Screen__presenter:
+                s.update()
+                sprixel.model = "D"
+            s.flush()
+        self.assertIn("C", out.getvalue())
+        self.assertNotIn("D", out.getvalue())
+        s.delta_update = True
+        self.assertIsNone(s._last_frame)
+        s.delta_update = False
+        # Incremental rendering keeps working on the swapped buffers.
+        reference = engine.Screen(6, 2)
+        reference.place("A", 0, 0)
+        reference.place("B", 1, 2)
+        reference.place(sprixel, 1, 4)
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            for i in range(0, 5):
+                s.place(str(i), 0, i)
+                reference.place(str(i), 0, i)
+                s.update()
+                reference.render()
+                self.assertEqual(s.buffer.tolist(), reference.buffer.tolist())
+            s.flush()
+        self.assertIn("4", out.getvalue())
+        # Errors of the output thread are raised in the main thread.
+        with contextlib.redirect_stdout(BrokenStream()):
+            s.update()
+            with self.assertRaises(OSError):
+                s.flush()
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            s.update()
+            s.threaded_update = False
+        self.assertIn("4", out.getvalue())
+        self.assertIsNone(s._rendering_thread)
+
+    def test_screen_typed_buffer(self):
+        def frames(typed):
+            s = engine.Screen(8, 3)
+            s.typed_buffer = typed
+            s.delta_update = True
+            s.place(TB(), 0, 0)
+            s.place(base.Text("Hi"), 2, 3)
+            s.place(Sprite(size=[2, 2]), 1, 5)
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                s.update()
+                s.buffer[1][0] = "X\x1b[0m"
+                s.update()
+                s.threaded_update = True
+                s.place("Y", 2, 0)
+                s.update()
+                s.threaded_update = False
+            return s, out.getvalue()
+
+        with self.assertRaises(base.PglInvalidTypeException):
+            engine.Screen(8, 3).typed_buffer = "yes"
+        s, out = frames(True)
+        self.assertTrue(s.typed_buffer)
+        self.assertIsInstance(s.buffer, FrameBuffer)
+        self.assertEqual(s.buffer[2][0].model, "Y")
+        self.assertEqual(out, frames(False)[1])
+        self.assertIn("\x1b[2;1HX", out)
+        self.assertTrue(out.endswith("\x1b[3;1HY"))
+        s.clear_frame_buffer()
+        self.assertIsInstance(s.buffer, FrameBuffer)
+        s.typed_buffer = False
+        self.assertFalse(
+            functions.pgl_isinstance(s.buffer, "pygamelib.gfx.FrameBuffer")
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,6 +3,8 @@ from pygamelib import base
 from pygamelib import board_items
 from pygamelib import constants
 from pygamelib.gfx import core
+import os
+import tempfile
 import unittest
 
 # Test cases for all classes in pygamelib.gfx.core except for Animation.
@@ -492,6 +494,142 @@ class TestBase(unittest.TestCase):
         self.assertEqual(obj.screen_row, 2)
         self.assertEqual(obj.screen_column, 4)
 
+    def test_projectile_system(self):
+        hits = []
+
+        def _hit(p, objects, params):
+            hits.append((p.name, [o.name for o in objects]))
+
+        b = engine.Board(size=[10, 10])
+        g = engine.Game(mode=constants.MODE_TBT)
+        g.player = constants.NO_PLAYER
+        g.add_board(1, b)
+        system = g.get_projectile_system(1)
+        self.assertIsInstance(system, engine.ProjectileSystem)
+        self.assertIs(g.get_projectile_system(1), system)
+        with self.assertRaises(base.PglInvalidTypeException):
+            g.get_projectile_system("1")
+        b.place_item(board_items.Wall(name="wall"), 2, 5)
+        b.place_item(
+            board_items.GenericStructure(
+                name="bush", overlappable=True, restorable=True
+            ),
+            6,
+            3,
+        )
+        bullet = board_items.Projectile(
+            name="bullet",
+            range=6,
+            hit_callback=_hit,
+            collision_exclusions=[board_items.Projectile],
+        )
+        g.add_projectile(1, bullet, 2, 1, batched=True)
+        ghost = board_items.Projectile(
+            name="ghost", direction=constants.LEFT, range=4, hit_callback=_hit
+        )
+        g.add_projectile(1, ghost, 6, 5, batched=True)
+        diagonal = board_items.Projectile(
+            name="diagonal", direction=base.Vector2D(1, 1), range=10, hit_callback=_hit
+        )
+        system.add(diagonal, 7, 7)
+        # Out of the board, ignored.
+        g.add_projectile(1, board_items.Projectile(), 2, 20, batched=True)
+        # Immediate hit.
+        g.add_projectile(
+            1, board_items.Projectile(name="point", hit_callback=_hit), 2, 5, True
+        )
+        self.assertEqual(hits, [("point", ["wall"])])
+        self.assertEqual(len(system), 3)
+        self.assertIn(bullet, system)
+        self.assertEqual(system.projectiles, [bullet, ghost, diagonal])
+        self.assertEqual(len(g._boards[1]["projectiles"]), 0)
+        with self.assertRaises(base.PglInvalidTypeException):
+            system.add(board_items.NPC(), 1, 1)
+        with self.assertRaises(base.PglInvalidTypeException):
+            system.add(board_items.Projectile(), 1, "1")
+        hits.clear()
+        g.actuate_projectiles(1)
+        self.assertEqual((bullet.row, bullet.column, bullet.range), (2, 2, 5))
+        self.assertEqual((ghost.row, ghost.column), (6, 4))
+        self.assertIs(b.item(8, 8), diagonal)
+        g.actuate_projectiles(1)
+        # The ghost goes over the bush.
+        self.assertEqual(ghost.pos, [6, 3, 1])
+        self.assertEqual(b.item(6, 3, 0).name, "bush")
+        self.assertEqual(diagonal.pos, [9, 9, 0])
+        g.actuate_projectiles(1)
+        self.assertEqual(b.item(6, 3).name, "bush")
+        g.actuate_projectiles(1)
+        # The bullet is blocked by the wall and the diagonal went out of range when
+        # it reached the edge of the board.
+        self.assertEqual(hits, [("bullet", ["wall"]), ("diagonal", ["void_cell"])])
+        self.assertEqual(bullet.actuator.state, constants.State.STOPPED)
+        self.assertEqual(bullet.pos, [2, 4, 0])
+        self.assertEqual((ghost.column, ghost.range), (1, 0))
+        hits.clear()
+        self.assertEqual(
+            [(p, [o.name for o in objects]) for p, objects in system.update()],
+            [(ghost, ["void_cell"])],
+        )
+        self.assertEqual(hits, [("ghost", ["void_cell"])])
+        self.assertEqual(len(system), 1)
+        # The projectiles that were hit are removed at the next update.
+        self.assertEqual(system.update(), [])
+        self.assertEqual(len(system), 0)
+        self.assertEqual(b.get_movables(), [])
+        self.assertIsInstance(b.item(2, 4), board_items.BoardItemVoid)
+        # Paused projectiles do not move, removed ones leave the board.
+        paused = board_items.Projectile(name="paused")
+        system.add(paused, 0, 0)
+        paused.actuator.pause()
+        system.update()
+        self.assertEqual(paused.pos, [0, 0, 0])
+        system.remove(paused)
+        system.remove(paused)
+        self.assertEqual(len(system), 0)
+        self.assertIsInstance(b.item(0, 0), board_items.BoardItemVoid)
+        # Area of effect and movement speed in real time.
+        g.mode = constants.MODE_RT
+        bomb = board_items.Projectile(
+            name="bomb",
+            range=2,
+            is_aoe=True,
+            aoe_radius=1,
+            hit_callback=_hit,
+            movement_speed=0.1,
+        )
+        system.add(bomb, 2, 2)
+        hits.clear()
+        system.update(0.05)
+        self.assertEqual(bomb.column, 2)
+        system.update(0.05)
+        self.assertEqual(bomb.column, 3)
+        system.update(0.1)
+        system.update(0.1)
+        self.assertEqual(hits, [("bomb", ["wall"])])
+
+    def test_streamed_board(self):
+        board = engine.Board(size=[200, 200], chunk_size=16)
+        board.place_item(board_items.NPC(), 150, 150)
+        with tempfile.TemporaryDirectory() as path:
+            board.save_streamed(path)
+            g = engine.Game()
+            g.object_library.append(board_items.Wall())
+            world = g.load_board(path, 1)
+            self.assertEqual(world.stream_path, path)
+            self.assertEqual(len(g._boards[1]["npcs"]), 0)
+            world.stream_area(150, 150, 1, 1)
+            self.assertEqual(len(g._boards[1]["npcs"]), 1)
+            world.evict_chunks()
+            world.stream_area(0, 0, 1, 1)
+            world.evict_chunks()
+            self.assertEqual(len(g._boards[1]["npcs"]), 0)
+            g.save_board(1, path)
+            self.assertTrue(os.path.exists(os.path.join(path, "chunks", "9_9.json")))
+            g.object_library = []
+            g.load_board(path, 2)
+            self.assertEqual(len(g.object_library), 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -39,6 +39,37 @@ class TestBase(unittest.TestCase):
         font = core.Font()
         self.assertIsNone(font.glyph("a"))
 
+    def test_glyphs_cache(self):
+        font = core.Font("8bits", glyphs_cache_size=2)
+        red = core.Color(255, 0, 0)
+        g = font.glyph("a", red)
+        self.assertIs(font.glyph("a", core.Color(255, 0, 0)), g)
+        # The cached glyph does not share the colors given in parameters.
+        red.g = 128
+        self.assertIsNot(font.glyph("a", red), g)
+        self.assertIs(font.glyph("a", core.Color(255, 0, 0)), g)
+        font.glyph("b", red)
+        info = font.glyphs_cache_info()
+        self.assertEqual(info["hits"], 2)
+        self.assertEqual(info["misses"], 3)
+        self.assertEqual(info["evictions"], 1)
+        self.assertEqual(info["size"], 2)
+        self.assertEqual(info["max_size"], 2)
+        self.assertEqual(info["sprixels"], 2 * g.size[0] * g.size[1])
+        # "a" in red was the most recently used glyph: it was kept.
+        self.assertIs(font.glyph("a", core.Color(255, 0, 0)), g)
+        font.clear_glyphs_cache()
+        self.assertEqual(font.glyphs_cache_info()["size"], 0)
+        self.assertEqual(font.glyphs_cache_info()["sprixels"], 0)
+        font = core.Font("8bits", glyphs_cache_max_sprixels=1)
+        font.glyph("a", red)
+        font.glyph("b", red)
+        self.assertEqual(font.glyphs_cache_info()["size"], 1)
+        with self.assertRaises(core.base.PglInvalidTypeException):
+            core.Font("8bits", glyphs_cache_size=0)
+        with self.assertRaises(core.base.PglInvalidTypeException):
+            core.Font("8bits", glyphs_cache_max_sprixels="1")
+
 
 if __name__ == "__main__":
     unittest.main()
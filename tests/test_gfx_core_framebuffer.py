@@ -0,0 +1,153 @@
+import pygamelib.gfx.core as gfx_core
+import pygamelib.base as base
+import numpy as np
+import unittest
+
+# Test cases for all classes in pygamelib.gfx.core.FrameBuffer.
+
+
+class TestBase(unittest.TestCase):
+    def test_framebuffer_create(self):
+        fb = gfx_core.FrameBuffer(4, 2)
+        self.assertEqual(fb.shape, (2, 4))
+        self.assertEqual(fb.width, 4)
+        self.assertEqual(fb.height, 2)
+        self.assertEqual(len(fb), 2)
+        self.assertEqual(fb.cells.dtype, gfx_core.FrameBuffer.CELL_DTYPE)
+        self.assertTrue((fb.cells["glyph"] == ord(" ")).all())
+        self.assertEqual(fb[1][3], gfx_core.Sprixel(" "))
+        with self.assertRaises(base.PglInvalidTypeException):
+            gfx_core.FrameBuffer("4", 2)
+
+    def test_framebuffer_encode(self):
+        fb = gfx_core.FrameBuffer(4, 2)
+        fb[0][1] = gfx_core.Sprixel(
+            "#", gfx_core.Color(1, 2, 3), gfx_core.Color(4, 5, 6)
+        )
+        self.assertEqual(fb.cells[0, 1]["glyph"], ord("#"))
+        self.assertEqual(fb.cells[0, 1]["bg"].tolist(), [1, 2, 3])
+        self.assertEqual(fb.cells[0, 1]["fg"].tolist(), [4, 5, 6])
+        self.assertEqual(fb.cells[0, 1]["width"], 1)
+        self.assertEqual(
+            fb[0][1],
+            gfx_core.Sprixel("#", gfx_core.Color(1, 2, 3), gfx_core.Color(4, 5, 6)),
+        )
+        self.assertEqual(fb[0, 1], fb[0][1])
+        # Pre-rendered strings are decomposed.
+        fb[1][0] = "\x1b[48;2;10;20;30m@\x1b[0m"
+        self.assertEqual(fb[1][0].bg_color, gfx_core.Color(10, 20, 30))
+        self.assertIsNone(fb[1][0].fg_color)
+        self.assertEqual(fb[1][0].model, "@")
+        # Multi-characters models are interned.
+        fb[1][1] = gfx_core.Sprixel("ab")
+        self.assertGreater(fb.cells[1, 1]["glyph"], 0x10FFFF)
+        self.assertEqual(fb[1][1].model, "ab")
+        # Strings that cannot be decomposed are stored as is.
+        fb[1][2] = "\x1b[6nB"
+        self.assertEqual(fb[1][2], "\x1b[6nB")
+        self.assertTrue(fb.cells[1, 2]["attrs"] & gfx_core._CELL_RAW)
+        fb[1][3] = 7
+        self.assertEqual(fb[1][3].model, "7")
+        self.assertEqual(len(fb[1]), 4)
+        self.assertEqual([s.model for s in fb[0][0:2]], [" ", "#"])
+        self.assertEqual(
+            gfx_core.FrameBuffer.glyph_text(gfx_core.FrameBuffer.glyph("xyz")), "xyz"
+        )
+
+    def test_framebuffer_blit_diff(self):
+        fb = gfx_core.FrameBuffer(5, 3)
+        cells = gfx_core.FrameBuffer.encode_array(
+            [[gfx_core.Sprixel("a"), gfx_core.Sprixel("b"), gfx_core.Sprixel("c")]]
+        )
+        previous = fb.copy()
+        fb.blit(cells, 1, 3)
+        self.assertEqual(fb[1][3].model, "a")
+        self.assertEqual(fb[1][4].model, "b")
+        fb.blit(cells, -1, 0)
+        self.assertEqual(fb[0][0].model, " ")
+        fb.blit(cells, 2, -1, np.array([[True, False, True]]))
+        self.assertEqual(fb[2][0].model, " ")
+        self.assertEqual(fb[2][1].model, "c")
+        changed = fb.diff(previous)
+        self.assertEqual(changed.tolist()[1], [False, False, False, True, True])
+        self.assertEqual(changed.any(axis=1).tolist(), [False, True, True])
+        self.assertFalse(fb.diff(fb.copy()).any())
+        with self.assertRaises(base.PglException):
+            fb.diff(gfx_core.FrameBuffer(2, 2))
+        # 2D slices are views.
+        view = fb[1:3, 1:3]
+        self.assertIsInstance(view, gfx_core.FrameBuffer)
+        view[0][0] = "z"
+        self.assertEqual(fb[1][1].model, "z")
+        view.fill("y")
+        self.assertEqual(fb[2][2].model, "y")
+        self.assertEqual(fb[2][3].model, " ")
+        fb[0, :] = gfx_core.Sprixel("-")
+        self.assertEqual([row[1].model for row in fb], ["-", "y", "y"])
+
+    def test_framebuffer_styles(self):
+        fb = gfx_core.FrameBuffer(4, 1)
+        # Styles and palette colors are decomposed too.
+        fb[0][0] = "\x1b[1;4m\x1b[38;5;21m\x1b[41mB\x1b[0m"
+        cell = fb.cells[0, 0]
+        self.assertFalse(cell["attrs"] & gfx_core._CELL_RAW)
+        self.assertTrue(cell["attrs"] & gfx_core._CELL_STYLES[1])
+        self.assertTrue(cell["attrs"] & gfx_core._CELL_STYLES[4])
+        self.assertEqual((cell["fg"][0], cell["bg"][0]), (21, 1))
+        self.assertEqual(fb.split_rows()[0][0], ("\x1b[1;4m\x1b[41m\x1b[38;5;21m", "B"))
+        # A style that is not set by a sprixel is returned as a string.
+        self.assertEqual(fb[0][0], "\x1b[1;4m\x1b[41m\x1b[38;5;21mB\x1b[0m")
+        fb[0][1] = "\x1b[1;22;3;23;92;39;104m\x1b[49m\x1b[38;2;1;2;3mC"
+        self.assertEqual(fb[0][1], gfx_core.Sprixel("C", None, gfx_core.Color(1, 2, 3)))
+        fb[0][2] = "\x1b[7m\x1b[0m\x1b[95;103mD"
+        self.assertEqual(fb.split_rows()[0][2], ("\x1b[103m\x1b[95m", "D"))
+        for raw in ("\x1b[38;5mE", "\x1b[53mE", "\x1b[38;9;1mE"):
+            fb[0][3] = raw
+            self.assertEqual(fb[0][3], raw)
+
+    def test_framebuffer_glyphs(self):
+        fb = gfx_core.FrameBuffer(2, 1)
+        fb[0][0] = gfx_core.Sprixel("kept")
+        for i in range(0, gfx_core._GLYPH_TABLE_SIZE * 3):
+            gfx_core.FrameBuffer.glyph(f"glyph{i}")
+        # The unused glyphs are dropped, the ones in a buffer are kept.
+        self.assertLessEqual(
+            gfx_core.FrameBuffer.interned_glyphs(), gfx_core._GLYPH_TABLE_SIZE * 2
+        )
+        self.assertEqual(fb[0][0].model, "kept")
+        self.assertEqual(
+            gfx_core.FrameBuffer.glyph_text(gfx_core.FrameBuffer.glyph("new")), "new"
+        )
+
+    def test_framebuffer_split(self):
+        fb = gfx_core.FrameBuffer(3, 2)
+        fb[0][0] = "\x1b[6nB"
+        fb[0][1] = gfx_core.Sprixel("ab")
+        rows = fb.split_rows()
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[0][0], ("", "\x1b[6nB"))
+        self.assertEqual(rows[0][1][1], "ab")
+        self.assertEqual(rows[1], fb.split_rows([1])[0])
+
+    def test_framebuffer_sprite(self):
+        sprite = gfx_core.Sprite(
+            size=[3, 2], default_sprixel=gfx_core.Sprixel("*", gfx_core.Color(1, 1, 1))
+        )
+        sprite.set_sprixel(0, 1, gfx_core.Sprixel())
+        fb = gfx_core.FrameBuffer(4, 3)
+        fb[0][1] = "x"
+        sprite.render_to_buffer(fb, 0, 0, 3, 4)
+        ref = np.array([[" " for c in range(0, 4)] for r in range(0, 3)], dtype=object)
+        ref[0][1] = "x"
+        sprite.render_to_buffer(ref, 0, 0, 3, 4)
+        for r in range(0, 3):
+            for c in range(0, 4):
+                expected = ref[r][c]
+                if not isinstance(expected, gfx_core.Sprixel):
+                    expected = gfx_core.Sprixel(expected)
+                self.assertEqual(fb[r][c], expected)
+        sprite.render_to_buffer(fb, 3, 4, 3, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,5 @@
 import pygamelib.gfx.core as gfx_core
+import numpy as np
 import unittest
 
 # Test cases for all classes in pygamelib.gfx.core except for Animation.
@@ -349,6 +350,49 @@ class TestBase(unittest.TestCase):
         self.assertEqual(sp.sprixel(0, 0).bg_color.g, 255)
         self.assertEqual(sp.sprixel(0, 0).bg_color.b, 204)
 
+    def test_opaque_spans(self):
+        sp = gfx_core.Sprite(size=[5, 2], default_sprixel=gfx_core.Sprixel("#"))
+        sp.set_sprixel(0, 2, gfx_core.Sprixel())
+        sp.set_sprixel(1, 3, gfx_core.Sprixel("日"))
+        self.assertEqual(
+            sp.opacity_mask.tolist(),
+            [[True, True, False, True, True], [True] * 5],
+        )
+        self.assertEqual(
+            sp.opaque_spans, [[(0, 2, True), (3, 5, True)], [(0, 5, False)]]
+        )
+        self.assertIs(sp.opaque_spans, sp.opaque_spans)
+        # The cache is invalidated when a sprixel is set.
+        sp.set_sprixel(0, 2, gfx_core.Sprixel("@"))
+        self.assertEqual(sp.opaque_spans[0], [(0, 5, True)])
+        sp.set_sprixel(0, 0, gfx_core.Sprixel())
+        buffer = np.full((3, 6), "-", dtype=object)
+        sp.render_to_buffer(buffer, 1, 1, 3, 6)
+        self.assertEqual(buffer[0].tolist(), ["-"] * 6)
+        self.assertEqual(buffer[1][1], "-")
+        self.assertEqual(buffer[1][2].model, "#")
+        self.assertEqual(buffer[2][4].model, "日")
+        self.assertEqual(buffer[2][5].model, "#")
+        # Offsets and clipping.
+        sp.row_offset = 1
+        sp.column_offset = 3
+        buffer = np.full((2, 2), "-", dtype=object)
+        sp.render_to_buffer(buffer, 0, 0, 2, 2)
+        self.assertEqual(buffer[0][0].model, "日")
+        self.assertEqual(buffer[0][1].model, "#")
+        sp.set_sprixel(1, 4, gfx_core.Sprixel())
+        sp.render_to_buffer(buffer, 0, 0, 2, 2)
+        self.assertEqual(buffer[0][1], gfx_core.Sprixel())
+        self.assertEqual(buffer[1].tolist(), ["-", "-"])
+        # The parts on the left of and above the buffer are clipped.
+        sp = gfx_core.Sprite(size=[4, 2], default_sprixel=gfx_core.Sprixel("#"))
+        sp.set_sprixel(1, 3, gfx_core.Sprixel("@"))
+        buffer = np.full((2, 3), "-", dtype=object)
+        sp.render_to_buffer(buffer, -1, -2, 2, 3)
+        self.assertEqual([s.model for s in buffer[0][:2]], ["#", "@"])
+        self.assertEqual(buffer[0][2], "-")
+        self.assertEqual(buffer[1].tolist(), ["-"] * 3)
+
 
 if __name__ == "__main__":
     unittest.main()
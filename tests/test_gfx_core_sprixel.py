@@ -156,6 +156,46 @@ class TestBase(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             s * s
 
+    def test_sprixel_palette(self):
+        palette = gfx_core.SprixelPalette()
+        self.assertIs(
+            gfx_core.SprixelPalette.instance(), gfx_core.SprixelPalette.instance()
+        )
+        bg = gfx_core.Color(1, 2, 3)
+        s1 = palette.sprixel("#", bg)
+        s2 = palette.sprixel("#", gfx_core.Color(1, 2, 3))
+        self.assertIs(s1, s2)
+        self.assertEqual(len(palette), 1)
+        self.assertIsInstance(s1, gfx_core.SharedSprixel)
+        self.assertFalse(s1.is_bg_transparent)
+        self.assertTrue(palette.sprixel("#").is_bg_transparent)
+        self.assertIsNot(palette.sprixel("#", bg, is_bg_transparent=True), s1)
+        # Colors are copied
+        bg.r = 100
+        self.assertEqual(s1.bg_color, gfx_core.Color(1, 2, 3))
+        self.assertEqual(
+            s1.__repr__(), gfx_core.Sprixel("#", bg_color=s1.bg_color).__repr__()
+        )
+        # Shared sprixels are immutable
+        with self.assertRaises(base.PglException):
+            s1.model = "@"
+        with self.assertRaises(base.PglException):
+            s1.fg_color = gfx_core.Color(0, 0, 0)
+        with self.assertRaises(base.PglException):
+            s1.is_bg_transparent = True
+        cp = s1.copy()
+        self.assertNotIsInstance(cp, gfx_core.SharedSprixel)
+        cp.model = "@"
+        self.assertEqual(s1.model, "#")
+        self.assertIs(palette.share(gfx_core.Sprixel("#", gfx_core.Color(1, 2, 3))), s1)
+        self.assertIs(palette.share(s1), s1)
+        with self.assertRaises(base.PglInvalidTypeException):
+            palette.share("#")
+        with self.assertRaises(base.PglInvalidTypeException):
+            palette.sprixel("#", "red")
+        palette.clear()
+        self.assertEqual(len(palette), 0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -60,6 +60,11 @@ class TestBase(unittest.TestCase):
         )
         self.game.screen.place(b, 0, 0)
         self.game.screen.update()
+        # A title wider than the box starts on the left of the screen.
+        narrow = ui.Box(3, 3, "a long title")
+        self.game.screen.place(narrow, 2, 0)
+        self.game.screen.update()
+        self.game.screen.delete(2, 0)
         b.config = ui.UiConfig.instance()
         self.assertIsInstance(b.config, ui.UiConfig)
         self.assertEqual(b.title, "test box")
@@ -47,6 +47,30 @@ class TestBase(unittest.TestCase):
         self.assertEqual(sprix.model, p.sprixel.model)
         self.assertEqual(sprix.bg_color, core.Color(10, 20, 30))
 
+    def test_particle_render_reuse(self):
+        p = particles.ColorParticle(
+            sprixel=particles.ParticleSprixel("*"),
+            start_color=core.Color(255, 0, 0),
+            stop_color=core.Color(0, 0, 255),
+            lifespan=4,
+        )
+        s = core.Sprixel(" ", core.Color(10, 20, 30))
+        sprix = p.render(s)
+        self.assertIsNot(sprix, p.sprixel)
+        self.assertIsInstance(sprix, particles.ParticleSprixel)
+        self.assertEqual(sprix.bg_color, core.Color(10, 20, 30))
+        # The rendered sprixel is updated in place, not allocated again.
+        p.update()
+        p.sprixel.model = "o"
+        self.assertIs(p.render(core.Sprixel(" ")), sprix)
+        self.assertEqual(sprix.model, "o")
+        self.assertIs(sprix.fg_color, p.sprixel.fg_color)
+        self.assertIsNone(sprix.bg_color)
+        # Changing the rendered sprixel does not change the live one.
+        sprix.model = "x"
+        self.assertEqual(p.sprixel.model, "o")
+        self.assertEqual(len(sprix._observers), 0)
+
     def test_partition_particle(self):
         p = particles.PartitionParticle(
             velocity=base.Vector2D(1.0, 0.0),